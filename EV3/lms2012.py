@@ -22,12 +22,12 @@
 
 from __future__ import print_function
 from ctypes import *
+import importlib
+import sys
 
-# Requires `enum34` package, *not* `enum` package
-#
-# apt-get install python-enum34
-# - or -
-# pip install enum34
+# Requires Python 3.7 or newer for the lazily imported enums (a module
+# __getattr__). Don't install the `enum34` or `enum` packages, they hide the
+# standard library's enum module.
 from enum import Enum
 
 class DataFormat(Enum):
@@ -93,7 +93,8 @@ class Subparam(Enum):
 
     @property
     def subcode_type(self):
-        return _subcode_enums[self]
+        from lms2012_subcodes import subcode_enums
+        return subcode_enums[self]
 
 class Op(Enum):
     # VM
@@ -648,1000 +649,6 @@ _op_code_params = {
     Op.TST:                  (Subparam.TST_SUBP,),
 }
 
-class UiReadSubcode(Enum):
-    GET_VBATT     = 1
-    GET_IBATT     = 2
-    GET_OS_VERS   = 3
-    GET_EVENT     = 4
-    GET_TBATT     = 5
-    GET_IINT      = 6
-    GET_IMOTOR    = 7
-    GET_STRING    = 8
-    GET_HW_VERS   = 9
-    GET_FW_VERS   = 10
-    GET_FW_BUILD  = 11
-    GET_OS_BUILD  = 12
-    GET_ADDRESS   = 13
-    GET_CODE      = 14
-    KEY           = 15
-    GET_SHUTDOWN  = 16
-    GET_WARNING   = 17
-    GET_LBATT     = 18
-    TEXTBOX_READ  = 21
-    GET_VERSION   = 26
-    GET_IP        = 27
-    GET_POWER     = 29
-    GET_SDCARD    = 30
-    GET_USBSTICK  = 31
-
-    @property
-    def params(self):
-        return _ui_read_subcode_params[self]
-
-_ui_read_subcode_params = {
-    UiReadSubcode.GET_VBATT:              (Param.PARF,),
-    UiReadSubcode.GET_IBATT:              (Param.PARF,),
-    UiReadSubcode.GET_OS_VERS:            (Param.PAR8,Param.PAR8),
-    UiReadSubcode.GET_EVENT:              (Param.PAR8,),
-    UiReadSubcode.GET_TBATT:              (Param.PARF,),
-    UiReadSubcode.GET_IINT:               (Param.PARF,),
-    UiReadSubcode.GET_IMOTOR:             (Param.PARF,),
-    UiReadSubcode.GET_STRING:             (Param.PAR8,Param.PAR8),
-    UiReadSubcode.KEY:                    (Param.PAR8,),
-    UiReadSubcode.GET_SHUTDOWN:           (Param.PAR8,),
-    UiReadSubcode.GET_WARNING:            (Param.PAR8,),
-    UiReadSubcode.GET_LBATT:              (Param.PAR8,),
-    UiReadSubcode.GET_ADDRESS:            (Param.PAR32,),
-    UiReadSubcode.GET_CODE:               (Param.PAR32,Param.PAR32,Param.PAR32,Param.PAR8),
-    UiReadSubcode.TEXTBOX_READ:           (Param.PAR8,Param.PAR32,Param.PAR8,Param.PAR8,Param.PAR16,Param.PAR8),
-    UiReadSubcode.GET_HW_VERS:            (Param.PAR8,Param.PAR8),
-    UiReadSubcode.GET_FW_VERS:            (Param.PAR8,Param.PAR8),
-    UiReadSubcode.GET_FW_BUILD:           (Param.PAR8,Param.PAR8),
-    UiReadSubcode.GET_OS_BUILD:           (Param.PAR8,Param.PAR8),
-    UiReadSubcode.GET_VERSION:            (Param.PAR8,Param.PAR8),
-    UiReadSubcode.GET_IP:                 (Param.PAR8,Param.PAR8),
-    UiReadSubcode.GET_POWER:              (Param.PARF,Param.PARF,Param.PARF,Param.PARF),
-    UiReadSubcode.GET_SDCARD:             (Param.PAR8,Param.PAR32,Param.PAR32),
-    UiReadSubcode.GET_USBSTICK:           (Param.PAR8,Param.PAR32,Param.PAR32),
-}
-
-class UiWriteSubcode(Enum):
-    WRITE_FLUSH   = 1
-    FLOATVALUE    = 2
-    STAMP         = 3
-    PUT_STRING    = 8
-    VALUE8        = 9
-    VALUE16       = 10
-    VALUE32       = 11
-    VALUEF        = 12
-    ADDRESS       = 13
-    CODE          = 14
-    DOWNLOAD_END  = 15
-    SCREEN_BLOCK  = 16
-    ALLOW_PULSE   = 17
-    SET_PULSE     = 18
-    TEXTBOX_APPEND = 21
-    SET_BUSY      = 22
-    SET_TESTPIN   = 24
-    INIT_RUN      = 25
-    UPDATE_RUN    = 26
-    LED           = 27
-    POWER         = 29
-    GRAPH_SAMPLE  = 30
-    TERMINAL      = 31
-
-    @property
-    def params(self):
-        return _ui_write_subcode_params[self]
-
-_ui_write_subcode_params = {
-    UiWriteSubcode.WRITE_FLUSH:            (),
-    UiWriteSubcode.FLOATVALUE:             (Param.PARF,Param.PAR8,Param.PAR8),
-    UiWriteSubcode.STAMP:                  (Param.PAR8,),
-    UiWriteSubcode.PUT_STRING:             (Param.PAR8,),
-    UiWriteSubcode.CODE:                   (Param.PAR8,Param.PAR32),
-    UiWriteSubcode.DOWNLOAD_END:           (),
-    UiWriteSubcode.SCREEN_BLOCK:           (Param.PAR8,),
-    UiWriteSubcode.ALLOW_PULSE:            (Param.PAR8,),
-    UiWriteSubcode.SET_PULSE:              (Param.PAR8,),
-    UiWriteSubcode.TEXTBOX_APPEND:         (Param.PAR8,Param.PAR32,Param.PAR8,Param.PAR8),
-    UiWriteSubcode.SET_BUSY:               (Param.PAR8,),
-    UiWriteSubcode.VALUE8:                 (Param.PAR8,),
-    UiWriteSubcode.VALUE16:                (Param.PAR16,),
-    UiWriteSubcode.VALUE32:                (Param.PAR32,),
-    UiWriteSubcode.VALUEF:                 (Param.PARF,),
-    UiWriteSubcode.ADDRESS:                (Param.PAR32,),
-    UiWriteSubcode.INIT_RUN:               (),
-    UiWriteSubcode.UPDATE_RUN:             (),
-    UiWriteSubcode.LED:                    (Param.PAR8,),
-    UiWriteSubcode.POWER:                  (Param.PAR8,),
-    UiWriteSubcode.TERMINAL:               (Param.PAR8,),
-    UiWriteSubcode.GRAPH_SAMPLE:           (),
-    UiWriteSubcode.SET_TESTPIN:            (Param.PAR8,),
-}
-
-class UiButtonSubcode(Enum):
-    SHORTPRESS      = 1
-    LONGPRESS       = 2
-    WAIT_FOR_PRESS  = 3
-    FLUSH           = 4
-    PRESS           = 5
-    RELEASE         = 6
-    GET_HORZ        = 7
-    GET_VERT        = 8
-    PRESSED         = 9
-    SET_BACK_BLOCK  = 10
-    GET_BACK_BLOCK  = 11
-    TESTSHORTPRESS  = 12
-    TESTLONGPRESS   = 13
-    GET_BUMBED      = 14
-    GET_CLICK       = 15
-
-    @property
-    def params(self):
-        return _ui_button_subcode_params[self]
-
-_ui_button_subcode_params = {
-    UiButtonSubcode.SHORTPRESS:             (Param.PAR8,Param.PAR8),
-    UiButtonSubcode.LONGPRESS:              (Param.PAR8,Param.PAR8),
-    UiButtonSubcode.FLUSH:                  (),
-    UiButtonSubcode.WAIT_FOR_PRESS:         (),
-    UiButtonSubcode.PRESS:                  (Param.PAR8,),
-    UiButtonSubcode.RELEASE:                (Param.PAR8,),
-    UiButtonSubcode.GET_HORZ:               (Param.PAR16,),
-    UiButtonSubcode.GET_VERT:               (Param.PAR16,),
-    UiButtonSubcode.PRESSED:                (Param.PAR8,Param.PAR8),
-    UiButtonSubcode.SET_BACK_BLOCK:         (Param.PAR8,),
-    UiButtonSubcode.GET_BACK_BLOCK:         (Param.PAR8,),
-    UiButtonSubcode.TESTSHORTPRESS:         (Param.PAR8,Param.PAR8),
-    UiButtonSubcode.TESTLONGPRESS:          (Param.PAR8,Param.PAR8),
-    UiButtonSubcode.GET_BUMBED:             (Param.PAR8,Param.PAR8),
-    UiButtonSubcode.GET_CLICK:              (Param.PAR8,),
-}
-
-class ComReadSubcode(Enum):
-    COMMAND       = 14
-
-    @property
-    def params(self):
-        return _com_read_subcode_params[self]
-
-_com_read_subcode_params = {
-    ComReadSubcode.COMMAND: (Param.PAR32,Param.PAR32,Param.PAR32,Param.PAR8),
-}
-
-class ComWriteSubcode(Enum):
-    REPLY         = 14
-
-    @property
-    def params(self):
-        return _com_write_subcode_params[self]
-
-_com_write_subcode_params = {
-    ComWriteSubcode.REPLY: (Param.PAR32,Param.PAR32,Param.PAR8),
-}
-
-class ComGetSubcode(Enum):
-    GET_ON_OFF    = 1
-    GET_VISIBLE   = 2
-    GET_RESULT    = 4
-    GET_PIN       = 5
-    SEARCH_ITEMS  = 8
-    SEARCH_ITEM   = 9
-    FAVOUR_ITEMS  = 10
-    FAVOUR_ITEM   = 11
-    GET_ID        = 12
-    GET_BRICKNAME = 13
-    GET_NETWORK   = 14
-    GET_PRESENT   = 15
-    GET_ENCRYPT   = 16
-    CONNEC_ITEMS  = 17
-    CONNEC_ITEM   = 18
-    GET_INCOMING  = 19
-    GET_MODE2     = 20
-
-    @property
-    def params(self):
-        return _com_get_subcode_params[self]
-
-_com_get_subcode_params = {
-    ComGetSubcode.GET_ON_OFF:             (Param.PAR8,Param.PAR8),
-    ComGetSubcode.GET_VISIBLE:            (Param.PAR8,Param.PAR8),
-    ComGetSubcode.GET_RESULT:             (Param.PAR8,Param.PAR8,Param.PAR8),
-    ComGetSubcode.GET_PIN:                (Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8),
-    ComGetSubcode.SEARCH_ITEMS:           (Param.PAR8,Param.PAR8),
-    ComGetSubcode.SEARCH_ITEM:            (Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8),
-    ComGetSubcode.FAVOUR_ITEMS:           (Param.PAR8,Param.PAR8),
-    ComGetSubcode.FAVOUR_ITEM:            (Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8),
-    ComGetSubcode.GET_ID:                 (Param.PAR8,Param.PAR8,Param.PAR8),
-    ComGetSubcode.GET_BRICKNAME:          (Param.PAR8,Param.PAR8),
-    ComGetSubcode.GET_NETWORK:            (Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8),
-    ComGetSubcode.GET_PRESENT:            (Param.PAR8,Param.PAR8),
-    ComGetSubcode.GET_ENCRYPT:            (Param.PAR8,Param.PAR8,Param.PAR8),
-    ComGetSubcode.CONNEC_ITEMS:           (Param.PAR8,Param.PAR8),
-    ComGetSubcode.CONNEC_ITEM:            (Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8),
-    ComGetSubcode.GET_INCOMING:           (Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8),
-    ComGetSubcode.GET_MODE2:              (Param.PAR8,Param.PAR8),
-}
-
-class ComSetSubcode(Enum):
-    SET_ON_OFF    = 1
-    SET_VISIBLE   = 2
-    SET_SEARCH    = 3
-    SET_PIN       = 5
-    SET_PASSKEY   = 6
-    SET_CONNECTION = 7
-    SET_BRICKNAME = 8
-    SET_MOVEUP    = 9
-    SET_MOVEDOWN  = 10
-    SET_ENCRYPT   = 11
-    SET_SSID      = 12
-    SET_MODE2     = 13
-
-    @property
-    def params(self):
-        return _com_set_subcode_params[self]
-
-_com_set_subcode_params = {
-    ComSetSubcode.SET_ON_OFF:             (Param.PAR8,Param.PAR8),
-    ComSetSubcode.SET_VISIBLE:            (Param.PAR8,Param.PAR8),
-    ComSetSubcode.SET_SEARCH:             (Param.PAR8,Param.PAR8),
-    ComSetSubcode.SET_PIN:                (Param.PAR8,Param.PAR8,Param.PAR8),
-    ComSetSubcode.SET_PASSKEY:            (Param.PAR8,Param.PAR8),
-    ComSetSubcode.SET_CONNECTION:         (Param.PAR8,Param.PAR8,Param.PAR8),
-    ComSetSubcode.SET_BRICKNAME:          (Param.PAR8,),
-    ComSetSubcode.SET_MOVEUP:             (Param.PAR8,Param.PAR8),
-    ComSetSubcode.SET_MOVEDOWN:           (Param.PAR8,Param.PAR8),
-    ComSetSubcode.SET_ENCRYPT:            (Param.PAR8,Param.PAR8,Param.PAR8),
-    ComSetSubcode.SET_SSID:               (Param.PAR8,Param.PAR8),
-    ComSetSubcode.SET_MODE2:              (Param.PAR8,Param.PAR8),
-}
-
-class InputDeviceSubcode(Enum):
-    INSERT_TYPE     = 1
-    GET_FORMAT      = 2
-    CAL_MINMAX      = 3
-    CAL_DEFAULT     = 4
-    GET_TYPEMODE    = 5
-    GET_SYMBOL      = 6
-    CAL_MIN         = 7
-    CAL_MAX         = 8
-    SETUP           = 9
-    CLR_ALL         = 10
-    GET_RAW         = 11
-    GET_CONNECTION  = 12
-    STOP_ALL        = 13
-    SET_TYPEMODE    = 14
-    READY_IIC       = 15
-    GET_NAME        = 21
-    GET_MODENAME    = 22
-    SET_RAW         = 23
-    GET_FIGURES     = 24
-    GET_CHANGES     = 25
-    CLR_CHANGES     = 26
-    READY_PCT       = 27
-    READY_RAW       = 28
-    READY_SI        = 29
-    GET_MINMAX      = 30
-    GET_BUMPS       = 31
-
-    @property
-    def params(self):
-        return _input_device_subcode_params[self]
-
-_input_device_subcode_params = {
-    InputDeviceSubcode.INSERT_TYPE:            (Param.PAR8,Param.PAR8,Param.PAR8),
-    InputDeviceSubcode.SET_TYPEMODE:           (Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8),
-    InputDeviceSubcode.GET_TYPEMODE:           (Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8),
-    InputDeviceSubcode.GET_CONNECTION:         (Param.PAR8,Param.PAR8,Param.PAR8),
-    InputDeviceSubcode.GET_NAME:               (Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8),
-    InputDeviceSubcode.GET_SYMBOL:             (Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8),
-    InputDeviceSubcode.GET_FORMAT:             (Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8),
-    InputDeviceSubcode.GET_RAW:                (Param.PAR8,Param.PAR8,Param.PAR32),
-    InputDeviceSubcode.GET_MODENAME:           (Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8),
-    InputDeviceSubcode.SET_RAW:                (Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR32),
-    InputDeviceSubcode.GET_FIGURES:            (Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8),
-    InputDeviceSubcode.GET_CHANGES:            (Param.PAR8,Param.PAR8,Param.PARF),
-    InputDeviceSubcode.CLR_CHANGES:            (Param.PAR8,Param.PAR8),
-    InputDeviceSubcode.READY_PCT:              (Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8,Param.PARNO),
-    InputDeviceSubcode.READY_RAW:              (Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8,Param.PARNO),
-    InputDeviceSubcode.READY_SI:               (Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8,Param.PARNO),
-    InputDeviceSubcode.GET_MINMAX:             (Param.PAR8,Param.PAR8,Param.PARF,Param.PARF),
-    InputDeviceSubcode.CAL_MINMAX:             (Param.PAR8,Param.PAR8,Param.PAR32,Param.PAR32),
-    InputDeviceSubcode.CAL_DEFAULT:            (Param.PAR8,Param.PAR8),
-    InputDeviceSubcode.CAL_MIN:                (Param.PAR8,Param.PAR8,Param.PAR32),
-    InputDeviceSubcode.CAL_MAX:                (Param.PAR8,Param.PAR8,Param.PAR32),
-    InputDeviceSubcode.GET_BUMPS:              (Param.PAR8,Param.PAR8,Param.PARF),
-    InputDeviceSubcode.SETUP:                  (Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR16,Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8),
-    InputDeviceSubcode.CLR_ALL:                (Param.PAR8,),
-    InputDeviceSubcode.STOP_ALL:               (Param.PAR8,),
-    InputDeviceSubcode.READY_IIC:              (Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8),
-}
-
-class ProgramInfoSubcode(Enum):
-    OBJ_STOP      = 0
-    OBJ_START     = 4
-    GET_STATUS    = 22
-    GET_SPEED     = 23
-    GET_PRGRESULT = 24
-    SET_INSTR     = 25
-
-    @property
-    def params(self):
-        return _program_info_params[self]
-
-_program_info_params = {
-    ProgramInfoSubcode.OBJ_STOP:      (Param.PAR16,Param.PAR16),
-    ProgramInfoSubcode.OBJ_START:     (Param.PAR16,Param.PAR16),
-    ProgramInfoSubcode.GET_STATUS:    (Param.PAR16,Param.PAR8),
-    ProgramInfoSubcode.GET_SPEED:     (Param.PAR16,Param.PAR32),
-    ProgramInfoSubcode.GET_PRGRESULT: (Param.PAR16,Param.PAR8),
-    ProgramInfoSubcode.SET_INSTR:     (Param.PAR16,),
-}
-
-class UiDrawSubcode(Enum):
-    UPDATE        = 0
-    CLEAN         = 1
-    PIXEL         = 2
-    LINE          = 3
-    CIRCLE        = 4
-    TEXT          = 5
-    ICON          = 6
-    PICTURE       = 7
-    VALUE         = 8
-    FILLRECT      = 9
-    RECT          = 10
-    NOTIFICATION  = 11
-    QUESTION      = 12
-    KEYBOARD      = 13
-    BROWSE        = 14
-    VERTBAR       = 15
-    INVERSERECT   = 16
-    SELECT_FONT   = 17
-    TOPLINE       = 18
-    FILLWINDOW    = 19
-    SCROLL        = 20
-    DOTLINE       = 21
-    VIEW_VALUE    = 22
-    VIEW_UNIT     = 23
-    FILLCIRCLE    = 24
-    STORE         = 25
-    RESTORE       = 26
-    ICON_QUESTION = 27
-    BMPFILE       = 28
-    POPUP         = 29
-    GRAPH_SETUP   = 30
-    GRAPH_DRAW    = 31
-    TEXTBOX       = 32
-
-    @property
-    def params(self):
-        return _ui_draw_subcode_params[self]
-
-_ui_draw_subcode_params = {
-    UiDrawSubcode.UPDATE:                 (),
-    UiDrawSubcode.CLEAN:                  (),
-    UiDrawSubcode.FILLRECT:               (Param.PAR8,Param.PAR16,Param.PAR16,Param.PAR16,Param.PAR16),
-    UiDrawSubcode.RECT:                   (Param.PAR8,Param.PAR16,Param.PAR16,Param.PAR16,Param.PAR16),
-    UiDrawSubcode.PIXEL:                  (Param.PAR8,Param.PAR16,Param.PAR16),
-    UiDrawSubcode.LINE:                   (Param.PAR8,Param.PAR16,Param.PAR16,Param.PAR16,Param.PAR16),
-    UiDrawSubcode.CIRCLE:                 (Param.PAR8,Param.PAR16,Param.PAR16,Param.PAR16),
-    UiDrawSubcode.TEXT:                   (Param.PAR8,Param.PAR16,Param.PAR16,Param.PAR8),
-    UiDrawSubcode.ICON:                   (Param.PAR8,Param.PAR16,Param.PAR16,Param.PAR8,Param.PAR8),
-    UiDrawSubcode.PICTURE:                (Param.PAR8,Param.PAR16,Param.PAR16,Param.PAR32),
-    UiDrawSubcode.VALUE:                  (Param.PAR8,Param.PAR16,Param.PAR16,Param.PARF,Param.PAR8,Param.PAR8),
-    UiDrawSubcode.NOTIFICATION:           (Param.PAR8,Param.PAR16,Param.PAR16,Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8),
-    UiDrawSubcode.QUESTION:               (Param.PAR8,Param.PAR16,Param.PAR16,Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8),
-    UiDrawSubcode.KEYBOARD:               (Param.PAR8,Param.PAR16,Param.PAR16,Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8),
-    UiDrawSubcode.BROWSE:                 (Param.PAR8,Param.PAR16,Param.PAR16,Param.PAR16,Param.PAR16,Param.PAR8,Param.PAR8,Param.PAR8),
-    UiDrawSubcode.VERTBAR:                (Param.PAR8,Param.PAR16,Param.PAR16,Param.PAR16,Param.PAR16,Param.PAR16,Param.PAR16,Param.PAR16),
-    UiDrawSubcode.INVERSERECT:            (Param.PAR16,Param.PAR16,Param.PAR16,Param.PAR16),
-    UiDrawSubcode.SELECT_FONT:            (Param.PAR8,),
-    UiDrawSubcode.TOPLINE:                (Param.PAR8,),
-    UiDrawSubcode.FILLWINDOW:             (Param.PAR8,Param.PAR16,Param.PAR16),
-    UiDrawSubcode.SCROLL:                 (Param.PAR16,),
-    UiDrawSubcode.DOTLINE:                (Param.PAR8,Param.PAR16,Param.PAR16,Param.PAR16,Param.PAR16,Param.PAR16,Param.PAR16),
-    UiDrawSubcode.VIEW_VALUE:             (Param.PAR8,Param.PAR16,Param.PAR16,Param.PARF,Param.PAR8,Param.PAR8),
-    UiDrawSubcode.VIEW_UNIT:              (Param.PAR8,Param.PAR16,Param.PAR16,Param.PARF,Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8),
-    UiDrawSubcode.FILLCIRCLE:             (Param.PAR8,Param.PAR16,Param.PAR16,Param.PAR16),
-    UiDrawSubcode.STORE:                  (Param.PAR8,),
-    UiDrawSubcode.RESTORE:                (Param.PAR8,),
-    UiDrawSubcode.ICON_QUESTION:          (Param.PAR8,Param.PAR16,Param.PAR16,Param.PAR8,Param.PAR32),
-    UiDrawSubcode.BMPFILE:                (Param.PAR8,Param.PAR16,Param.PAR16,Param.PAR8),
-    UiDrawSubcode.GRAPH_SETUP:            (Param.PAR16,Param.PAR16,Param.PAR16,Param.PAR16,Param.PAR8,Param.PAR16,Param.PAR16,Param.PAR16),
-    UiDrawSubcode.GRAPH_DRAW:             (Param.PAR8,Param.PARF,Param.PARF,Param.PARF,Param.PARF),
-    UiDrawSubcode.POPUP:                  (Param.PAR8,),
-    UiDrawSubcode.TEXTBOX:                (Param.PAR16,Param.PAR16,Param.PAR16,Param.PAR16,Param.PAR8,Param.PAR32,Param.PAR8,Param.PAR8),
-}
-
-class FileSubcode(Enum):
-    OPEN_APPEND         = 0
-    OPEN_READ           = 1
-    OPEN_WRITE          = 2
-    READ_VALUE          = 3
-    WRITE_VALUE         = 4
-    READ_TEXT           = 5
-    WRITE_TEXT          = 6
-    CLOSE               = 7
-    LOAD_IMAGE          = 8
-    GET_HANDLE          = 9
-    MAKE_FOLDER         = 10
-    GET_POOL            = 11
-    SET_LOG_SYNC_TIME   = 12
-    GET_FOLDERS         = 13
-    GET_LOG_SYNC_TIME   = 14
-    GET_SUBFOLDER_NAME  = 15
-    WRITE_LOG           = 16
-    CLOSE_LOG           = 17
-    GET_IMAGE           = 18
-    GET_ITEM            = 19
-    GET_CACHE_FILES     = 20
-    PUT_CACHE_FILE      = 21
-    GET_CACHE_FILE      = 22
-    DEL_CACHE_FILE      = 23
-    DEL_SUBFOLDER       = 24
-    GET_LOG_NAME        = 25
-
-    OPEN_LOG            = 27
-    READ_BYTES          = 28
-    WRITE_BYTES         = 29
-    REMOVE              = 30
-    MOVE                = 31
-
-    @property
-    def params(self):
-        return _file_subcode_params[self]
-
-_file_subcode_params = {
-    FileSubcode.OPEN_APPEND:            (Param.PAR8,Param.PAR16),
-    FileSubcode.OPEN_READ:              (Param.PAR8,Param.PAR16,Param.PAR32),
-    FileSubcode.OPEN_WRITE:             (Param.PAR8,Param.PAR16),
-    FileSubcode.READ_VALUE:             (Param.PAR16,Param.PAR8,Param.PARF),
-    FileSubcode.WRITE_VALUE:            (Param.PAR16,Param.PAR8,Param.PARF,Param.PAR8,Param.PAR8),
-    FileSubcode.READ_TEXT:              (Param.PAR16,Param.PAR8,Param.PAR16,Param.PAR8),
-    FileSubcode.WRITE_TEXT:             (Param.PAR16,Param.PAR8,Param.PAR8),
-    FileSubcode.CLOSE:                  (Param.PAR16,),
-    FileSubcode.LOAD_IMAGE:             (Param.PAR16,Param.PAR8,Param.PAR32,Param.PAR32),
-    FileSubcode.GET_HANDLE:             (Param.PAR8,Param.PAR16,Param.PAR8),
-    FileSubcode.MAKE_FOLDER:            (Param.PAR8,Param.PAR8),
-    FileSubcode.GET_LOG_NAME:           (Param.PAR8,Param.PAR8),
-    FileSubcode.GET_POOL:               (Param.PAR32,Param.PAR16,Param.PAR32),
-    FileSubcode.GET_FOLDERS:            (Param.PAR8,Param.PAR8),
-    FileSubcode.GET_SUBFOLDER_NAME:     (Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8),
-    FileSubcode.WRITE_LOG:              (Param.PAR16,Param.PAR32,Param.PAR8,Param.PARF),
-    FileSubcode.CLOSE_LOG:              (Param.PAR16,Param.PAR8),
-    FileSubcode.SET_LOG_SYNC_TIME:      (Param.PAR32,Param.PAR32),
-    FileSubcode.DEL_SUBFOLDER:          (Param.PAR8,Param.PAR8),
-    FileSubcode.GET_LOG_SYNC_TIME:      (Param.PAR32,Param.PAR32),
-    FileSubcode.GET_IMAGE:              (Param.PAR8,Param.PAR16,Param.PAR8,Param.PAR32),
-    FileSubcode.GET_ITEM:               (Param.PAR8,Param.PAR8,Param.PAR8),
-    FileSubcode.GET_CACHE_FILES:        (Param.PAR8,),
-    FileSubcode.GET_CACHE_FILE:         (Param.PAR8,Param.PAR8,Param.PAR8),
-    FileSubcode.PUT_CACHE_FILE:         (Param.PAR8,),
-    FileSubcode.DEL_CACHE_FILE:         (Param.PAR8,),
-    FileSubcode.OPEN_LOG:               (Param.PAR8,Param.PAR32,Param.PAR32,Param.PAR32,Param.PAR32,Param.PAR32,Param.PAR8,Param.PAR16),
-    FileSubcode.READ_BYTES:             (Param.PAR16,Param.PAR16,Param.PAR8),
-    FileSubcode.WRITE_BYTES:            (Param.PAR16,Param.PAR16,Param.PAR8),
-    FileSubcode.REMOVE:                 (Param.PAR8,),
-    FileSubcode.MOVE:                   (Param.PAR8,Param.PAR8),
-}
-
-class ArraySubcode(Enum):
-    DELETE              = 0
-    CREATE8             = 1
-    CREATE16            = 2
-    CREATE32            = 3
-    CREATEF             = 4
-    RESIZE              = 5
-    FILL                = 6
-    COPY                = 7
-    INIT8               = 8
-    INIT16              = 9
-    INIT32              = 10
-    INITF               = 11
-    SIZE                = 12
-    READ_CONTENT        = 13
-    WRITE_CONTENT       = 14
-    READ_SIZE           = 15
-    # File name subcodes
-    EXIST               = 16
-    TOTALSIZE           = 17
-    SPLIT               = 18
-    MERGE               = 19
-    CHECK               = 20
-    PACK                = 21
-    UNPACK              = 22
-    GET_FOLDERNAME      = 23
-
-    @property
-    def params(self):
-        return _array_subcode_params[self]
-
-_array_subcode_params = {
-    ArraySubcode.CREATE8:                (Param.PAR32,Param.PAR16),
-    ArraySubcode.CREATE16:               (Param.PAR32,Param.PAR16),
-    ArraySubcode.CREATE32:               (Param.PAR32,Param.PAR16),
-    ArraySubcode.CREATEF:                (Param.PAR32,Param.PAR16),
-    ArraySubcode.RESIZE:                 (Param.PAR16,Param.PAR32),
-    ArraySubcode.DELETE:                 (Param.PAR16,),
-    ArraySubcode.FILL:                   (Param.PAR16,Param.PARV),
-    ArraySubcode.COPY:                   (Param.PAR16,Param.PAR16),
-    ArraySubcode.INIT8:                  (Param.PAR16,Param.PAR32,Param.PAR32,Param.PARVALUES,Param.PAR8),
-    ArraySubcode.INIT16:                 (Param.PAR16,Param.PAR32,Param.PAR32,Param.PARVALUES,Param.PAR16),
-    ArraySubcode.INIT32:                 (Param.PAR16,Param.PAR32,Param.PAR32,Param.PARVALUES,Param.PAR32),
-    ArraySubcode.INITF:                  (Param.PAR16,Param.PAR32,Param.PAR32,Param.PARVALUES,Param.PARF),
-    ArraySubcode.SIZE:                   (Param.PAR16,Param.PAR32),
-    ArraySubcode.READ_CONTENT:           (Param.PAR16,Param.PAR16,Param.PAR32,Param.PAR32,Param.PAR8),
-    ArraySubcode.WRITE_CONTENT:          (Param.PAR16,Param.PAR16,Param.PAR32,Param.PAR32,Param.PAR8),
-    ArraySubcode.READ_SIZE:              (Param.PAR16,Param.PAR16,Param.PAR32),
-    # FileSubcode
-    ArraySubcode.EXIST:                  (Param.PAR8,Param.PAR8),
-    ArraySubcode.TOTALSIZE:              (Param.PAR8,Param.PAR32,Param.PAR32),
-    ArraySubcode.SPLIT:                  (Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8),
-    ArraySubcode.MERGE:                  (Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8),
-    ArraySubcode.CHECK:                  (Param.PAR8,Param.PAR8),
-    ArraySubcode.PACK:                   (Param.PAR8,),
-    ArraySubcode.UNPACK:                 (Param.PAR8,),
-    ArraySubcode.GET_FOLDERNAME:         (Param.PAR8,Param.PAR8),
-}
-
-class InfoSubcode(Enum):
-    SET_ERROR           = 1
-    GET_ERROR           = 2
-    ERRORTEXT           = 3
-
-    GET_VOLUME          = 4
-    SET_VOLUME          = 5
-    GET_MINUTES         = 6
-    SET_MINUTES         = 7
-    # Test subcodes
-    TST_OPEN                      = 10
-    TST_CLOSE                     = 11
-    TST_READ_PINS                 = 12
-    TST_WRITE_PINS                = 13
-    TST_READ_ADC                  = 14
-    TST_WRITE_UART                = 15
-    TST_READ_UART                 = 16
-    TST_ENABLE_UART               = 17
-    TST_DISABLE_UART              = 18
-    TST_ACCU_SWITCH               = 19
-    TST_BOOT_MODE2                = 20
-    TST_POLL_MODE2                = 21
-    TST_CLOSE_MODE2               = 22
-    TST_RAM_CHECK                 = 23
-
-    @property
-    def params(self):
-        return _info_subcode_params[self]
-
-_info_subcode_params = {
-    InfoSubcode.SET_ERROR:              (Param.PAR8,),
-    InfoSubcode.GET_ERROR:              (Param.PAR8,),
-    InfoSubcode.ERRORTEXT:              (Param.PAR8,Param.PAR8,Param.PAR8),
-    InfoSubcode.GET_VOLUME:             (Param.PAR8,),
-    InfoSubcode.SET_VOLUME:             (Param.PAR8,),
-    InfoSubcode.GET_MINUTES:            (Param.PAR8,),
-    InfoSubcode.SET_MINUTES:            (Param.PAR8,),
-    # TestSubcode
-    InfoSubcode.TST_OPEN:               (),
-    InfoSubcode.TST_CLOSE:              (),
-    InfoSubcode.TST_READ_PINS:          (Param.PAR8,Param.PAR8,Param.PAR8),
-    InfoSubcode.TST_WRITE_PINS:         (Param.PAR8,Param.PAR8,Param.PAR8),
-    InfoSubcode.TST_READ_ADC:           (Param.PAR8,Param.PAR16),
-    InfoSubcode.TST_WRITE_UART:         (Param.PAR8,Param.PAR8,Param.PAR8),
-    InfoSubcode.TST_READ_UART:          (Param.PAR8,Param.PAR8,Param.PAR8),
-    InfoSubcode.TST_ENABLE_UART:        (Param.PAR32,),
-    InfoSubcode.TST_DISABLE_UART:       (),
-    InfoSubcode.TST_ACCU_SWITCH:        (Param.PAR8,),
-    InfoSubcode.TST_BOOT_MODE2:         (),
-    InfoSubcode.TST_POLL_MODE2:         (Param.PAR8,),
-    InfoSubcode.TST_CLOSE_MODE2:        (),
-    InfoSubcode.TST_RAM_CHECK:          (Param.PAR8,),
-}
-
-class SoundSubcode(Enum):
-    BREAK               = 0
-    TONE                = 1
-    PLAY                = 2
-    REPEAT              = 3
-    SERVICE             = 4
-
-    @property
-    def params(self):
-        return _sound_subcode_params[self]
-
-_sound_subcode_params = {
-    SoundSubcode.BREAK:   (),
-    SoundSubcode.TONE:    (Param.PAR8,Param.PAR16,Param.PAR16),
-    SoundSubcode.PLAY:    (Param.PAR8,Param.PARS),
-    SoundSubcode.REPEAT:  (Param.PAR8,Param.PARS),
-    SoundSubcode.SERVICE: (),
-}
-
-class StringSubcode(Enum):
-    GET_SIZE            = 1
-    ADD                 = 2
-    COMPARE             = 3
-    DUPLICATE           = 5
-    VALUE_TO_STRING     = 6
-    STRING_TO_VALUE     = 7
-    STRIP               = 8
-    NUMBER_TO_STRING    = 9
-    SUB                 = 10
-    VALUE_FORMATTED     = 11
-    NUMBER_FORMATTED    = 12
-
-    @property
-    def params(self):
-        return _string_subcode_params[self]
-
-_string_subcode_params = {
-    StringSubcode.GET_SIZE:               (Param.PAR8,Param.PAR16),
-    StringSubcode.ADD:                    (Param.PAR8,Param.PAR8,Param.PAR8),
-    StringSubcode.COMPARE:                (Param.PAR8,Param.PAR8,Param.PAR8),
-    StringSubcode.DUPLICATE:              (Param.PAR8,Param.PAR8),
-    StringSubcode.VALUE_TO_STRING:        (Param.PARF,Param.PAR8,Param.PAR8,Param.PAR8),
-    StringSubcode.STRING_TO_VALUE:        (Param.PAR8,Param.PARF),
-    StringSubcode.STRIP:                  (Param.PAR8,Param.PAR8),
-    StringSubcode.NUMBER_TO_STRING:       (Param.PAR16,Param.PAR8,Param.PAR8),
-    StringSubcode.SUB:                    (Param.PAR8,Param.PAR8,Param.PAR8),
-    StringSubcode.VALUE_FORMATTED:        (Param.PARF,Param.PAR8,Param.PAR8,Param.PAR8),
-    StringSubcode.NUMBER_FORMATTED:       (Param.PAR32,Param.PAR8,Param.PAR8,Param.PAR8),
-}
-
-class DeviceType(Enum):
-    MODE_KEEP                     =  -1
-    TYPE_KEEP                     =   0
-
-    # Types defined in "typedata.rcf"
-    TYPE_NXT_TOUCH                =   1
-    TYPE_NXT_LIGHT                =   2
-    TYPE_NXT_SOUND                =   3
-    TYPE_NXT_COLOR                =   4
-    TYPE_NXT_ULTRASONIC           =   5
-    TYPE_NXT_TEMPERATURE          =   6
-    TYPE_TACHO                    =   7
-    TYPE_MINITACHO                =   8
-    TYPE_NEWTACHO                 =   9
-
-    TYPE_TOUCH                    =  16
-
-    # Types defined in known EV3/UART sensors
-    TYPE_COLOR                    =  29
-    TYPE_ULTRASONIC               =  30
-    TYPE_GYRO                     =  32
-    TYPE_IR                       =  33
-
-    # Type range reserved for third party devices
-    TYPE_THIRD_PARTY_START        =  50
-    TYPE_THIRD_PARTY_END          =  98
-    TYPE_ENERGYMETER              =  99
-    TYPE_IIC_UNKNOWN              = 100
-    TYPE_NXT_TEST                 = 101
-
-    TYPE_NXT_IIC                  = 123
-    TYPE_TERMINAL                 = 124
-    TYPE_UNKNOWN                  = 125
-    TYPE_NONE                     = 126
-    TYPE_ERROR                    = 127
-
-class Slot(Enum):
-    GUI_SLOT                      = 0
-    USER_SLOT                     = 1
-    CMD_SLOT                      = 2
-    TERM_SLOT                     = 3
-    DEBUG_SLOT                    = 4
-    # ONLY VALID IN opPROGRAM_STOP
-    CURRENT_SLOT                  = -1
-
-class ButtonType(Enum):
-    NO_BUTTON                     = 0
-    UP_BUTTON                     = 1
-    ENTER_BUTTON                  = 2
-    DOWN_BUTTON                   = 3
-    RIGHT_BUTTON                  = 4
-    LEFT_BUTTON                   = 5
-    BACK_BUTTON                   = 6
-    ANY_BUTTON                    = 7
-
-class MathSubcode(Enum):
-    EXP                           = 1
-    MOD                           = 2
-    FLOOR                         = 3
-    CEIL                          = 4
-    ROUND                         = 5
-    ABS                           = 6
-    NEGATE                        = 7
-    SQRT                          = 8
-    LOG                           = 9
-    LN                            = 10
-    SIN                           = 11
-    COS                           = 12
-    TAN                           = 13
-    ASIN                          = 14
-    ACOS                          = 15
-    ATAN                          = 16
-    MOD8                          = 17
-    MOD16                         = 18
-    MOD32                         = 19
-    POW                           = 20
-    TRUNC                         = 21
-
-    @property
-    def params(self):
-        return _math_subcode_params[self]
-
-_math_subcode_params = {
-    MathSubcode.EXP:                    (Param.PARF,Param.PARF),
-    MathSubcode.MOD:                    (Param.PARF,Param.PARF,Param.PARF),
-    MathSubcode.FLOOR:                  (Param.PARF,Param.PARF),
-    MathSubcode.CEIL:                   (Param.PARF,Param.PARF),
-    MathSubcode.ROUND:                  (Param.PARF,Param.PARF),
-    MathSubcode.ABS:                    (Param.PARF,Param.PARF),
-    MathSubcode.NEGATE:                 (Param.PARF,Param.PARF),
-    MathSubcode.SQRT:                   (Param.PARF,Param.PARF),
-    MathSubcode.LOG:                    (Param.PARF,Param.PARF),
-    MathSubcode.LN:                     (Param.PARF,Param.PARF),
-    MathSubcode.SIN:                    (Param.PARF,Param.PARF),
-    MathSubcode.COS:                    (Param.PARF,Param.PARF),
-    MathSubcode.TAN:                    (Param.PARF,Param.PARF),
-    MathSubcode.ASIN:                   (Param.PARF,Param.PARF),
-    MathSubcode.ACOS:                   (Param.PARF,Param.PARF),
-    MathSubcode.ATAN:                   (Param.PARF,Param.PARF),
-    MathSubcode.MOD8:                   (Param.PAR8,Param.PAR8,Param.PAR8),
-    MathSubcode.MOD16:                  (Param.PAR16,Param.PAR16,Param.PAR16),
-    MathSubcode.MOD32:                  (Param.PAR32,Param.PAR32,Param.PAR32),
-    MathSubcode.POW:                    (Param.PARF,Param.PARF,Param.PARF),
-    MathSubcode.TRUNC:                  (Param.PARF,Param.PAR8,Param.PARF),
-}
-
-class BrowserType(Enum):
-    BROWSE_FOLDERS                = 0
-    BROWSE_FOLDS_FILES            = 1
-    BROWSE_CACHE                  = 2
-    BROWSE_FILES                  = 3
-
-class FontType(Enum):
-    NORMAL_FONT                   = 0
-    SMALL_FONT                    = 1
-    LARGE_FONT                    = 2
-    TINY_FONT                     = 3
-
-class IconType(Enum):
-    NORMAL_ICON                   = 0
-    SMALL_ICON                    = 1
-    LARGE_ICON                    = 2
-    MENU_ICON                     = 3
-    ARROW_ICON                    = 4
-
-class StatusIcon(Enum):
-    SICON_CHARGING                = 0
-    SICON_BATT_4                  = 1
-    SICON_BATT_3                  = 2
-    SICON_BATT_2                  = 3
-    SICON_BATT_1                  = 4
-    SICON_BATT_0                  = 5
-    SICON_WAIT1                   = 6
-    SICON_WAIT2                   = 7
-    SICON_BT_ON                   = 8
-    SICON_BT_VISIBLE              = 9
-    SICON_BT_CONNECTED            = 10
-    SICON_BT_CONNVISIB            = 11
-    SICON_WIFI_3                  = 12
-    SICON_WIFI_2                  = 13
-    SICON_WIFI_1                  = 14
-    SICON_WIFI_CONNECTED          = 15
-
-    SICON_USB                     = 21
-
-class NIcon(Enum):
-    ICON_NONE                     = -1
-    ICON_RUN                      = 0
-    ICON_FOLDER                   = 1
-    ICON_FOLDER2                  = 2
-    ICON_USB                      = 3
-    ICON_SD                       = 4
-    ICON_SOUND                    = 5
-    ICON_IMAGE                    = 6
-    ICON_SETTINGS                 = 7
-    ICON_ONOFF                    = 8
-    ICON_SEARCH                   = 9
-    ICON_WIFI                     = 10
-    ICON_CONNECTIONS              = 11
-    ICON_ADD_HIDDEN               = 12
-    ICON_TRASHBIN                 = 13
-    ICON_VISIBILITY               = 14
-    ICON_KEY                      = 15
-    ICON_CONNECT                  = 16
-    ICON_DISCONNECT               = 17
-    ICON_UP                       = 18
-    ICON_DOWN                     = 19
-    ICON_WAIT1                    = 20
-    ICON_WAIT2                    = 21
-    ICON_BLUETOOTH                = 22
-    ICON_INFO                     = 23
-    ICON_TEXT                     = 24
-
-
-    ICON_QUESTIONMARK             = 27
-    ICON_INFO_FILE                = 28
-    ICON_DISC                     = 29
-    ICON_CONNECTED                = 30
-    ICON_OBP                      = 31
-    ICON_OBD                      = 32
-    ICON_OPENFOLDER               = 33
-    ICON_BRICK1                   = 34
-
-class LIcon(Enum):
-    YES_NOTSEL                    = 0
-    YES_SEL                       = 1
-    NO_NOTSEL                     = 2
-    NO_SEL                        = 3
-    OFF                           = 4
-    WAIT_VERT                     = 5
-    WAIT_HORZ                     = 6
-    TO_MANUAL                     = 7
-    WARNSIGN                      = 8
-    WARN_BATT                     = 9
-    WARN_POWER                    = 10
-    WARN_TEMP                     = 11
-    NO_USBSTICK                   = 12
-    TO_EXECUTE                    = 13
-    TO_BRICK                      = 14
-    TO_SDCARD                     = 15
-    TO_USBSTICK                   = 16
-    TO_BLUETOOTH                  = 17
-    TO_WIFI                       = 18
-    TO_TRASH                      = 19
-    TO_COPY                       = 20
-    TO_FILE                       = 21
-    CHAR_ERROR                    = 22
-    COPY_ERROR                    = 23
-    PROGRAM_ERROR                 = 24
-
-
-    WARN_MEMORY                   = 27
-
-class MIcon(Enum):
-    ICON_STAR                     = 0
-    ICON_LOCKSTAR                 = 1
-    ICON_LOCK                     = 2
-    ICON_PC                       = 3
-    ICON_PHONE                    = 4
-    ICON_BRICK                    = 5
-    ICON_UNKNOWN                  = 6
-    ICON_FROM_FOLDER              = 7
-    ICON_CHECKBOX                 = 8
-    ICON_CHECKED                  = 9
-    ICON_XED                      = 10
-
-class AIcon(Enum):
-    ICON_LEFT                     = 1
-    ICON_RIGHT                    = 2
-
-class BluetoothType(Enum):
-    BTTYPE_PC                     = 3
-    BTTYPE_PHONE                  = 4
-    BTTYPE_BRICK                  = 5
-    BTTYPE_UNKNOWN                = 6
-
-class LedPattern(Enum):
-    LED_BLACK                     = 0
-    LED_GREEN                     = 1
-    LED_RED                       = 2
-    LED_ORANGE                    = 3
-    LED_GREEN_FLASH               = 4
-    LED_RED_FLASH                 = 5
-    LED_ORANGE_FLASH              = 6
-    LED_GREEN_PULSE               = 7
-    LED_RED_PULSE                 = 8
-    LED_ORANGE_PULSE              = 9
-
-class LedType(Enum):
-    LED_ALL                       = 0
-    LED_RR                        = 1
-    LED_RG                        = 2
-    LED_LR                        = 3
-    LED_LG                        = 4
-
-class FileType(Enum):
-    FILETYPE_UNKNOWN              = 0x00
-    TYPE_FOLDER                   = 0x01
-    TYPE_SOUND                    = 0x02
-    TYPE_BYTECODE                 = 0x03
-    TYPE_GRAPHICS                 = 0x04
-    TYPE_DATALOG                  = 0x05
-    TYPE_PROGRAM                  = 0x06
-    TYPE_TEXT                     = 0x07
-    TYPE_SDCARD                   = 0x10
-    TYPE_USBSTICK                 = 0x20
-
-    TYPE_RESTART_BROWSER          = -1
-    TYPE_REFRESH_BROWSER          = -2
-
-class Result(Enum):
-    OK            = 0
-    BUSY          = 1
-    FAIL          = 2
-    STOP          = 4
-    START         = 8
-
-class Delimeter(Enum):
-    DEL_NONE      = 0
-    DEL_TAB       = 1
-    DEL_SPACE     = 2
-    DEL_RETURN    = 3
-    DEL_COLON     = 4
-    DEL_COMMA     = 5
-    DEL_LINEFEED  = 6
-    DEL_CRLF      = 7
-
-class HardwareTransportLayer(Enum):
-    HW_USB        = 1
-    HW_BT         = 2
-    HW_WIFI       = 3
-
-class EncryptionType(Enum):
-    ENCRYPT_NONE  = 0
-    ENCRYPT_WPA2  = 1
-
-class Color(Enum):
-    RED           = 0
-    GREEN         = 1
-    BLUE          = 2
-    BLANK         = 3
-
-class NxtColor(Enum):
-    BLACKCOLOR    = 1
-    BLUECOLOR     = 2
-    GREENCOLOR    = 3
-    YELLOWCOLOR   = 4
-    REDCOLOR      = 5
-    WHITECOLOR    = 6
-
-class Warning(Enum):
-    WARNING_TEMP      = 0x01
-    WARNING_CURRENT   = 0x02
-    WARNING_VOLTAGE   = 0x04
-    WARNING_MEMORY    = 0x08
-    WARNING_DSPSTAT   = 0x10
-    WARNING_RAM       = 0x20
-    WARNING_BATTLOW   = 0x40
-    WARNING_BUSY      = 0x80
-
-    WARNINGS          = 0x3F
-
-class ObjectStatus(Enum):
-    RUNNING = 0x0010
-    WAITING = 0x0020
-    STOPPED = 0x0040
-    HALTED  = 0x0080
-
-class DeviceCommand(Enum):
-    DEVCMD_RESET        = 0x11
-    DEVCMD_FIRE         = 0x11
-    DEVCMD_CHANNEL      = 0x12
-
-_subcode_enums = {
-    Subparam.PROGRAM_SUBP:      ProgramInfoSubcode,
-    Subparam.FILE_SUBP:         FileSubcode,
-    Subparam.ARRAY_SUBP:        ArraySubcode,
-    Subparam.FILENAME_SUBP:     ArraySubcode,
-    Subparam.VM_SUBP:           InfoSubcode,
-    Subparam.STRING_SUBP:       StringSubcode,
-    Subparam.UI_READ_SUBP:      UiReadSubcode,
-    Subparam.UI_WRITE_SUBP:     UiWriteSubcode,
-    Subparam.UI_DRAW_SUBP:      UiDrawSubcode,
-    Subparam.UI_BUTTON_SUBP:    UiButtonSubcode,
-    Subparam.COM_READ_SUBP:     ComReadSubcode,
-    Subparam.COM_WRITE_SUBP:    ComWriteSubcode,
-    Subparam.SOUND_SUBP:        SoundSubcode,
-    Subparam.INPUT_SUBP:        InputDeviceSubcode,
-    Subparam.MATH_SUBP:         MathSubcode,
-    Subparam.COM_GET_SUBP:      ComGetSubcode,
-    Subparam.COM_SET_SUBP:      ComSetSubcode,
-}
-
 class Callparam(Enum):
     IN_8      = 0x80 | DataFormat.DATA8.value
     IN_16     = 0x80 | DataFormat.DATA16.value
@@ -1663,6 +670,10 @@ class Callparam(Enum):
     def data_format(self):
         return DataFormat(self.value & 0x3F)
 
+    @property
+    def param(self):
+        return Param(0x08 + self.data_format.value)
+
 class ProgramHeader(LittleEndianStructure):
     _fields_ = [
         ("lego", c_char * 4),
@@ -1750,3 +761,81 @@ SYSTEM_COMMAND_REPLY    = 0x01
 SYSTEM_COMMAND_NO_REPLY = 0x81
 SYSTEM_REPLY            = 0x03
 SYSTEM_REPLY_ERROR      = 0x05
+
+# Names exported by `from lms2012 import *`. The lazily imported enums below
+# are left out, so the exports don't change once one of them has been used.
+__all__ = [
+    'DataFormat', 'Param', 'Subparam', 'Op', 'Callparam', 'ProgramHeader', 'ObjectHeader',
+    'LC0_MIN', 'LC0_MAX', 'DATA8_MIN', 'DATA8_MAX', 'DATA16_MIN', 'DATA16_MAX', 'DATA32_MIN',
+    'DATA32_MAX', 'DATAF_MIN', 'DATAF_MAX', 'DATA8_NAN', 'DATA16_NAN', 'DATA32_NAN',
+    'DATAF_NAN', 'Data8', 'Data16', 'Data32', 'DataFloat', 'PRIMPAR_SHORT', 'PRIMPAR_LONG',
+    'PRIMPAR_CONST', 'PRIMPAR_VARIABLE', 'PRIMPAR_LOCAL', 'PRIMPAR_GLOBAL', 'PRIMPAR_HANDLE',
+    'PRIMPAR_ADDR', 'PRIMPAR_INDEX', 'PRIMPAR_CONST_SIGN', 'PRIMPAR_VALUE', 'PRIMPAR_BYTES',
+    'PRIMPAR_STRING_OLD', 'PRIMPAR_1_BYTE', 'PRIMPAR_2_BYTES', 'PRIMPAR_4_BYTES',
+    'PRIMPAR_STRING', 'PRIMPAR_LABEL', 'DIRECT_COMMAND_REPLY', 'DIRECT_COMMAND_NO_REPLY',
+    'DIRECT_REPLY', 'DIRECT_REPLY_ERROR', 'SYSTEM_COMMAND_REPLY', 'SYSTEM_COMMAND_NO_REPLY',
+    'SYSTEM_REPLY', 'SYSTEM_REPLY_ERROR', 'IMPORT_TIME_BUDGET', 'measure_import_time',
+]
+
+# Enums that the disassembler doesn't need live in separate modules that are
+# only imported when one of them is first used, e.g. `lms2012.Color`.
+_lazy_modules = {}
+for _name in ('UiReadSubcode', 'UiWriteSubcode', 'UiButtonSubcode', 'ComReadSubcode',
+              'ComWriteSubcode', 'ComGetSubcode', 'ComSetSubcode', 'InputDeviceSubcode',
+              'ProgramInfoSubcode', 'UiDrawSubcode', 'FileSubcode', 'ArraySubcode',
+              'InfoSubcode', 'SoundSubcode', 'StringSubcode', 'MathSubcode'):
+    _lazy_modules[_name] = 'lms2012_subcodes'
+for _name in ('DeviceType', 'Slot', 'ButtonType', 'BrowserType', 'FontType', 'IconType',
+              'StatusIcon', 'NIcon', 'LIcon', 'MIcon', 'AIcon', 'BluetoothType', 'LedPattern',
+              'LedType', 'FileType', 'Result', 'Delimeter', 'HardwareTransportLayer',
+              'EncryptionType', 'Color', 'NxtColor', 'Warning', 'ObjectStatus', 'DeviceCommand'):
+    _lazy_modules[_name] = 'lms2012_catalogs'
+del _name
+
+def __getattr__(name):
+    module_name = _lazy_modules.get(name)
+    if module_name is None:
+        raise AttributeError("module {0!r} has no attribute {1!r}".format(__name__, name))
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_modules))
+
+# Import time budgets in milliseconds of this module and of the disassembler
+# that is built on it. Short-lived tools import them on every run, so keep an
+# eye on them with `python lms2012.py`.
+IMPORT_TIME_BUDGET = {
+    'lms2012': 40,
+    'lmsdisasm': 40,
+}
+
+def measure_import_time(module='lms2012', runs=7):
+    # Returns the best cumulative import time of module, in milliseconds,
+    # measured in fresh interpreters.
+    import os
+    import subprocess
+    best = None
+    for i in range(runs):
+        output = subprocess.check_output([sys.executable, '-X', 'importtime', '-c',
+                                          'import ' + module],
+                                         stderr=subprocess.STDOUT,
+                                         cwd=os.path.dirname(os.path.abspath(__file__)))
+        for line in output.decode().splitlines():
+            fields = line.split('|')
+            if len(fields) == 3 and fields[2].strip() == module:
+                value = int(fields[1]) / 1000.0
+                if best is None or value < best:
+                    best = value
+    return best
+
+if __name__ == '__main__':
+    over_budget = False
+    for module, budget in sorted(IMPORT_TIME_BUDGET.items()):
+        import_time = measure_import_time(module)
+        print("{0} import time: {1:.1f} ms (budget: {2} ms)".format(module, import_time, budget))
+        if import_time > budget:
+            over_budget = True
+    if over_budget:
+        sys.exit(1)
@@ -0,0 +1,308 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2015 David Lechner <david@lechnology.com>
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Enums for values used by lms2012 programs that the disassembler does not
+# need. These are imported on first use by lms2012.py.
+
+from enum import Enum
+
+class DeviceType(Enum):
+    MODE_KEEP                     =  -1
+    TYPE_KEEP                     =   0
+
+    # Types defined in "typedata.rcf"
+    TYPE_NXT_TOUCH                =   1
+    TYPE_NXT_LIGHT                =   2
+    TYPE_NXT_SOUND                =   3
+    TYPE_NXT_COLOR                =   4
+    TYPE_NXT_ULTRASONIC           =   5
+    TYPE_NXT_TEMPERATURE          =   6
+    TYPE_TACHO                    =   7
+    TYPE_MINITACHO                =   8
+    TYPE_NEWTACHO                 =   9
+
+    TYPE_TOUCH                    =  16
+
+    # Types defined in known EV3/UART sensors
+    TYPE_COLOR                    =  29
+    TYPE_ULTRASONIC               =  30
+    TYPE_GYRO                     =  32
+    TYPE_IR                       =  33
+
+    # Type range reserved for third party devices
+    TYPE_THIRD_PARTY_START        =  50
+    TYPE_THIRD_PARTY_END          =  98
+    TYPE_ENERGYMETER              =  99
+    TYPE_IIC_UNKNOWN              = 100
+    TYPE_NXT_TEST                 = 101
+
+    TYPE_NXT_IIC                  = 123
+    TYPE_TERMINAL                 = 124
+    TYPE_UNKNOWN                  = 125
+    TYPE_NONE                     = 126
+    TYPE_ERROR                    = 127
+
+class Slot(Enum):
+    GUI_SLOT                      = 0
+    USER_SLOT                     = 1
+    CMD_SLOT                      = 2
+    TERM_SLOT                     = 3
+    DEBUG_SLOT                    = 4
+    # ONLY VALID IN opPROGRAM_STOP
+    CURRENT_SLOT                  = -1
+
+class ButtonType(Enum):
+    NO_BUTTON                     = 0
+    UP_BUTTON                     = 1
+    ENTER_BUTTON                  = 2
+    DOWN_BUTTON                   = 3
+    RIGHT_BUTTON                  = 4
+    LEFT_BUTTON                   = 5
+    BACK_BUTTON                   = 6
+    ANY_BUTTON                    = 7
+
+class BrowserType(Enum):
+    BROWSE_FOLDERS                = 0
+    BROWSE_FOLDS_FILES            = 1
+    BROWSE_CACHE                  = 2
+    BROWSE_FILES                  = 3
+
+class FontType(Enum):
+    NORMAL_FONT                   = 0
+    SMALL_FONT                    = 1
+    LARGE_FONT                    = 2
+    TINY_FONT                     = 3
+
+class IconType(Enum):
+    NORMAL_ICON                   = 0
+    SMALL_ICON                    = 1
+    LARGE_ICON                    = 2
+    MENU_ICON                     = 3
+    ARROW_ICON                    = 4
+
+class StatusIcon(Enum):
+    SICON_CHARGING                = 0
+    SICON_BATT_4                  = 1
+    SICON_BATT_3                  = 2
+    SICON_BATT_2                  = 3
+    SICON_BATT_1                  = 4
+    SICON_BATT_0                  = 5
+    SICON_WAIT1                   = 6
+    SICON_WAIT2                   = 7
+    SICON_BT_ON                   = 8
+    SICON_BT_VISIBLE              = 9
+    SICON_BT_CONNECTED            = 10
+    SICON_BT_CONNVISIB            = 11
+    SICON_WIFI_3                  = 12
+    SICON_WIFI_2                  = 13
+    SICON_WIFI_1                  = 14
+    SICON_WIFI_CONNECTED          = 15
+
+    SICON_USB                     = 21
+
+class NIcon(Enum):
+    ICON_NONE                     = -1
+    ICON_RUN                      = 0
+    ICON_FOLDER                   = 1
+    ICON_FOLDER2                  = 2
+    ICON_USB                      = 3
+    ICON_SD                       = 4
+    ICON_SOUND                    = 5
+    ICON_IMAGE                    = 6
+    ICON_SETTINGS                 = 7
+    ICON_ONOFF                    = 8
+    ICON_SEARCH                   = 9
+    ICON_WIFI                     = 10
+    ICON_CONNECTIONS              = 11
+    ICON_ADD_HIDDEN               = 12
+    ICON_TRASHBIN                 = 13
+    ICON_VISIBILITY               = 14
+    ICON_KEY                      = 15
+    ICON_CONNECT                  = 16
+    ICON_DISCONNECT               = 17
+    ICON_UP                       = 18
+    ICON_DOWN                     = 19
+    ICON_WAIT1                    = 20
+    ICON_WAIT2                    = 21
+    ICON_BLUETOOTH                = 22
+    ICON_INFO                     = 23
+    ICON_TEXT                     = 24
+
+
+    ICON_QUESTIONMARK             = 27
+    ICON_INFO_FILE                = 28
+    ICON_DISC                     = 29
+    ICON_CONNECTED                = 30
+    ICON_OBP                      = 31
+    ICON_OBD                      = 32
+    ICON_OPENFOLDER               = 33
+    ICON_BRICK1                   = 34
+
+class LIcon(Enum):
+    YES_NOTSEL                    = 0
+    YES_SEL                       = 1
+    NO_NOTSEL                     = 2
+    NO_SEL                        = 3
+    OFF                           = 4
+    WAIT_VERT                     = 5
+    WAIT_HORZ                     = 6
+    TO_MANUAL                     = 7
+    WARNSIGN                      = 8
+    WARN_BATT                     = 9
+    WARN_POWER                    = 10
+    WARN_TEMP                     = 11
+    NO_USBSTICK                   = 12
+    TO_EXECUTE                    = 13
+    TO_BRICK                      = 14
+    TO_SDCARD                     = 15
+    TO_USBSTICK                   = 16
+    TO_BLUETOOTH                  = 17
+    TO_WIFI                       = 18
+    TO_TRASH                      = 19
+    TO_COPY                       = 20
+    TO_FILE                       = 21
+    CHAR_ERROR                    = 22
+    COPY_ERROR                    = 23
+    PROGRAM_ERROR                 = 24
+
+
+    WARN_MEMORY                   = 27
+
+class MIcon(Enum):
+    ICON_STAR                     = 0
+    ICON_LOCKSTAR                 = 1
+    ICON_LOCK                     = 2
+    ICON_PC                       = 3
+    ICON_PHONE                    = 4
+    ICON_BRICK                    = 5
+    ICON_UNKNOWN                  = 6
+    ICON_FROM_FOLDER              = 7
+    ICON_CHECKBOX                 = 8
+    ICON_CHECKED                  = 9
+    ICON_XED                      = 10
+
+class AIcon(Enum):
+    ICON_LEFT                     = 1
+    ICON_RIGHT                    = 2
+
+class BluetoothType(Enum):
+    BTTYPE_PC                     = 3
+    BTTYPE_PHONE                  = 4
+    BTTYPE_BRICK                  = 5
+    BTTYPE_UNKNOWN                = 6
+
+class LedPattern(Enum):
+    LED_BLACK                     = 0
+    LED_GREEN                     = 1
+    LED_RED                       = 2
+    LED_ORANGE                    = 3
+    LED_GREEN_FLASH               = 4
+    LED_RED_FLASH                 = 5
+    LED_ORANGE_FLASH              = 6
+    LED_GREEN_PULSE               = 7
+    LED_RED_PULSE                 = 8
+    LED_ORANGE_PULSE              = 9
+
+class LedType(Enum):
+    LED_ALL                       = 0
+    LED_RR                        = 1
+    LED_RG                        = 2
+    LED_LR                        = 3
+    LED_LG                        = 4
+
+class FileType(Enum):
+    FILETYPE_UNKNOWN              = 0x00
+    TYPE_FOLDER                   = 0x01
+    TYPE_SOUND                    = 0x02
+    TYPE_BYTECODE                 = 0x03
+    TYPE_GRAPHICS                 = 0x04
+    TYPE_DATALOG                  = 0x05
+    TYPE_PROGRAM                  = 0x06
+    TYPE_TEXT                     = 0x07
+    TYPE_SDCARD                   = 0x10
+    TYPE_USBSTICK                 = 0x20
+
+    TYPE_RESTART_BROWSER          = -1
+    TYPE_REFRESH_BROWSER          = -2
+
+class Result(Enum):
+    OK            = 0
+    BUSY          = 1
+    FAIL          = 2
+    STOP          = 4
+    START         = 8
+
+class Delimeter(Enum):
+    DEL_NONE      = 0
+    DEL_TAB       = 1
+    DEL_SPACE     = 2
+    DEL_RETURN    = 3
+    DEL_COLON     = 4
+    DEL_COMMA     = 5
+    DEL_LINEFEED  = 6
+    DEL_CRLF      = 7
+
+class HardwareTransportLayer(Enum):
+    HW_USB        = 1
+    HW_BT         = 2
+    HW_WIFI       = 3
+
+class EncryptionType(Enum):
+    ENCRYPT_NONE  = 0
+    ENCRYPT_WPA2  = 1
+
+class Color(Enum):
+    RED           = 0
+    GREEN         = 1
+    BLUE          = 2
+    BLANK         = 3
+
+class NxtColor(Enum):
+    BLACKCOLOR    = 1
+    BLUECOLOR     = 2
+    GREENCOLOR    = 3
+    YELLOWCOLOR   = 4
+    REDCOLOR      = 5
+    WHITECOLOR    = 6
+
+class Warning(Enum):
+    WARNING_TEMP      = 0x01
+    WARNING_CURRENT   = 0x02
+    WARNING_VOLTAGE   = 0x04
+    WARNING_MEMORY    = 0x08
+    WARNING_DSPSTAT   = 0x10
+    WARNING_RAM       = 0x20
+    WARNING_BATTLOW   = 0x40
+    WARNING_BUSY      = 0x80
+
+    WARNINGS          = 0x3F
+
+class ObjectStatus(Enum):
+    RUNNING = 0x0010
+    WAITING = 0x0020
+    STOPPED = 0x0040
+    HALTED  = 0x0080
+
+class DeviceCommand(Enum):
+    DEVCMD_RESET        = 0x11
+    DEVCMD_FIRE         = 0x11
+    DEVCMD_CHANNEL      = 0x12
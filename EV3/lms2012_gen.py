@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+
+# The MIT License (MIT)
+
+# Copyright (c) 2026 lms-hacker-tools contributors
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Generates lms2012_tables.py, the plain lookup tables used by the
+# disassembler, from the enum definitions in lms2012.py. Run it after
+# changing lms2012.py:
+#
+#     python lms2012_gen.py          # rewrite lms2012_tables.py
+#     python lms2012_gen.py --check  # fail if lms2012_tables.py is out of date
+
+from __future__ import print_function
+import argparse
+import io
+import os
+import sys
+
+from lms2012 import *
+from lms2012_subcodes import subcode_enums
+
+OUTPUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'lms2012_tables.py')
+
+# Subparams are encoded as SUBPARAM_BASE + Subparam value so that all
+# parameter types of the tables fit in one int.
+SUBPARAM_BASE = 0x100
+
+# Classification of the first byte of an encoded parameter
+PRIMPAR_KIND_CONST    = 0
+PRIMPAR_KIND_VARIABLE = 1
+PRIMPAR_KIND_LABEL    = 2
+PRIMPAR_KIND_STRING   = 3
+PRIMPAR_KIND_ADDR     = 4
+PRIMPAR_KIND_INVALID  = 5
+
+_primpar_kind_names = {
+    PRIMPAR_KIND_CONST: 'PRIMPAR_KIND_CONST',
+    PRIMPAR_KIND_VARIABLE: 'PRIMPAR_KIND_VARIABLE',
+    PRIMPAR_KIND_LABEL: 'PRIMPAR_KIND_LABEL',
+    PRIMPAR_KIND_STRING: 'PRIMPAR_KIND_STRING',
+    PRIMPAR_KIND_ADDR: 'PRIMPAR_KIND_ADDR',
+    PRIMPAR_KIND_INVALID: 'PRIMPAR_KIND_INVALID',
+}
+
+HEADER = '''\
+# This file is generated by lms2012_gen.py from the definitions in lms2012.py.
+# Do not edit it, change lms2012.py and run `python lms2012_gen.py` instead.
+#
+# All tables are tuples indexed by byte value (None for unused values) and
+# parameter types are plain ints, so decoding never has to look up an enum
+# member by value.
+
+from collections import namedtuple
+
+OpInfo = namedtuple('OpInfo', ['name', 'params', 'is_call', 'is_jump', 'is_varargs'])
+SubcodeInfo = namedtuple('SubcodeInfo', ['name', 'params'])
+CallparamInfo = namedtuple('CallparamInfo', ['name', 'param', 'size'])
+# `value` is the constant or variable index for short encodings, `width` is
+# the number of bytes that follow for long encodings.
+PrimparInfo = namedtuple('PrimparInfo', ['kind', 'value', 'width', 'is_global', 'is_handle'])
+'''
+
+def param_name(param):
+    return param.name
+
+def param_value(param):
+    if isinstance(param, Subparam):
+        return SUBPARAM_BASE + param.value
+    return param.value
+
+def format_params(params):
+    if len(params) == 1:
+        return '({0},)'.format(param_name(params[0]))
+    return '({0})'.format(', '.join(param_name(p) for p in params))
+
+def make_op_table():
+    table = [None] * 256
+    for op in Op:
+        params = op.params
+        table[op.value] = "OpInfo('{0}', {1}, {2}, {3}, {4})".format(
+            op.name, format_params(params), op is Op.CALL, op.name.startswith('JR'),
+            Param.PARNO in params)
+    return table
+
+def make_subcode_tables():
+    tables = [None] * (max(s.value for s in Subparam) + 1)
+    for subparam, enum in subcode_enums.items():
+        table = [None] * (max(s.value for s in enum) + 1)
+        for subcode in enum:
+            table[subcode.value] = "SubcodeInfo('{0}', {1})".format(subcode.name,
+                                                                  format_params(subcode.params))
+        tables[subparam.value] = (subparam.name, table)
+    return tables
+
+def make_callparam_table():
+    table = [None] * 256
+    for param in Callparam:
+        table[param.value] = "CallparamInfo('{0}', {1}, {2})".format(
+            param.name, param.param.name, param.data_format.size)
+    return table
+
+def make_primpar_table():
+    # Returns the (kind, value, width, is_global, is_handle) of each first byte
+    widths = {
+        PRIMPAR_1_BYTE: 1,
+        PRIMPAR_2_BYTES: 2,
+        PRIMPAR_4_BYTES: 4,
+    }
+    table = []
+    for first_byte in range(256):
+        kind = PRIMPAR_KIND_INVALID
+        value = 0
+        width = 0
+        is_global = bool(first_byte & PRIMPAR_GLOBAL)
+        is_handle = False
+        if first_byte & PRIMPAR_LONG:
+            size = first_byte & PRIMPAR_BYTES
+            if first_byte & PRIMPAR_VARIABLE:
+                if size in widths:
+                    width = widths[size]
+                    if first_byte & PRIMPAR_HANDLE:
+                        kind = PRIMPAR_KIND_VARIABLE
+                        is_handle = True
+                    elif first_byte & PRIMPAR_ADDR:
+                        kind = PRIMPAR_KIND_ADDR
+                    else:
+                        kind = PRIMPAR_KIND_VARIABLE
+            else: # PRIMPAR_CONST
+                is_global = False
+                if first_byte & PRIMPAR_LABEL:
+                    kind = PRIMPAR_KIND_LABEL
+                    width = 1
+                elif size == PRIMPAR_STRING_OLD or size == PRIMPAR_STRING:
+                    kind = PRIMPAR_KIND_STRING
+                elif size in widths:
+                    kind = PRIMPAR_KIND_CONST
+                    width = widths[size]
+        elif first_byte & PRIMPAR_VARIABLE:
+            kind = PRIMPAR_KIND_VARIABLE
+            value = first_byte & PRIMPAR_INDEX
+        else:
+            kind = PRIMPAR_KIND_CONST
+            is_global = False
+            value = first_byte & PRIMPAR_VALUE
+            if first_byte & PRIMPAR_CONST_SIGN:
+                value -= PRIMPAR_VALUE + 1
+        table.append((kind, value, width, is_global, is_handle))
+    return table
+
+def format_primpar(kind, value, width, is_global, is_handle):
+    return "PrimparInfo({0}, {1}, {2}, {3}, {4})".format(
+        _primpar_kind_names[kind], value, width, is_global, is_handle)
+
+def write_table(out, name, table, indent=''):
+    out.write("{0}{1} = (\n".format(indent, name))
+    for value, entry in enumerate(table):
+        out.write("{0}    {1}, # 0x{2:02X}\n".format(indent, entry, value))
+    out.write("{0})\n".format(indent))
+
+def generate():
+    out = io.StringIO()
+    out.write(HEADER)
+    out.write("\n# Param\n")
+    for param in Param:
+        out.write("{0} = {1}\n".format(param.name, param_value(param)))
+    out.write("\n# Subparam, see SUBCODE_TABLES\n")
+    out.write("SUBPARAM_BASE = 0x{0:X}\n".format(SUBPARAM_BASE))
+    for name, subparam in Subparam.__members__.items():
+        out.write("{0} = SUBPARAM_BASE + {1}\n".format(name, subparam.value))
+    out.write("\n")
+    for kind in sorted(_primpar_kind_names):
+        out.write("{0} = {1}\n".format(_primpar_kind_names[kind], kind))
+    out.write("\n# Op, indexed by opcode\n")
+    write_table(out, 'OP_TABLE', make_op_table())
+    out.write("\n# Subcodes of each Subparam, indexed by Subparam value and subcode\n")
+    out.write("SUBCODE_TABLES = (\n")
+    for value, entry in enumerate(make_subcode_tables()):
+        if entry is None:
+            out.write("    None, # 0x{0:02X}\n".format(value))
+            continue
+        name, table = entry
+        out.write("    # {0}\n".format(name))
+        out.write("    (\n")
+        for subcode, subcode_entry in enumerate(table):
+            out.write("        {0}, # 0x{1:02X}\n".format(subcode_entry, subcode))
+        out.write("    ),\n")
+    out.write(")\n")
+    out.write("\n# Callparam, indexed by the byte in the header of a subcall\n")
+    write_table(out, 'CALLPARAM_TABLE', make_callparam_table())
+    out.write("\n# First byte of an encoded parameter\n")
+    write_table(out, 'PRIMPAR_TABLE', [format_primpar(*entry) for entry in make_primpar_table()])
+    return out.getvalue()
+
+def check_tables():
+    # Cross-checks the tables that are currently imported against the enums,
+    # so a hand edit of lms2012_tables.py is caught as well.
+    import lms2012_tables as tables
+    errors = []
+    for param in list(Param) + list(Subparam):
+        if getattr(tables, param.name, None) != param_value(param):
+            errors.append("{0} doesn't match {1}".format(param.name, param))
+    for kind, name in _primpar_kind_names.items():
+        if getattr(tables, name, None) != kind:
+            errors.append("{0} isn't {1}".format(name, kind))
+    for value, info in enumerate(tables.OP_TABLE):
+        try:
+            op = Op(value)
+        except ValueError:
+            if info is not None:
+                errors.append("OP_TABLE[0x{0:02X}] is not an Op".format(value))
+            continue
+        if info != (op.name, tuple(param_value(p) for p in op.params), op is Op.CALL,
+                    op.name.startswith('JR'), Param.PARNO in op.params):
+            errors.append("OP_TABLE[0x{0:02X}] doesn't match Op.{1}".format(value, op.name))
+    for subparam, enum in subcode_enums.items():
+        table = tables.SUBCODE_TABLES[subparam.value]
+        for subcode in enum:
+            info = table[subcode.value]
+            if info is None or info.name != subcode.name or \
+                    info.params != tuple(param_value(p) for p in subcode.params):
+                errors.append("SUBCODE_TABLES doesn't match {0}.{1}".format(enum.__name__, subcode.name))
+        if sum(info is not None for info in table) != len(enum):
+            errors.append("SUBCODE_TABLES has extra {0} entries".format(enum.__name__))
+    for value, info in enumerate(tables.CALLPARAM_TABLE):
+        try:
+            param = Callparam(value)
+        except ValueError:
+            if info is not None:
+                errors.append("CALLPARAM_TABLE[0x{0:02X}] is not a Callparam".format(value))
+            continue
+        if info is None or info.name != param.name or info.param != param.param.value or \
+                info.size != param.data_format.size:
+            errors.append("CALLPARAM_TABLE[0x{0:02X}] doesn't match Callparam.{1}".format(value, param.name))
+    primpar_table = make_primpar_table()
+    if len(tables.PRIMPAR_TABLE) != len(primpar_table):
+        errors.append("PRIMPAR_TABLE doesn't have an entry for each byte")
+    for value, (info, entry) in enumerate(zip(tables.PRIMPAR_TABLE, primpar_table)):
+        if info != entry:
+            errors.append("PRIMPAR_TABLE[0x{0:02X}] doesn't match the PRIMPAR constants".format(value))
+    return errors
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate lms2012_tables.py from lms2012.py.")
+    parser.add_argument('--check', action='store_true',
+                        help="check that lms2012_tables.py is up to date instead of writing it")
+    args = parser.parse_args()
+
+    text = generate()
+    if args.check:
+        try:
+            with io.open(OUTPUT, encoding='utf-8') as f:
+                current = f.read()
+        except IOError:
+            current = None
+        errors = []
+        if current != text:
+            errors.append("lms2012_tables.py is out of date, run `python lms2012_gen.py`")
+        # The tables are checked against the enums even if the text is the
+        # same, to catch a mistake in generate() too.
+        try:
+            errors.extend(check_tables())
+        except Exception as e:
+            errors.append("lms2012_tables.py can't be checked: {0}".format(e))
+        for error in errors:
+            print(error, file=sys.stderr)
+        sys.exit(1 if errors else 0)
+
+    with io.open(OUTPUT, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+if __name__ == '__main__':
+    main()
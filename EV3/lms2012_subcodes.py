@@ -0,0 +1,740 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2015 David Lechner <david@lechnology.com>
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Subcode enums of lms2012 opcodes. These are imported on first use by
+# lms2012.py, see Subparam.subcode_type.
+
+from enum import Enum
+
+from lms2012 import Param, Subparam
+
+class UiReadSubcode(Enum):
+    GET_VBATT     = 1
+    GET_IBATT     = 2
+    GET_OS_VERS   = 3
+    GET_EVENT     = 4
+    GET_TBATT     = 5
+    GET_IINT      = 6
+    GET_IMOTOR    = 7
+    GET_STRING    = 8
+    GET_HW_VERS   = 9
+    GET_FW_VERS   = 10
+    GET_FW_BUILD  = 11
+    GET_OS_BUILD  = 12
+    GET_ADDRESS   = 13
+    GET_CODE      = 14
+    KEY           = 15
+    GET_SHUTDOWN  = 16
+    GET_WARNING   = 17
+    GET_LBATT     = 18
+    TEXTBOX_READ  = 21
+    GET_VERSION   = 26
+    GET_IP        = 27
+    GET_POWER     = 29
+    GET_SDCARD    = 30
+    GET_USBSTICK  = 31
+
+    @property
+    def params(self):
+        return _ui_read_subcode_params[self]
+
+_ui_read_subcode_params = {
+    UiReadSubcode.GET_VBATT:              (Param.PARF,),
+    UiReadSubcode.GET_IBATT:              (Param.PARF,),
+    UiReadSubcode.GET_OS_VERS:            (Param.PAR8,Param.PAR8),
+    UiReadSubcode.GET_EVENT:              (Param.PAR8,),
+    UiReadSubcode.GET_TBATT:              (Param.PARF,),
+    UiReadSubcode.GET_IINT:               (Param.PARF,),
+    UiReadSubcode.GET_IMOTOR:             (Param.PARF,),
+    UiReadSubcode.GET_STRING:             (Param.PAR8,Param.PAR8),
+    UiReadSubcode.KEY:                    (Param.PAR8,),
+    UiReadSubcode.GET_SHUTDOWN:           (Param.PAR8,),
+    UiReadSubcode.GET_WARNING:            (Param.PAR8,),
+    UiReadSubcode.GET_LBATT:              (Param.PAR8,),
+    UiReadSubcode.GET_ADDRESS:            (Param.PAR32,),
+    UiReadSubcode.GET_CODE:               (Param.PAR32,Param.PAR32,Param.PAR32,Param.PAR8),
+    UiReadSubcode.TEXTBOX_READ:           (Param.PAR8,Param.PAR32,Param.PAR8,Param.PAR8,Param.PAR16,Param.PAR8),
+    UiReadSubcode.GET_HW_VERS:            (Param.PAR8,Param.PAR8),
+    UiReadSubcode.GET_FW_VERS:            (Param.PAR8,Param.PAR8),
+    UiReadSubcode.GET_FW_BUILD:           (Param.PAR8,Param.PAR8),
+    UiReadSubcode.GET_OS_BUILD:           (Param.PAR8,Param.PAR8),
+    UiReadSubcode.GET_VERSION:            (Param.PAR8,Param.PAR8),
+    UiReadSubcode.GET_IP:                 (Param.PAR8,Param.PAR8),
+    UiReadSubcode.GET_POWER:              (Param.PARF,Param.PARF,Param.PARF,Param.PARF),
+    UiReadSubcode.GET_SDCARD:             (Param.PAR8,Param.PAR32,Param.PAR32),
+    UiReadSubcode.GET_USBSTICK:           (Param.PAR8,Param.PAR32,Param.PAR32),
+}
+
+class UiWriteSubcode(Enum):
+    WRITE_FLUSH   = 1
+    FLOATVALUE    = 2
+    STAMP         = 3
+    PUT_STRING    = 8
+    VALUE8        = 9
+    VALUE16       = 10
+    VALUE32       = 11
+    VALUEF        = 12
+    ADDRESS       = 13
+    CODE          = 14
+    DOWNLOAD_END  = 15
+    SCREEN_BLOCK  = 16
+    ALLOW_PULSE   = 17
+    SET_PULSE     = 18
+    TEXTBOX_APPEND = 21
+    SET_BUSY      = 22
+    SET_TESTPIN   = 24
+    INIT_RUN      = 25
+    UPDATE_RUN    = 26
+    LED           = 27
+    POWER         = 29
+    GRAPH_SAMPLE  = 30
+    TERMINAL      = 31
+
+    @property
+    def params(self):
+        return _ui_write_subcode_params[self]
+
+_ui_write_subcode_params = {
+    UiWriteSubcode.WRITE_FLUSH:            (),
+    UiWriteSubcode.FLOATVALUE:             (Param.PARF,Param.PAR8,Param.PAR8),
+    UiWriteSubcode.STAMP:                  (Param.PAR8,),
+    UiWriteSubcode.PUT_STRING:             (Param.PAR8,),
+    UiWriteSubcode.CODE:                   (Param.PAR8,Param.PAR32),
+    UiWriteSubcode.DOWNLOAD_END:           (),
+    UiWriteSubcode.SCREEN_BLOCK:           (Param.PAR8,),
+    UiWriteSubcode.ALLOW_PULSE:            (Param.PAR8,),
+    UiWriteSubcode.SET_PULSE:              (Param.PAR8,),
+    UiWriteSubcode.TEXTBOX_APPEND:         (Param.PAR8,Param.PAR32,Param.PAR8,Param.PAR8),
+    UiWriteSubcode.SET_BUSY:               (Param.PAR8,),
+    UiWriteSubcode.VALUE8:                 (Param.PAR8,),
+    UiWriteSubcode.VALUE16:                (Param.PAR16,),
+    UiWriteSubcode.VALUE32:                (Param.PAR32,),
+    UiWriteSubcode.VALUEF:                 (Param.PARF,),
+    UiWriteSubcode.ADDRESS:                (Param.PAR32,),
+    UiWriteSubcode.INIT_RUN:               (),
+    UiWriteSubcode.UPDATE_RUN:             (),
+    UiWriteSubcode.LED:                    (Param.PAR8,),
+    UiWriteSubcode.POWER:                  (Param.PAR8,),
+    UiWriteSubcode.TERMINAL:               (Param.PAR8,),
+    UiWriteSubcode.GRAPH_SAMPLE:           (),
+    UiWriteSubcode.SET_TESTPIN:            (Param.PAR8,),
+}
+
+class UiButtonSubcode(Enum):
+    SHORTPRESS      = 1
+    LONGPRESS       = 2
+    WAIT_FOR_PRESS  = 3
+    FLUSH           = 4
+    PRESS           = 5
+    RELEASE         = 6
+    GET_HORZ        = 7
+    GET_VERT        = 8
+    PRESSED         = 9
+    SET_BACK_BLOCK  = 10
+    GET_BACK_BLOCK  = 11
+    TESTSHORTPRESS  = 12
+    TESTLONGPRESS   = 13
+    GET_BUMBED      = 14
+    GET_CLICK       = 15
+
+    @property
+    def params(self):
+        return _ui_button_subcode_params[self]
+
+_ui_button_subcode_params = {
+    UiButtonSubcode.SHORTPRESS:             (Param.PAR8,Param.PAR8),
+    UiButtonSubcode.LONGPRESS:              (Param.PAR8,Param.PAR8),
+    UiButtonSubcode.FLUSH:                  (),
+    UiButtonSubcode.WAIT_FOR_PRESS:         (),
+    UiButtonSubcode.PRESS:                  (Param.PAR8,),
+    UiButtonSubcode.RELEASE:                (Param.PAR8,),
+    UiButtonSubcode.GET_HORZ:               (Param.PAR16,),
+    UiButtonSubcode.GET_VERT:               (Param.PAR16,),
+    UiButtonSubcode.PRESSED:                (Param.PAR8,Param.PAR8),
+    UiButtonSubcode.SET_BACK_BLOCK:         (Param.PAR8,),
+    UiButtonSubcode.GET_BACK_BLOCK:         (Param.PAR8,),
+    UiButtonSubcode.TESTSHORTPRESS:         (Param.PAR8,Param.PAR8),
+    UiButtonSubcode.TESTLONGPRESS:          (Param.PAR8,Param.PAR8),
+    UiButtonSubcode.GET_BUMBED:             (Param.PAR8,Param.PAR8),
+    UiButtonSubcode.GET_CLICK:              (Param.PAR8,),
+}
+
+class ComReadSubcode(Enum):
+    COMMAND       = 14
+
+    @property
+    def params(self):
+        return _com_read_subcode_params[self]
+
+_com_read_subcode_params = {
+    ComReadSubcode.COMMAND: (Param.PAR32,Param.PAR32,Param.PAR32,Param.PAR8),
+}
+
+class ComWriteSubcode(Enum):
+    REPLY         = 14
+
+    @property
+    def params(self):
+        return _com_write_subcode_params[self]
+
+_com_write_subcode_params = {
+    ComWriteSubcode.REPLY: (Param.PAR32,Param.PAR32,Param.PAR8),
+}
+
+class ComGetSubcode(Enum):
+    GET_ON_OFF    = 1
+    GET_VISIBLE   = 2
+    GET_RESULT    = 4
+    GET_PIN       = 5
+    SEARCH_ITEMS  = 8
+    SEARCH_ITEM   = 9
+    FAVOUR_ITEMS  = 10
+    FAVOUR_ITEM   = 11
+    GET_ID        = 12
+    GET_BRICKNAME = 13
+    GET_NETWORK   = 14
+    GET_PRESENT   = 15
+    GET_ENCRYPT   = 16
+    CONNEC_ITEMS  = 17
+    CONNEC_ITEM   = 18
+    GET_INCOMING  = 19
+    GET_MODE2     = 20
+
+    @property
+    def params(self):
+        return _com_get_subcode_params[self]
+
+_com_get_subcode_params = {
+    ComGetSubcode.GET_ON_OFF:             (Param.PAR8,Param.PAR8),
+    ComGetSubcode.GET_VISIBLE:            (Param.PAR8,Param.PAR8),
+    ComGetSubcode.GET_RESULT:             (Param.PAR8,Param.PAR8,Param.PAR8),
+    ComGetSubcode.GET_PIN:                (Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8),
+    ComGetSubcode.SEARCH_ITEMS:           (Param.PAR8,Param.PAR8),
+    ComGetSubcode.SEARCH_ITEM:            (Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8),
+    ComGetSubcode.FAVOUR_ITEMS:           (Param.PAR8,Param.PAR8),
+    ComGetSubcode.FAVOUR_ITEM:            (Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8),
+    ComGetSubcode.GET_ID:                 (Param.PAR8,Param.PAR8,Param.PAR8),
+    ComGetSubcode.GET_BRICKNAME:          (Param.PAR8,Param.PAR8),
+    ComGetSubcode.GET_NETWORK:            (Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8),
+    ComGetSubcode.GET_PRESENT:            (Param.PAR8,Param.PAR8),
+    ComGetSubcode.GET_ENCRYPT:            (Param.PAR8,Param.PAR8,Param.PAR8),
+    ComGetSubcode.CONNEC_ITEMS:           (Param.PAR8,Param.PAR8),
+    ComGetSubcode.CONNEC_ITEM:            (Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8),
+    ComGetSubcode.GET_INCOMING:           (Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8),
+    ComGetSubcode.GET_MODE2:              (Param.PAR8,Param.PAR8),
+}
+
+class ComSetSubcode(Enum):
+    SET_ON_OFF    = 1
+    SET_VISIBLE   = 2
+    SET_SEARCH    = 3
+    SET_PIN       = 5
+    SET_PASSKEY   = 6
+    SET_CONNECTION = 7
+    SET_BRICKNAME = 8
+    SET_MOVEUP    = 9
+    SET_MOVEDOWN  = 10
+    SET_ENCRYPT   = 11
+    SET_SSID      = 12
+    SET_MODE2     = 13
+
+    @property
+    def params(self):
+        return _com_set_subcode_params[self]
+
+_com_set_subcode_params = {
+    ComSetSubcode.SET_ON_OFF:             (Param.PAR8,Param.PAR8),
+    ComSetSubcode.SET_VISIBLE:            (Param.PAR8,Param.PAR8),
+    ComSetSubcode.SET_SEARCH:             (Param.PAR8,Param.PAR8),
+    ComSetSubcode.SET_PIN:                (Param.PAR8,Param.PAR8,Param.PAR8),
+    ComSetSubcode.SET_PASSKEY:            (Param.PAR8,Param.PAR8),
+    ComSetSubcode.SET_CONNECTION:         (Param.PAR8,Param.PAR8,Param.PAR8),
+    ComSetSubcode.SET_BRICKNAME:          (Param.PAR8,),
+    ComSetSubcode.SET_MOVEUP:             (Param.PAR8,Param.PAR8),
+    ComSetSubcode.SET_MOVEDOWN:           (Param.PAR8,Param.PAR8),
+    ComSetSubcode.SET_ENCRYPT:            (Param.PAR8,Param.PAR8,Param.PAR8),
+    ComSetSubcode.SET_SSID:               (Param.PAR8,Param.PAR8),
+    ComSetSubcode.SET_MODE2:              (Param.PAR8,Param.PAR8),
+}
+
+class InputDeviceSubcode(Enum):
+    INSERT_TYPE     = 1
+    GET_FORMAT      = 2
+    CAL_MINMAX      = 3
+    CAL_DEFAULT     = 4
+    GET_TYPEMODE    = 5
+    GET_SYMBOL      = 6
+    CAL_MIN         = 7
+    CAL_MAX         = 8
+    SETUP           = 9
+    CLR_ALL         = 10
+    GET_RAW         = 11
+    GET_CONNECTION  = 12
+    STOP_ALL        = 13
+    SET_TYPEMODE    = 14
+    READY_IIC       = 15
+    GET_NAME        = 21
+    GET_MODENAME    = 22
+    SET_RAW         = 23
+    GET_FIGURES     = 24
+    GET_CHANGES     = 25
+    CLR_CHANGES     = 26
+    READY_PCT       = 27
+    READY_RAW       = 28
+    READY_SI        = 29
+    GET_MINMAX      = 30
+    GET_BUMPS       = 31
+
+    @property
+    def params(self):
+        return _input_device_subcode_params[self]
+
+_input_device_subcode_params = {
+    InputDeviceSubcode.INSERT_TYPE:            (Param.PAR8,Param.PAR8,Param.PAR8),
+    InputDeviceSubcode.SET_TYPEMODE:           (Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8),
+    InputDeviceSubcode.GET_TYPEMODE:           (Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8),
+    InputDeviceSubcode.GET_CONNECTION:         (Param.PAR8,Param.PAR8,Param.PAR8),
+    InputDeviceSubcode.GET_NAME:               (Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8),
+    InputDeviceSubcode.GET_SYMBOL:             (Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8),
+    InputDeviceSubcode.GET_FORMAT:             (Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8),
+    InputDeviceSubcode.GET_RAW:                (Param.PAR8,Param.PAR8,Param.PAR32),
+    InputDeviceSubcode.GET_MODENAME:           (Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8),
+    InputDeviceSubcode.SET_RAW:                (Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR32),
+    InputDeviceSubcode.GET_FIGURES:            (Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8),
+    InputDeviceSubcode.GET_CHANGES:            (Param.PAR8,Param.PAR8,Param.PARF),
+    InputDeviceSubcode.CLR_CHANGES:            (Param.PAR8,Param.PAR8),
+    InputDeviceSubcode.READY_PCT:              (Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8,Param.PARNO),
+    InputDeviceSubcode.READY_RAW:              (Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8,Param.PARNO),
+    InputDeviceSubcode.READY_SI:               (Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8,Param.PARNO),
+    InputDeviceSubcode.GET_MINMAX:             (Param.PAR8,Param.PAR8,Param.PARF,Param.PARF),
+    InputDeviceSubcode.CAL_MINMAX:             (Param.PAR8,Param.PAR8,Param.PAR32,Param.PAR32),
+    InputDeviceSubcode.CAL_DEFAULT:            (Param.PAR8,Param.PAR8),
+    InputDeviceSubcode.CAL_MIN:                (Param.PAR8,Param.PAR8,Param.PAR32),
+    InputDeviceSubcode.CAL_MAX:                (Param.PAR8,Param.PAR8,Param.PAR32),
+    InputDeviceSubcode.GET_BUMPS:              (Param.PAR8,Param.PAR8,Param.PARF),
+    InputDeviceSubcode.SETUP:                  (Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR16,Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8),
+    InputDeviceSubcode.CLR_ALL:                (Param.PAR8,),
+    InputDeviceSubcode.STOP_ALL:               (Param.PAR8,),
+    InputDeviceSubcode.READY_IIC:              (Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8),
+}
+
+class ProgramInfoSubcode(Enum):
+    OBJ_STOP      = 0
+    OBJ_START     = 4
+    GET_STATUS    = 22
+    GET_SPEED     = 23
+    GET_PRGRESULT = 24
+    SET_INSTR     = 25
+
+    @property
+    def params(self):
+        return _program_info_params[self]
+
+_program_info_params = {
+    ProgramInfoSubcode.OBJ_STOP:      (Param.PAR16,Param.PAR16),
+    ProgramInfoSubcode.OBJ_START:     (Param.PAR16,Param.PAR16),
+    ProgramInfoSubcode.GET_STATUS:    (Param.PAR16,Param.PAR8),
+    ProgramInfoSubcode.GET_SPEED:     (Param.PAR16,Param.PAR32),
+    ProgramInfoSubcode.GET_PRGRESULT: (Param.PAR16,Param.PAR8),
+    ProgramInfoSubcode.SET_INSTR:     (Param.PAR16,),
+}
+
+class UiDrawSubcode(Enum):
+    UPDATE        = 0
+    CLEAN         = 1
+    PIXEL         = 2
+    LINE          = 3
+    CIRCLE        = 4
+    TEXT          = 5
+    ICON          = 6
+    PICTURE       = 7
+    VALUE         = 8
+    FILLRECT      = 9
+    RECT          = 10
+    NOTIFICATION  = 11
+    QUESTION      = 12
+    KEYBOARD      = 13
+    BROWSE        = 14
+    VERTBAR       = 15
+    INVERSERECT   = 16
+    SELECT_FONT   = 17
+    TOPLINE       = 18
+    FILLWINDOW    = 19
+    SCROLL        = 20
+    DOTLINE       = 21
+    VIEW_VALUE    = 22
+    VIEW_UNIT     = 23
+    FILLCIRCLE    = 24
+    STORE         = 25
+    RESTORE       = 26
+    ICON_QUESTION = 27
+    BMPFILE       = 28
+    POPUP         = 29
+    GRAPH_SETUP   = 30
+    GRAPH_DRAW    = 31
+    TEXTBOX       = 32
+
+    @property
+    def params(self):
+        return _ui_draw_subcode_params[self]
+
+_ui_draw_subcode_params = {
+    UiDrawSubcode.UPDATE:                 (),
+    UiDrawSubcode.CLEAN:                  (),
+    UiDrawSubcode.FILLRECT:               (Param.PAR8,Param.PAR16,Param.PAR16,Param.PAR16,Param.PAR16),
+    UiDrawSubcode.RECT:                   (Param.PAR8,Param.PAR16,Param.PAR16,Param.PAR16,Param.PAR16),
+    UiDrawSubcode.PIXEL:                  (Param.PAR8,Param.PAR16,Param.PAR16),
+    UiDrawSubcode.LINE:                   (Param.PAR8,Param.PAR16,Param.PAR16,Param.PAR16,Param.PAR16),
+    UiDrawSubcode.CIRCLE:                 (Param.PAR8,Param.PAR16,Param.PAR16,Param.PAR16),
+    UiDrawSubcode.TEXT:                   (Param.PAR8,Param.PAR16,Param.PAR16,Param.PAR8),
+    UiDrawSubcode.ICON:                   (Param.PAR8,Param.PAR16,Param.PAR16,Param.PAR8,Param.PAR8),
+    UiDrawSubcode.PICTURE:                (Param.PAR8,Param.PAR16,Param.PAR16,Param.PAR32),
+    UiDrawSubcode.VALUE:                  (Param.PAR8,Param.PAR16,Param.PAR16,Param.PARF,Param.PAR8,Param.PAR8),
+    UiDrawSubcode.NOTIFICATION:           (Param.PAR8,Param.PAR16,Param.PAR16,Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8),
+    UiDrawSubcode.QUESTION:               (Param.PAR8,Param.PAR16,Param.PAR16,Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8),
+    UiDrawSubcode.KEYBOARD:               (Param.PAR8,Param.PAR16,Param.PAR16,Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8),
+    UiDrawSubcode.BROWSE:                 (Param.PAR8,Param.PAR16,Param.PAR16,Param.PAR16,Param.PAR16,Param.PAR8,Param.PAR8,Param.PAR8),
+    UiDrawSubcode.VERTBAR:                (Param.PAR8,Param.PAR16,Param.PAR16,Param.PAR16,Param.PAR16,Param.PAR16,Param.PAR16,Param.PAR16),
+    UiDrawSubcode.INVERSERECT:            (Param.PAR16,Param.PAR16,Param.PAR16,Param.PAR16),
+    UiDrawSubcode.SELECT_FONT:            (Param.PAR8,),
+    UiDrawSubcode.TOPLINE:                (Param.PAR8,),
+    UiDrawSubcode.FILLWINDOW:             (Param.PAR8,Param.PAR16,Param.PAR16),
+    UiDrawSubcode.SCROLL:                 (Param.PAR16,),
+    UiDrawSubcode.DOTLINE:                (Param.PAR8,Param.PAR16,Param.PAR16,Param.PAR16,Param.PAR16,Param.PAR16,Param.PAR16),
+    UiDrawSubcode.VIEW_VALUE:             (Param.PAR8,Param.PAR16,Param.PAR16,Param.PARF,Param.PAR8,Param.PAR8),
+    UiDrawSubcode.VIEW_UNIT:              (Param.PAR8,Param.PAR16,Param.PAR16,Param.PARF,Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8),
+    UiDrawSubcode.FILLCIRCLE:             (Param.PAR8,Param.PAR16,Param.PAR16,Param.PAR16),
+    UiDrawSubcode.STORE:                  (Param.PAR8,),
+    UiDrawSubcode.RESTORE:                (Param.PAR8,),
+    UiDrawSubcode.ICON_QUESTION:          (Param.PAR8,Param.PAR16,Param.PAR16,Param.PAR8,Param.PAR32),
+    UiDrawSubcode.BMPFILE:                (Param.PAR8,Param.PAR16,Param.PAR16,Param.PAR8),
+    UiDrawSubcode.GRAPH_SETUP:            (Param.PAR16,Param.PAR16,Param.PAR16,Param.PAR16,Param.PAR8,Param.PAR16,Param.PAR16,Param.PAR16),
+    UiDrawSubcode.GRAPH_DRAW:             (Param.PAR8,Param.PARF,Param.PARF,Param.PARF,Param.PARF),
+    UiDrawSubcode.POPUP:                  (Param.PAR8,),
+    UiDrawSubcode.TEXTBOX:                (Param.PAR16,Param.PAR16,Param.PAR16,Param.PAR16,Param.PAR8,Param.PAR32,Param.PAR8,Param.PAR8),
+}
+
+class FileSubcode(Enum):
+    OPEN_APPEND         = 0
+    OPEN_READ           = 1
+    OPEN_WRITE          = 2
+    READ_VALUE          = 3
+    WRITE_VALUE         = 4
+    READ_TEXT           = 5
+    WRITE_TEXT          = 6
+    CLOSE               = 7
+    LOAD_IMAGE          = 8
+    GET_HANDLE          = 9
+    MAKE_FOLDER         = 10
+    GET_POOL            = 11
+    SET_LOG_SYNC_TIME   = 12
+    GET_FOLDERS         = 13
+    GET_LOG_SYNC_TIME   = 14
+    GET_SUBFOLDER_NAME  = 15
+    WRITE_LOG           = 16
+    CLOSE_LOG           = 17
+    GET_IMAGE           = 18
+    GET_ITEM            = 19
+    GET_CACHE_FILES     = 20
+    PUT_CACHE_FILE      = 21
+    GET_CACHE_FILE      = 22
+    DEL_CACHE_FILE      = 23
+    DEL_SUBFOLDER       = 24
+    GET_LOG_NAME        = 25
+
+    OPEN_LOG            = 27
+    READ_BYTES          = 28
+    WRITE_BYTES         = 29
+    REMOVE              = 30
+    MOVE                = 31
+
+    @property
+    def params(self):
+        return _file_subcode_params[self]
+
+_file_subcode_params = {
+    FileSubcode.OPEN_APPEND:            (Param.PAR8,Param.PAR16),
+    FileSubcode.OPEN_READ:              (Param.PAR8,Param.PAR16,Param.PAR32),
+    FileSubcode.OPEN_WRITE:             (Param.PAR8,Param.PAR16),
+    FileSubcode.READ_VALUE:             (Param.PAR16,Param.PAR8,Param.PARF),
+    FileSubcode.WRITE_VALUE:            (Param.PAR16,Param.PAR8,Param.PARF,Param.PAR8,Param.PAR8),
+    FileSubcode.READ_TEXT:              (Param.PAR16,Param.PAR8,Param.PAR16,Param.PAR8),
+    FileSubcode.WRITE_TEXT:             (Param.PAR16,Param.PAR8,Param.PAR8),
+    FileSubcode.CLOSE:                  (Param.PAR16,),
+    FileSubcode.LOAD_IMAGE:             (Param.PAR16,Param.PAR8,Param.PAR32,Param.PAR32),
+    FileSubcode.GET_HANDLE:             (Param.PAR8,Param.PAR16,Param.PAR8),
+    FileSubcode.MAKE_FOLDER:            (Param.PAR8,Param.PAR8),
+    FileSubcode.GET_LOG_NAME:           (Param.PAR8,Param.PAR8),
+    FileSubcode.GET_POOL:               (Param.PAR32,Param.PAR16,Param.PAR32),
+    FileSubcode.GET_FOLDERS:            (Param.PAR8,Param.PAR8),
+    FileSubcode.GET_SUBFOLDER_NAME:     (Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8),
+    FileSubcode.WRITE_LOG:              (Param.PAR16,Param.PAR32,Param.PAR8,Param.PARF),
+    FileSubcode.CLOSE_LOG:              (Param.PAR16,Param.PAR8),
+    FileSubcode.SET_LOG_SYNC_TIME:      (Param.PAR32,Param.PAR32),
+    FileSubcode.DEL_SUBFOLDER:          (Param.PAR8,Param.PAR8),
+    FileSubcode.GET_LOG_SYNC_TIME:      (Param.PAR32,Param.PAR32),
+    FileSubcode.GET_IMAGE:              (Param.PAR8,Param.PAR16,Param.PAR8,Param.PAR32),
+    FileSubcode.GET_ITEM:               (Param.PAR8,Param.PAR8,Param.PAR8),
+    FileSubcode.GET_CACHE_FILES:        (Param.PAR8,),
+    FileSubcode.GET_CACHE_FILE:         (Param.PAR8,Param.PAR8,Param.PAR8),
+    FileSubcode.PUT_CACHE_FILE:         (Param.PAR8,),
+    FileSubcode.DEL_CACHE_FILE:         (Param.PAR8,),
+    FileSubcode.OPEN_LOG:               (Param.PAR8,Param.PAR32,Param.PAR32,Param.PAR32,Param.PAR32,Param.PAR32,Param.PAR8,Param.PAR16),
+    FileSubcode.READ_BYTES:             (Param.PAR16,Param.PAR16,Param.PAR8),
+    FileSubcode.WRITE_BYTES:            (Param.PAR16,Param.PAR16,Param.PAR8),
+    FileSubcode.REMOVE:                 (Param.PAR8,),
+    FileSubcode.MOVE:                   (Param.PAR8,Param.PAR8),
+}
+
+class ArraySubcode(Enum):
+    DELETE              = 0
+    CREATE8             = 1
+    CREATE16            = 2
+    CREATE32            = 3
+    CREATEF             = 4
+    RESIZE              = 5
+    FILL                = 6
+    COPY                = 7
+    INIT8               = 8
+    INIT16              = 9
+    INIT32              = 10
+    INITF               = 11
+    SIZE                = 12
+    READ_CONTENT        = 13
+    WRITE_CONTENT       = 14
+    READ_SIZE           = 15
+    # File name subcodes
+    EXIST               = 16
+    TOTALSIZE           = 17
+    SPLIT               = 18
+    MERGE               = 19
+    CHECK               = 20
+    PACK                = 21
+    UNPACK              = 22
+    GET_FOLDERNAME      = 23
+
+    @property
+    def params(self):
+        return _array_subcode_params[self]
+
+_array_subcode_params = {
+    ArraySubcode.CREATE8:                (Param.PAR32,Param.PAR16),
+    ArraySubcode.CREATE16:               (Param.PAR32,Param.PAR16),
+    ArraySubcode.CREATE32:               (Param.PAR32,Param.PAR16),
+    ArraySubcode.CREATEF:                (Param.PAR32,Param.PAR16),
+    ArraySubcode.RESIZE:                 (Param.PAR16,Param.PAR32),
+    ArraySubcode.DELETE:                 (Param.PAR16,),
+    ArraySubcode.FILL:                   (Param.PAR16,Param.PARV),
+    ArraySubcode.COPY:                   (Param.PAR16,Param.PAR16),
+    ArraySubcode.INIT8:                  (Param.PAR16,Param.PAR32,Param.PAR32,Param.PARVALUES,Param.PAR8),
+    ArraySubcode.INIT16:                 (Param.PAR16,Param.PAR32,Param.PAR32,Param.PARVALUES,Param.PAR16),
+    ArraySubcode.INIT32:                 (Param.PAR16,Param.PAR32,Param.PAR32,Param.PARVALUES,Param.PAR32),
+    ArraySubcode.INITF:                  (Param.PAR16,Param.PAR32,Param.PAR32,Param.PARVALUES,Param.PARF),
+    ArraySubcode.SIZE:                   (Param.PAR16,Param.PAR32),
+    ArraySubcode.READ_CONTENT:           (Param.PAR16,Param.PAR16,Param.PAR32,Param.PAR32,Param.PAR8),
+    ArraySubcode.WRITE_CONTENT:          (Param.PAR16,Param.PAR16,Param.PAR32,Param.PAR32,Param.PAR8),
+    ArraySubcode.READ_SIZE:              (Param.PAR16,Param.PAR16,Param.PAR32),
+    # FileSubcode
+    ArraySubcode.EXIST:                  (Param.PAR8,Param.PAR8),
+    ArraySubcode.TOTALSIZE:              (Param.PAR8,Param.PAR32,Param.PAR32),
+    ArraySubcode.SPLIT:                  (Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8),
+    ArraySubcode.MERGE:                  (Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8,Param.PAR8),
+    ArraySubcode.CHECK:                  (Param.PAR8,Param.PAR8),
+    ArraySubcode.PACK:                   (Param.PAR8,),
+    ArraySubcode.UNPACK:                 (Param.PAR8,),
+    ArraySubcode.GET_FOLDERNAME:         (Param.PAR8,Param.PAR8),
+}
+
+class InfoSubcode(Enum):
+    SET_ERROR           = 1
+    GET_ERROR           = 2
+    ERRORTEXT           = 3
+
+    GET_VOLUME          = 4
+    SET_VOLUME          = 5
+    GET_MINUTES         = 6
+    SET_MINUTES         = 7
+    # Test subcodes
+    TST_OPEN                      = 10
+    TST_CLOSE                     = 11
+    TST_READ_PINS                 = 12
+    TST_WRITE_PINS                = 13
+    TST_READ_ADC                  = 14
+    TST_WRITE_UART                = 15
+    TST_READ_UART                 = 16
+    TST_ENABLE_UART               = 17
+    TST_DISABLE_UART              = 18
+    TST_ACCU_SWITCH               = 19
+    TST_BOOT_MODE2                = 20
+    TST_POLL_MODE2                = 21
+    TST_CLOSE_MODE2               = 22
+    TST_RAM_CHECK                 = 23
+
+    @property
+    def params(self):
+        return _info_subcode_params[self]
+
+_info_subcode_params = {
+    InfoSubcode.SET_ERROR:              (Param.PAR8,),
+    InfoSubcode.GET_ERROR:              (Param.PAR8,),
+    InfoSubcode.ERRORTEXT:              (Param.PAR8,Param.PAR8,Param.PAR8),
+    InfoSubcode.GET_VOLUME:             (Param.PAR8,),
+    InfoSubcode.SET_VOLUME:             (Param.PAR8,),
+    InfoSubcode.GET_MINUTES:            (Param.PAR8,),
+    InfoSubcode.SET_MINUTES:            (Param.PAR8,),
+    # TestSubcode
+    InfoSubcode.TST_OPEN:               (),
+    InfoSubcode.TST_CLOSE:              (),
+    InfoSubcode.TST_READ_PINS:          (Param.PAR8,Param.PAR8,Param.PAR8),
+    InfoSubcode.TST_WRITE_PINS:         (Param.PAR8,Param.PAR8,Param.PAR8),
+    InfoSubcode.TST_READ_ADC:           (Param.PAR8,Param.PAR16),
+    InfoSubcode.TST_WRITE_UART:         (Param.PAR8,Param.PAR8,Param.PAR8),
+    InfoSubcode.TST_READ_UART:          (Param.PAR8,Param.PAR8,Param.PAR8),
+    InfoSubcode.TST_ENABLE_UART:        (Param.PAR32,),
+    InfoSubcode.TST_DISABLE_UART:       (),
+    InfoSubcode.TST_ACCU_SWITCH:        (Param.PAR8,),
+    InfoSubcode.TST_BOOT_MODE2:         (),
+    InfoSubcode.TST_POLL_MODE2:         (Param.PAR8,),
+    InfoSubcode.TST_CLOSE_MODE2:        (),
+    InfoSubcode.TST_RAM_CHECK:          (Param.PAR8,),
+}
+
+class SoundSubcode(Enum):
+    BREAK               = 0
+    TONE                = 1
+    PLAY                = 2
+    REPEAT              = 3
+    SERVICE             = 4
+
+    @property
+    def params(self):
+        return _sound_subcode_params[self]
+
+_sound_subcode_params = {
+    SoundSubcode.BREAK:   (),
+    SoundSubcode.TONE:    (Param.PAR8,Param.PAR16,Param.PAR16),
+    SoundSubcode.PLAY:    (Param.PAR8,Param.PARS),
+    SoundSubcode.REPEAT:  (Param.PAR8,Param.PARS),
+    SoundSubcode.SERVICE: (),
+}
+
+class StringSubcode(Enum):
+    GET_SIZE            = 1
+    ADD                 = 2
+    COMPARE             = 3
+    DUPLICATE           = 5
+    VALUE_TO_STRING     = 6
+    STRING_TO_VALUE     = 7
+    STRIP               = 8
+    NUMBER_TO_STRING    = 9
+    SUB                 = 10
+    VALUE_FORMATTED     = 11
+    NUMBER_FORMATTED    = 12
+
+    @property
+    def params(self):
+        return _string_subcode_params[self]
+
+_string_subcode_params = {
+    StringSubcode.GET_SIZE:               (Param.PAR8,Param.PAR16),
+    StringSubcode.ADD:                    (Param.PAR8,Param.PAR8,Param.PAR8),
+    StringSubcode.COMPARE:                (Param.PAR8,Param.PAR8,Param.PAR8),
+    StringSubcode.DUPLICATE:              (Param.PAR8,Param.PAR8),
+    StringSubcode.VALUE_TO_STRING:        (Param.PARF,Param.PAR8,Param.PAR8,Param.PAR8),
+    StringSubcode.STRING_TO_VALUE:        (Param.PAR8,Param.PARF),
+    StringSubcode.STRIP:                  (Param.PAR8,Param.PAR8),
+    StringSubcode.NUMBER_TO_STRING:       (Param.PAR16,Param.PAR8,Param.PAR8),
+    StringSubcode.SUB:                    (Param.PAR8,Param.PAR8,Param.PAR8),
+    StringSubcode.VALUE_FORMATTED:        (Param.PARF,Param.PAR8,Param.PAR8,Param.PAR8),
+    StringSubcode.NUMBER_FORMATTED:       (Param.PAR32,Param.PAR8,Param.PAR8,Param.PAR8),
+}
+
+class MathSubcode(Enum):
+    EXP                           = 1
+    MOD                           = 2
+    FLOOR                         = 3
+    CEIL                          = 4
+    ROUND                         = 5
+    ABS                           = 6
+    NEGATE                        = 7
+    SQRT                          = 8
+    LOG                           = 9
+    LN                            = 10
+    SIN                           = 11
+    COS                           = 12
+    TAN                           = 13
+    ASIN                          = 14
+    ACOS                          = 15
+    ATAN                          = 16
+    MOD8                          = 17
+    MOD16                         = 18
+    MOD32                         = 19
+    POW                           = 20
+    TRUNC                         = 21
+
+    @property
+    def params(self):
+        return _math_subcode_params[self]
+
+_math_subcode_params = {
+    MathSubcode.EXP:                    (Param.PARF,Param.PARF),
+    MathSubcode.MOD:                    (Param.PARF,Param.PARF,Param.PARF),
+    MathSubcode.FLOOR:                  (Param.PARF,Param.PARF),
+    MathSubcode.CEIL:                   (Param.PARF,Param.PARF),
+    MathSubcode.ROUND:                  (Param.PARF,Param.PARF),
+    MathSubcode.ABS:                    (Param.PARF,Param.PARF),
+    MathSubcode.NEGATE:                 (Param.PARF,Param.PARF),
+    MathSubcode.SQRT:                   (Param.PARF,Param.PARF),
+    MathSubcode.LOG:                    (Param.PARF,Param.PARF),
+    MathSubcode.LN:                     (Param.PARF,Param.PARF),
+    MathSubcode.SIN:                    (Param.PARF,Param.PARF),
+    MathSubcode.COS:                    (Param.PARF,Param.PARF),
+    MathSubcode.TAN:                    (Param.PARF,Param.PARF),
+    MathSubcode.ASIN:                   (Param.PARF,Param.PARF),
+    MathSubcode.ACOS:                   (Param.PARF,Param.PARF),
+    MathSubcode.ATAN:                   (Param.PARF,Param.PARF),
+    MathSubcode.MOD8:                   (Param.PAR8,Param.PAR8,Param.PAR8),
+    MathSubcode.MOD16:                  (Param.PAR16,Param.PAR16,Param.PAR16),
+    MathSubcode.MOD32:                  (Param.PAR32,Param.PAR32,Param.PAR32),
+    MathSubcode.POW:                    (Param.PARF,Param.PARF,Param.PARF),
+    MathSubcode.TRUNC:                  (Param.PARF,Param.PAR8,Param.PARF),
+}
+
+subcode_enums = {
+    Subparam.PROGRAM_SUBP:      ProgramInfoSubcode,
+    Subparam.FILE_SUBP:         FileSubcode,
+    Subparam.ARRAY_SUBP:        ArraySubcode,
+    Subparam.FILENAME_SUBP:     ArraySubcode,
+    Subparam.VM_SUBP:           InfoSubcode,
+    Subparam.STRING_SUBP:       StringSubcode,
+    Subparam.UI_READ_SUBP:      UiReadSubcode,
+    Subparam.UI_WRITE_SUBP:     UiWriteSubcode,
+    Subparam.UI_DRAW_SUBP:      UiDrawSubcode,
+    Subparam.UI_BUTTON_SUBP:    UiButtonSubcode,
+    Subparam.COM_READ_SUBP:     ComReadSubcode,
+    Subparam.COM_WRITE_SUBP:    ComWriteSubcode,
+    Subparam.SOUND_SUBP:        SoundSubcode,
+    Subparam.INPUT_SUBP:        InputDeviceSubcode,
+    Subparam.MATH_SUBP:         MathSubcode,
+    Subparam.COM_GET_SUBP:      ComGetSubcode,
+    Subparam.COM_SET_SUBP:      ComSetSubcode,
+}
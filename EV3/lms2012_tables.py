@@ -0,0 +1,1270 @@
+# This file is generated by lms2012_gen.py from the definitions in lms2012.py.
+# Do not edit it, change lms2012.py and run `python lms2012_gen.py` instead.
+#
+# All tables are tuples indexed by byte value (None for unused values) and
+# parameter types are plain ints, so decoding never has to look up an enum
+# member by value.
+
+from collections import namedtuple
+
+OpInfo = namedtuple('OpInfo', ['name', 'params', 'is_call', 'is_jump', 'is_varargs'])
+SubcodeInfo = namedtuple('SubcodeInfo', ['name', 'params'])
+CallparamInfo = namedtuple('CallparamInfo', ['name', 'param', 'size'])
+# `value` is the constant or variable index for short encodings, `width` is
+# the number of bytes that follow for long encodings.
+PrimparInfo = namedtuple('PrimparInfo', ['kind', 'value', 'width', 'is_global', 'is_handle'])
+
+# Param
+SUBP = 1
+PARNO = 2
+PARLAB = 3
+PARVALUES = 4
+PAR8 = 8
+PAR16 = 9
+PAR32 = 10
+PARF = 11
+PARS = 12
+PARV = 15
+
+# Subparam, see SUBCODE_TABLES
+SUBPARAM_BASE = 0x100
+UI_READ_SUBP = SUBPARAM_BASE + 0
+UI_WRITE_SUBP = SUBPARAM_BASE + 1
+UI_DRAW_SUBP = SUBPARAM_BASE + 2
+UI_BUTTON_SUBP = SUBPARAM_BASE + 3
+FILE_SUBP = SUBPARAM_BASE + 4
+PROGRAM_SUBP = SUBPARAM_BASE + 5
+VM_SUBP = SUBPARAM_BASE + 6
+TST_SUBP = SUBPARAM_BASE + 6
+STRING_SUBP = SUBPARAM_BASE + 7
+COM_READ_SUBP = SUBPARAM_BASE + 8
+COM_WRITE_SUBP = SUBPARAM_BASE + 9
+SOUND_SUBP = SUBPARAM_BASE + 10
+INPUT_SUBP = SUBPARAM_BASE + 11
+ARRAY_SUBP = SUBPARAM_BASE + 12
+MATH_SUBP = SUBPARAM_BASE + 13
+COM_GET_SUBP = SUBPARAM_BASE + 14
+COM_SET_SUBP = SUBPARAM_BASE + 15
+FILENAME_SUBP = SUBPARAM_BASE + 16
+
+PRIMPAR_KIND_CONST = 0
+PRIMPAR_KIND_VARIABLE = 1
+PRIMPAR_KIND_LABEL = 2
+PRIMPAR_KIND_STRING = 3
+PRIMPAR_KIND_ADDR = 4
+PRIMPAR_KIND_INVALID = 5
+
+# Op, indexed by opcode
+OP_TABLE = (
+    OpInfo('ERROR', (), False, False, False), # 0x00
+    OpInfo('NOP', (), False, False, False), # 0x01
+    OpInfo('PROGRAM_STOP', (PAR16,), False, False, False), # 0x02
+    OpInfo('PROGRAM_START', (PAR16, PAR32, PAR32, PAR8), False, False, False), # 0x03
+    OpInfo('OBJECT_STOP', (PAR16,), False, False, False), # 0x04
+    OpInfo('OBJECT_START', (PAR16,), False, False, False), # 0x05
+    OpInfo('OBJECT_TRIG', (PAR16,), False, False, False), # 0x06
+    OpInfo('OBJECT_WAIT', (PAR16,), False, False, False), # 0x07
+    OpInfo('RETURN', (), False, False, False), # 0x08
+    OpInfo('CALL', (PAR16, PARNO), True, False, True), # 0x09
+    OpInfo('OBJECT_END', (), False, False, False), # 0x0A
+    OpInfo('SLEEP', (), False, False, False), # 0x0B
+    OpInfo('PROGRAM_INFO', (PROGRAM_SUBP,), False, False, False), # 0x0C
+    OpInfo('LABEL', (PARLAB,), False, False, False), # 0x0D
+    OpInfo('PROBE', (PAR16, PAR16, PAR32, PAR32), False, False, False), # 0x0E
+    OpInfo('DO', (PAR16, PAR32, PAR32), False, False, False), # 0x0F
+    OpInfo('ADD8', (PAR8, PAR8, PAR8), False, False, False), # 0x10
+    OpInfo('ADD16', (PAR16, PAR16, PAR16), False, False, False), # 0x11
+    OpInfo('ADD32', (PAR32, PAR32, PAR32), False, False, False), # 0x12
+    OpInfo('ADDF', (PARF, PARF, PARF), False, False, False), # 0x13
+    OpInfo('SUB8', (PAR8, PAR8, PAR8), False, False, False), # 0x14
+    OpInfo('SUB16', (PAR16, PAR16, PAR16), False, False, False), # 0x15
+    OpInfo('SUB32', (PAR32, PAR32, PAR32), False, False, False), # 0x16
+    OpInfo('SUBF', (PARF, PARF, PARF), False, False, False), # 0x17
+    OpInfo('MUL8', (PAR8, PAR8, PAR8), False, False, False), # 0x18
+    OpInfo('MUL16', (PAR16, PAR16, PAR16), False, False, False), # 0x19
+    OpInfo('MUL32', (PAR32, PAR32, PAR32), False, False, False), # 0x1A
+    OpInfo('MULF', (PARF, PARF, PARF), False, False, False), # 0x1B
+    OpInfo('DIV8', (PAR8, PAR8, PAR8), False, False, False), # 0x1C
+    OpInfo('DIV16', (PAR16, PAR16, PAR16), False, False, False), # 0x1D
+    OpInfo('DIV32', (PAR32, PAR32, PAR32), False, False, False), # 0x1E
+    OpInfo('DIVF', (PARF, PARF, PARF), False, False, False), # 0x1F
+    OpInfo('OR8', (PAR8, PAR8, PAR8), False, False, False), # 0x20
+    OpInfo('OR16', (PAR16, PAR16, PAR16), False, False, False), # 0x21
+    OpInfo('OR32', (PAR32, PAR32, PAR32), False, False, False), # 0x22
+    None, # 0x23
+    OpInfo('AND8', (PAR8, PAR8, PAR8), False, False, False), # 0x24
+    OpInfo('AND16', (PAR16, PAR16, PAR16), False, False, False), # 0x25
+    OpInfo('AND32', (PAR32, PAR32, PAR32), False, False, False), # 0x26
+    None, # 0x27
+    OpInfo('XOR8', (PAR8, PAR8, PAR8), False, False, False), # 0x28
+    OpInfo('XOR16', (PAR16, PAR16, PAR16), False, False, False), # 0x29
+    OpInfo('XOR32', (PAR32, PAR32, PAR32), False, False, False), # 0x2A
+    None, # 0x2B
+    OpInfo('RL8', (PAR8, PAR8, PAR8), False, False, False), # 0x2C
+    OpInfo('RL16', (PAR16, PAR16, PAR16), False, False, False), # 0x2D
+    OpInfo('RL32', (PAR32, PAR32, PAR32), False, False, False), # 0x2E
+    OpInfo('INIT_BYTES', (PAR8, PAR32, PARVALUES, PAR8), False, False, False), # 0x2F
+    OpInfo('MOVE8_8', (PAR8, PAR8), False, False, False), # 0x30
+    OpInfo('MOVE8_16', (PAR8, PAR16), False, False, False), # 0x31
+    OpInfo('MOVE8_32', (PAR8, PAR32), False, False, False), # 0x32
+    OpInfo('MOVE8_F', (PAR8, PARF), False, False, False), # 0x33
+    OpInfo('MOVE16_8', (PAR16, PAR8), False, False, False), # 0x34
+    OpInfo('MOVE16_16', (PAR16, PAR16), False, False, False), # 0x35
+    OpInfo('MOVE16_32', (PAR16, PAR32), False, False, False), # 0x36
+    OpInfo('MOVE16_F', (PAR16, PARF), False, False, False), # 0x37
+    OpInfo('MOVE32_8', (PAR32, PAR8), False, False, False), # 0x38
+    OpInfo('MOVE32_16', (PAR32, PAR16), False, False, False), # 0x39
+    OpInfo('MOVE32_32', (PAR32, PAR32), False, False, False), # 0x3A
+    OpInfo('MOVE32_F', (PAR32, PARF), False, False, False), # 0x3B
+    OpInfo('MOVEF_8', (PARF, PAR8), False, False, False), # 0x3C
+    OpInfo('MOVEF_16', (PARF, PAR16), False, False, False), # 0x3D
+    OpInfo('MOVEF_32', (PARF, PAR32), False, False, False), # 0x3E
+    OpInfo('MOVEF_F', (PARF, PARF), False, False, False), # 0x3F
+    OpInfo('JR', (PAR32,), False, True, False), # 0x40
+    OpInfo('JR_FALSE', (PAR8, PAR32), False, True, False), # 0x41
+    OpInfo('JR_TRUE', (PAR8, PAR32), False, True, False), # 0x42
+    OpInfo('JR_NAN', (PARF, PAR32), False, True, False), # 0x43
+    OpInfo('CP_LT8', (PAR8, PAR8, PAR8), False, False, False), # 0x44
+    OpInfo('CP_LT16', (PAR16, PAR16, PAR8), False, False, False), # 0x45
+    OpInfo('CP_LT32', (PAR32, PAR32, PAR8), False, False, False), # 0x46
+    OpInfo('CP_LTF', (PARF, PARF, PAR8), False, False, False), # 0x47
+    OpInfo('CP_GT8', (PAR8, PAR8, PAR8), False, False, False), # 0x48
+    OpInfo('CP_GT16', (PAR16, PAR16, PAR8), False, False, False), # 0x49
+    OpInfo('CP_GT32', (PAR32, PAR32, PAR8), False, False, False), # 0x4A
+    OpInfo('CP_GTF', (PARF, PARF, PAR8), False, False, False), # 0x4B
+    OpInfo('CP_EQ8', (PAR8, PAR8, PAR8), False, False, False), # 0x4C
+    OpInfo('CP_EQ16', (PAR16, PAR16, PAR8), False, False, False), # 0x4D
+    OpInfo('CP_EQ32', (PAR32, PAR32, PAR8), False, False, False), # 0x4E
+    OpInfo('CP_EQF', (PARF, PARF, PAR8), False, False, False), # 0x4F
+    OpInfo('CP_NEQ8', (PAR8, PAR8, PAR8), False, False, False), # 0x50
+    OpInfo('CP_NEQ16', (PAR16, PAR16, PAR8), False, False, False), # 0x51
+    OpInfo('CP_NEQ32', (PAR32, PAR32, PAR8), False, False, False), # 0x52
+    OpInfo('CP_NEQF', (PARF, PARF, PAR8), False, False, False), # 0x53
+    OpInfo('CP_LTEQ8', (PAR8, PAR8, PAR8), False, False, False), # 0x54
+    OpInfo('CP_LTEQ16', (PAR16, PAR16, PAR8), False, False, False), # 0x55
+    OpInfo('CP_LTEQ32', (PAR32, PAR32, PAR8), False, False, False), # 0x56
+    OpInfo('CP_LTEQF', (PARF, PARF, PAR8), False, False, False), # 0x57
+    OpInfo('CP_GTEQ8', (PAR8, PAR8, PAR8), False, False, False), # 0x58
+    OpInfo('CP_GTEQ16', (PAR16, PAR16, PAR8), False, False, False), # 0x59
+    OpInfo('CP_GTEQ32', (PAR32, PAR32, PAR8), False, False, False), # 0x5A
+    OpInfo('CP_GTEQF', (PARF, PARF, PAR8), False, False, False), # 0x5B
+    OpInfo('SELECT8', (PAR8, PAR8, PAR8, PAR8), False, False, False), # 0x5C
+    OpInfo('SELECT16', (PAR8, PAR16, PAR16, PAR16), False, False, False), # 0x5D
+    OpInfo('SELECT32', (PAR8, PAR32, PAR32, PAR32), False, False, False), # 0x5E
+    OpInfo('SELECTF', (PAR8, PARF, PARF, PARF), False, False, False), # 0x5F
+    OpInfo('SYSTEM', (PAR8, PAR32), False, False, False), # 0x60
+    OpInfo('PORT_CNV_OUTPUT', (PAR32, PAR8, PAR8, PAR8), False, False, False), # 0x61
+    OpInfo('PORT_CNV_INPUT', (PAR32, PAR8, PAR8), False, False, False), # 0x62
+    OpInfo('NOTE_TO_FREQ', (PAR8, PAR16), False, False, False), # 0x63
+    OpInfo('JR_LT8', (PAR8, PAR8, PAR32), False, True, False), # 0x64
+    OpInfo('JR_LT16', (PAR16, PAR16, PAR32), False, True, False), # 0x65
+    OpInfo('JR_LT32', (PAR32, PAR32, PAR32), False, True, False), # 0x66
+    OpInfo('JR_LTF', (PARF, PARF, PAR32), False, True, False), # 0x67
+    OpInfo('JR_GT8', (PAR8, PAR8, PAR32), False, True, False), # 0x68
+    OpInfo('JR_GT16', (PAR16, PAR16, PAR32), False, True, False), # 0x69
+    OpInfo('JR_GT32', (PAR32, PAR32, PAR32), False, True, False), # 0x6A
+    OpInfo('JR_GTF', (PARF, PARF, PAR32), False, True, False), # 0x6B
+    OpInfo('JR_EQ8', (PAR8, PAR8, PAR32), False, True, False), # 0x6C
+    OpInfo('JR_EQ16', (PAR16, PAR16, PAR32), False, True, False), # 0x6D
+    OpInfo('JR_EQ32', (PAR32, PAR32, PAR32), False, True, False), # 0x6E
+    OpInfo('JR_EQF', (PARF, PARF, PAR32), False, True, False), # 0x6F
+    OpInfo('JR_NEQ8', (PAR8, PAR8, PAR32), False, True, False), # 0x70
+    OpInfo('JR_NEQ16', (PAR16, PAR16, PAR32), False, True, False), # 0x71
+    OpInfo('JR_NEQ32', (PAR32, PAR32, PAR32), False, True, False), # 0x72
+    OpInfo('JR_NEQF', (PARF, PARF, PAR32), False, True, False), # 0x73
+    OpInfo('JR_LTEQ8', (PAR8, PAR8, PAR32), False, True, False), # 0x74
+    OpInfo('JR_LTEQ16', (PAR16, PAR16, PAR32), False, True, False), # 0x75
+    OpInfo('JR_LTEQ32', (PAR32, PAR32, PAR32), False, True, False), # 0x76
+    OpInfo('JR_LTEQF', (PARF, PARF, PAR32), False, True, False), # 0x77
+    OpInfo('JR_GTEQ8', (PAR8, PAR8, PAR32), False, True, False), # 0x78
+    OpInfo('JR_GTEQ16', (PAR16, PAR16, PAR32), False, True, False), # 0x79
+    OpInfo('JR_GTEQ32', (PAR32, PAR32, PAR32), False, True, False), # 0x7A
+    OpInfo('JR_GTEQF', (PARF, PARF, PAR32), False, True, False), # 0x7B
+    OpInfo('INFO', (VM_SUBP,), False, False, False), # 0x7C
+    OpInfo('STRINGS', (STRING_SUBP,), False, False, False), # 0x7D
+    OpInfo('MEMORY_WRITE', (PAR16, PAR16, PAR32, PAR32, PAR8), False, False, False), # 0x7E
+    OpInfo('MEMORY_READ', (PAR16, PAR16, PAR32, PAR32, PAR8), False, False, False), # 0x7F
+    OpInfo('UI_FLUSH', (), False, False, False), # 0x80
+    OpInfo('UI_READ', (UI_READ_SUBP,), False, False, False), # 0x81
+    OpInfo('UI_WRITE', (UI_WRITE_SUBP,), False, False, False), # 0x82
+    OpInfo('UI_BUTTON', (UI_BUTTON_SUBP,), False, False, False), # 0x83
+    OpInfo('UI_DRAW', (UI_DRAW_SUBP,), False, False, False), # 0x84
+    OpInfo('TIMER_WAIT', (PAR32, PAR32), False, False, False), # 0x85
+    OpInfo('TIMER_READY', (PAR32,), False, False, False), # 0x86
+    OpInfo('TIMER_READ', (PAR32,), False, False, False), # 0x87
+    OpInfo('BP0', (), False, False, False), # 0x88
+    OpInfo('BP1', (), False, False, False), # 0x89
+    OpInfo('BP2', (), False, False, False), # 0x8A
+    OpInfo('BP3', (), False, False, False), # 0x8B
+    OpInfo('BP_SET', (PAR16, PAR8, PAR32), False, False, False), # 0x8C
+    OpInfo('MATH', (MATH_SUBP,), False, False, False), # 0x8D
+    OpInfo('RANDOM', (PAR16, PAR16, PAR16), False, False, False), # 0x8E
+    OpInfo('TIMER_READ_US', (PAR32,), False, False, False), # 0x8F
+    OpInfo('KEEP_ALIVE', (PAR8,), False, False, False), # 0x90
+    OpInfo('COM_READ', (COM_READ_SUBP,), False, False, False), # 0x91
+    OpInfo('COM_WRITE', (COM_WRITE_SUBP,), False, False, False), # 0x92
+    None, # 0x93
+    OpInfo('SOUND', (SOUND_SUBP,), False, False, False), # 0x94
+    OpInfo('SOUND_TEST', (PAR8,), False, False, False), # 0x95
+    OpInfo('SOUND_READY', (), False, False, False), # 0x96
+    OpInfo('INPUT_SAMPLE', (PAR32, PAR16, PAR16, PAR8, PAR8, PAR8, PAR8, PARF), False, False, False), # 0x97
+    OpInfo('INPUT_DEVICE_LIST', (PAR8, PAR8, PAR8), False, False, False), # 0x98
+    OpInfo('INPUT_DEVICE', (INPUT_SUBP,), False, False, False), # 0x99
+    OpInfo('INPUT_READ', (PAR8, PAR8, PAR8, PAR8, PAR8), False, False, False), # 0x9A
+    OpInfo('INPUT_TEST', (PAR8, PAR8, PAR8), False, False, False), # 0x9B
+    OpInfo('INPUT_READY', (PAR8, PAR8), False, False, False), # 0x9C
+    OpInfo('INPUT_READSI', (PAR8, PAR8, PAR8, PAR8, PARF), False, False, False), # 0x9D
+    OpInfo('INPUT_READEXT', (PAR8, PAR8, PAR8, PAR8, PAR8, PARNO), False, False, True), # 0x9E
+    OpInfo('INPUT_WRITE', (PAR8, PAR8, PAR8, PAR8), False, False, False), # 0x9F
+    OpInfo('OUTPUT_GET_TYPE', (PAR8, PAR8, PAR8), False, False, False), # 0xA0
+    OpInfo('OUTPUT_SET_TYPE', (PAR8, PAR8, PAR8), False, False, False), # 0xA1
+    OpInfo('OUTPUT_RESET', (PAR8, PAR8), False, False, False), # 0xA2
+    OpInfo('OUTPUT_STOP', (PAR8, PAR8, PAR8), False, False, False), # 0xA3
+    OpInfo('OUTPUT_POWER', (PAR8, PAR8, PAR8), False, False, False), # 0xA4
+    OpInfo('OUTPUT_SPEED', (PAR8, PAR8, PAR8), False, False, False), # 0xA5
+    OpInfo('OUTPUT_START', (PAR8, PAR8), False, False, False), # 0xA6
+    OpInfo('OUTPUT_POLARITY', (PAR8, PAR8, PAR8), False, False, False), # 0xA7
+    OpInfo('OUTPUT_READ', (PAR8, PAR8, PAR8, PAR32), False, False, False), # 0xA8
+    OpInfo('OUTPUT_TEST', (PAR8, PAR8, PAR8), False, False, False), # 0xA9
+    OpInfo('OUTPUT_READY', (PAR8, PAR8), False, False, False), # 0xAA
+    OpInfo('OUTPUT_POSITION', (PAR8, PAR8, PAR32), False, False, False), # 0xAB
+    OpInfo('OUTPUT_STEP_POWER', (PAR8, PAR8, PAR8, PAR32, PAR32, PAR32, PAR8), False, False, False), # 0xAC
+    OpInfo('OUTPUT_TIME_POWER', (PAR8, PAR8, PAR8, PAR32, PAR32, PAR32, PAR8), False, False, False), # 0xAD
+    OpInfo('OUTPUT_STEP_SPEED', (PAR8, PAR8, PAR8, PAR32, PAR32, PAR32, PAR8), False, False, False), # 0xAE
+    OpInfo('OUTPUT_TIME_SPEED', (PAR8, PAR8, PAR8, PAR32, PAR32, PAR32, PAR8), False, False, False), # 0xAF
+    OpInfo('OUTPUT_STEP_SYNC', (PAR8, PAR8, PAR8, PAR16, PAR32, PAR8), False, False, False), # 0xB0
+    OpInfo('OUTPUT_TIME_SYNC', (PAR8, PAR8, PAR8, PAR16, PAR32, PAR8), False, False, False), # 0xB1
+    OpInfo('OUTPUT_CLR_COUNT', (PAR8, PAR8), False, False, False), # 0xB2
+    OpInfo('OUTPUT_GET_COUNT', (PAR8, PAR8, PAR32), False, False, False), # 0xB3
+    OpInfo('OUTPUT_PRG_STOP', (), False, False, False), # 0xB4
+    None, # 0xB5
+    None, # 0xB6
+    None, # 0xB7
+    None, # 0xB8
+    None, # 0xB9
+    None, # 0xBA
+    None, # 0xBB
+    None, # 0xBC
+    None, # 0xBD
+    None, # 0xBE
+    None, # 0xBF
+    OpInfo('FILE', (FILE_SUBP,), False, False, False), # 0xC0
+    OpInfo('ARRAY', (ARRAY_SUBP,), False, False, False), # 0xC1
+    OpInfo('ARRAY_WRITE', (PAR16, PAR32, PARV), False, False, False), # 0xC2
+    OpInfo('ARRAY_READ', (PAR16, PAR32, PARV), False, False, False), # 0xC3
+    OpInfo('ARRAY_APPEND', (PAR16, PARV), False, False, False), # 0xC4
+    OpInfo('MEMORY_USAGE', (PAR32, PAR32), False, False, False), # 0xC5
+    OpInfo('FILENAME', (FILENAME_SUBP,), False, False, False), # 0xC6
+    None, # 0xC7
+    OpInfo('READ8', (PAR8, PAR8, PAR8), False, False, False), # 0xC8
+    OpInfo('READ16', (PAR16, PAR8, PAR16), False, False, False), # 0xC9
+    OpInfo('READ32', (PAR32, PAR8, PAR32), False, False, False), # 0xCA
+    OpInfo('READF', (PARF, PAR8, PARF), False, False, False), # 0xCB
+    OpInfo('WRITE8', (PAR8, PAR8, PAR8), False, False, False), # 0xCC
+    OpInfo('WRITE16', (PAR16, PAR8, PAR16), False, False, False), # 0xCD
+    OpInfo('WRITE32', (PAR32, PAR8, PAR32), False, False, False), # 0xCE
+    OpInfo('WRITEF', (PARF, PAR8, PARF), False, False, False), # 0xCF
+    OpInfo('COM_READY', (PAR8, PAR8), False, False, False), # 0xD0
+    OpInfo('COM_READDATA', (PAR8, PAR8, PAR16, PAR8), False, False, False), # 0xD1
+    OpInfo('COM_WRITEDATA', (PAR8, PAR8, PAR16, PAR8), False, False, False), # 0xD2
+    OpInfo('COM_GET', (COM_GET_SUBP,), False, False, False), # 0xD3
+    OpInfo('COM_SET', (COM_SET_SUBP,), False, False, False), # 0xD4
+    OpInfo('COM_TEST', (PAR8, PAR8, PAR8), False, False, False), # 0xD5
+    OpInfo('COM_REMOVE', (PAR8, PAR8), False, False, False), # 0xD6
+    OpInfo('COM_WRITEFILE', (PAR8, PAR8, PAR8, PAR8), False, False, False), # 0xD7
+    OpInfo('MAILBOX_OPEN', (PAR8, PAR8, PAR8, PAR8, PAR8), False, False, False), # 0xD8
+    OpInfo('MAILBOX_WRITE', (PAR8, PAR8, PAR8, PAR8, PARNO), False, False, True), # 0xD9
+    OpInfo('MAILBOX_READ', (PAR8, PAR8, PARNO), False, False, True), # 0xDA
+    OpInfo('MAILBOX_TEST', (PAR8, PAR8), False, False, False), # 0xDB
+    OpInfo('MAILBOX_READY', (PAR8,), False, False, False), # 0xDC
+    OpInfo('MAILBOX_CLOSE', (PAR8,), False, False, False), # 0xDD
+    None, # 0xDE
+    None, # 0xDF
+    None, # 0xE0
+    None, # 0xE1
+    None, # 0xE2
+    None, # 0xE3
+    None, # 0xE4
+    None, # 0xE5
+    None, # 0xE6
+    None, # 0xE7
+    None, # 0xE8
+    None, # 0xE9
+    None, # 0xEA
+    None, # 0xEB
+    None, # 0xEC
+    None, # 0xED
+    None, # 0xEE
+    None, # 0xEF
+    None, # 0xF0
+    None, # 0xF1
+    None, # 0xF2
+    None, # 0xF3
+    None, # 0xF4
+    None, # 0xF5
+    None, # 0xF6
+    None, # 0xF7
+    None, # 0xF8
+    None, # 0xF9
+    None, # 0xFA
+    None, # 0xFB
+    None, # 0xFC
+    None, # 0xFD
+    None, # 0xFE
+    OpInfo('TST', (VM_SUBP,), False, False, False), # 0xFF
+)
+
+# Subcodes of each Subparam, indexed by Subparam value and subcode
+SUBCODE_TABLES = (
+    # UI_READ_SUBP
+    (
+        None, # 0x00
+        SubcodeInfo('GET_VBATT', (PARF,)), # 0x01
+        SubcodeInfo('GET_IBATT', (PARF,)), # 0x02
+        SubcodeInfo('GET_OS_VERS', (PAR8, PAR8)), # 0x03
+        SubcodeInfo('GET_EVENT', (PAR8,)), # 0x04
+        SubcodeInfo('GET_TBATT', (PARF,)), # 0x05
+        SubcodeInfo('GET_IINT', (PARF,)), # 0x06
+        SubcodeInfo('GET_IMOTOR', (PARF,)), # 0x07
+        SubcodeInfo('GET_STRING', (PAR8, PAR8)), # 0x08
+        SubcodeInfo('GET_HW_VERS', (PAR8, PAR8)), # 0x09
+        SubcodeInfo('GET_FW_VERS', (PAR8, PAR8)), # 0x0A
+        SubcodeInfo('GET_FW_BUILD', (PAR8, PAR8)), # 0x0B
+        SubcodeInfo('GET_OS_BUILD', (PAR8, PAR8)), # 0x0C
+        SubcodeInfo('GET_ADDRESS', (PAR32,)), # 0x0D
+        SubcodeInfo('GET_CODE', (PAR32, PAR32, PAR32, PAR8)), # 0x0E
+        SubcodeInfo('KEY', (PAR8,)), # 0x0F
+        SubcodeInfo('GET_SHUTDOWN', (PAR8,)), # 0x10
+        SubcodeInfo('GET_WARNING', (PAR8,)), # 0x11
+        SubcodeInfo('GET_LBATT', (PAR8,)), # 0x12
+        None, # 0x13
+        None, # 0x14
+        SubcodeInfo('TEXTBOX_READ', (PAR8, PAR32, PAR8, PAR8, PAR16, PAR8)), # 0x15
+        None, # 0x16
+        None, # 0x17
+        None, # 0x18
+        None, # 0x19
+        SubcodeInfo('GET_VERSION', (PAR8, PAR8)), # 0x1A
+        SubcodeInfo('GET_IP', (PAR8, PAR8)), # 0x1B
+        None, # 0x1C
+        SubcodeInfo('GET_POWER', (PARF, PARF, PARF, PARF)), # 0x1D
+        SubcodeInfo('GET_SDCARD', (PAR8, PAR32, PAR32)), # 0x1E
+        SubcodeInfo('GET_USBSTICK', (PAR8, PAR32, PAR32)), # 0x1F
+    ),
+    # UI_WRITE_SUBP
+    (
+        None, # 0x00
+        SubcodeInfo('WRITE_FLUSH', ()), # 0x01
+        SubcodeInfo('FLOATVALUE', (PARF, PAR8, PAR8)), # 0x02
+        SubcodeInfo('STAMP', (PAR8,)), # 0x03
+        None, # 0x04
+        None, # 0x05
+        None, # 0x06
+        None, # 0x07
+        SubcodeInfo('PUT_STRING', (PAR8,)), # 0x08
+        SubcodeInfo('VALUE8', (PAR8,)), # 0x09
+        SubcodeInfo('VALUE16', (PAR16,)), # 0x0A
+        SubcodeInfo('VALUE32', (PAR32,)), # 0x0B
+        SubcodeInfo('VALUEF', (PARF,)), # 0x0C
+        SubcodeInfo('ADDRESS', (PAR32,)), # 0x0D
+        SubcodeInfo('CODE', (PAR8, PAR32)), # 0x0E
+        SubcodeInfo('DOWNLOAD_END', ()), # 0x0F
+        SubcodeInfo('SCREEN_BLOCK', (PAR8,)), # 0x10
+        SubcodeInfo('ALLOW_PULSE', (PAR8,)), # 0x11
+        SubcodeInfo('SET_PULSE', (PAR8,)), # 0x12
+        None, # 0x13
+        None, # 0x14
+        SubcodeInfo('TEXTBOX_APPEND', (PAR8, PAR32, PAR8, PAR8)), # 0x15
+        SubcodeInfo('SET_BUSY', (PAR8,)), # 0x16
+        None, # 0x17
+        SubcodeInfo('SET_TESTPIN', (PAR8,)), # 0x18
+        SubcodeInfo('INIT_RUN', ()), # 0x19
+        SubcodeInfo('UPDATE_RUN', ()), # 0x1A
+        SubcodeInfo('LED', (PAR8,)), # 0x1B
+        None, # 0x1C
+        SubcodeInfo('POWER', (PAR8,)), # 0x1D
+        SubcodeInfo('GRAPH_SAMPLE', ()), # 0x1E
+        SubcodeInfo('TERMINAL', (PAR8,)), # 0x1F
+    ),
+    # UI_DRAW_SUBP
+    (
+        SubcodeInfo('UPDATE', ()), # 0x00
+        SubcodeInfo('CLEAN', ()), # 0x01
+        SubcodeInfo('PIXEL', (PAR8, PAR16, PAR16)), # 0x02
+        SubcodeInfo('LINE', (PAR8, PAR16, PAR16, PAR16, PAR16)), # 0x03
+        SubcodeInfo('CIRCLE', (PAR8, PAR16, PAR16, PAR16)), # 0x04
+        SubcodeInfo('TEXT', (PAR8, PAR16, PAR16, PAR8)), # 0x05
+        SubcodeInfo('ICON', (PAR8, PAR16, PAR16, PAR8, PAR8)), # 0x06
+        SubcodeInfo('PICTURE', (PAR8, PAR16, PAR16, PAR32)), # 0x07
+        SubcodeInfo('VALUE', (PAR8, PAR16, PAR16, PARF, PAR8, PAR8)), # 0x08
+        SubcodeInfo('FILLRECT', (PAR8, PAR16, PAR16, PAR16, PAR16)), # 0x09
+        SubcodeInfo('RECT', (PAR8, PAR16, PAR16, PAR16, PAR16)), # 0x0A
+        SubcodeInfo('NOTIFICATION', (PAR8, PAR16, PAR16, PAR8, PAR8, PAR8, PAR8, PAR8)), # 0x0B
+        SubcodeInfo('QUESTION', (PAR8, PAR16, PAR16, PAR8, PAR8, PAR8, PAR8, PAR8)), # 0x0C
+        SubcodeInfo('KEYBOARD', (PAR8, PAR16, PAR16, PAR8, PAR8, PAR8, PAR8, PAR8)), # 0x0D
+        SubcodeInfo('BROWSE', (PAR8, PAR16, PAR16, PAR16, PAR16, PAR8, PAR8, PAR8)), # 0x0E
+        SubcodeInfo('VERTBAR', (PAR8, PAR16, PAR16, PAR16, PAR16, PAR16, PAR16, PAR16)), # 0x0F
+        SubcodeInfo('INVERSERECT', (PAR16, PAR16, PAR16, PAR16)), # 0x10
+        SubcodeInfo('SELECT_FONT', (PAR8,)), # 0x11
+        SubcodeInfo('TOPLINE', (PAR8,)), # 0x12
+        SubcodeInfo('FILLWINDOW', (PAR8, PAR16, PAR16)), # 0x13
+        SubcodeInfo('SCROLL', (PAR16,)), # 0x14
+        SubcodeInfo('DOTLINE', (PAR8, PAR16, PAR16, PAR16, PAR16, PAR16, PAR16)), # 0x15
+        SubcodeInfo('VIEW_VALUE', (PAR8, PAR16, PAR16, PARF, PAR8, PAR8)), # 0x16
+        SubcodeInfo('VIEW_UNIT', (PAR8, PAR16, PAR16, PARF, PAR8, PAR8, PAR8, PAR8)), # 0x17
+        SubcodeInfo('FILLCIRCLE', (PAR8, PAR16, PAR16, PAR16)), # 0x18
+        SubcodeInfo('STORE', (PAR8,)), # 0x19
+        SubcodeInfo('RESTORE', (PAR8,)), # 0x1A
+        SubcodeInfo('ICON_QUESTION', (PAR8, PAR16, PAR16, PAR8, PAR32)), # 0x1B
+        SubcodeInfo('BMPFILE', (PAR8, PAR16, PAR16, PAR8)), # 0x1C
+        SubcodeInfo('POPUP', (PAR8,)), # 0x1D
+        SubcodeInfo('GRAPH_SETUP', (PAR16, PAR16, PAR16, PAR16, PAR8, PAR16, PAR16, PAR16)), # 0x1E
+        SubcodeInfo('GRAPH_DRAW', (PAR8, PARF, PARF, PARF, PARF)), # 0x1F
+        SubcodeInfo('TEXTBOX', (PAR16, PAR16, PAR16, PAR16, PAR8, PAR32, PAR8, PAR8)), # 0x20
+    ),
+    # UI_BUTTON_SUBP
+    (
+        None, # 0x00
+        SubcodeInfo('SHORTPRESS', (PAR8, PAR8)), # 0x01
+        SubcodeInfo('LONGPRESS', (PAR8, PAR8)), # 0x02
+        SubcodeInfo('WAIT_FOR_PRESS', ()), # 0x03
+        SubcodeInfo('FLUSH', ()), # 0x04
+        SubcodeInfo('PRESS', (PAR8,)), # 0x05
+        SubcodeInfo('RELEASE', (PAR8,)), # 0x06
+        SubcodeInfo('GET_HORZ', (PAR16,)), # 0x07
+        SubcodeInfo('GET_VERT', (PAR16,)), # 0x08
+        SubcodeInfo('PRESSED', (PAR8, PAR8)), # 0x09
+        SubcodeInfo('SET_BACK_BLOCK', (PAR8,)), # 0x0A
+        SubcodeInfo('GET_BACK_BLOCK', (PAR8,)), # 0x0B
+        SubcodeInfo('TESTSHORTPRESS', (PAR8, PAR8)), # 0x0C
+        SubcodeInfo('TESTLONGPRESS', (PAR8, PAR8)), # 0x0D
+        SubcodeInfo('GET_BUMBED', (PAR8, PAR8)), # 0x0E
+        SubcodeInfo('GET_CLICK', (PAR8,)), # 0x0F
+    ),
+    # FILE_SUBP
+    (
+        SubcodeInfo('OPEN_APPEND', (PAR8, PAR16)), # 0x00
+        SubcodeInfo('OPEN_READ', (PAR8, PAR16, PAR32)), # 0x01
+        SubcodeInfo('OPEN_WRITE', (PAR8, PAR16)), # 0x02
+        SubcodeInfo('READ_VALUE', (PAR16, PAR8, PARF)), # 0x03
+        SubcodeInfo('WRITE_VALUE', (PAR16, PAR8, PARF, PAR8, PAR8)), # 0x04
+        SubcodeInfo('READ_TEXT', (PAR16, PAR8, PAR16, PAR8)), # 0x05
+        SubcodeInfo('WRITE_TEXT', (PAR16, PAR8, PAR8)), # 0x06
+        SubcodeInfo('CLOSE', (PAR16,)), # 0x07
+        SubcodeInfo('LOAD_IMAGE', (PAR16, PAR8, PAR32, PAR32)), # 0x08
+        SubcodeInfo('GET_HANDLE', (PAR8, PAR16, PAR8)), # 0x09
+        SubcodeInfo('MAKE_FOLDER', (PAR8, PAR8)), # 0x0A
+        SubcodeInfo('GET_POOL', (PAR32, PAR16, PAR32)), # 0x0B
+        SubcodeInfo('SET_LOG_SYNC_TIME', (PAR32, PAR32)), # 0x0C
+        SubcodeInfo('GET_FOLDERS', (PAR8, PAR8)), # 0x0D
+        SubcodeInfo('GET_LOG_SYNC_TIME', (PAR32, PAR32)), # 0x0E
+        SubcodeInfo('GET_SUBFOLDER_NAME', (PAR8, PAR8, PAR8, PAR8)), # 0x0F
+        SubcodeInfo('WRITE_LOG', (PAR16, PAR32, PAR8, PARF)), # 0x10
+        SubcodeInfo('CLOSE_LOG', (PAR16, PAR8)), # 0x11
+        SubcodeInfo('GET_IMAGE', (PAR8, PAR16, PAR8, PAR32)), # 0x12
+        SubcodeInfo('GET_ITEM', (PAR8, PAR8, PAR8)), # 0x13
+        SubcodeInfo('GET_CACHE_FILES', (PAR8,)), # 0x14
+        SubcodeInfo('PUT_CACHE_FILE', (PAR8,)), # 0x15
+        SubcodeInfo('GET_CACHE_FILE', (PAR8, PAR8, PAR8)), # 0x16
+        SubcodeInfo('DEL_CACHE_FILE', (PAR8,)), # 0x17
+        SubcodeInfo('DEL_SUBFOLDER', (PAR8, PAR8)), # 0x18
+        SubcodeInfo('GET_LOG_NAME', (PAR8, PAR8)), # 0x19
+        None, # 0x1A
+        SubcodeInfo('OPEN_LOG', (PAR8, PAR32, PAR32, PAR32, PAR32, PAR32, PAR8, PAR16)), # 0x1B
+        SubcodeInfo('READ_BYTES', (PAR16, PAR16, PAR8)), # 0x1C
+        SubcodeInfo('WRITE_BYTES', (PAR16, PAR16, PAR8)), # 0x1D
+        SubcodeInfo('REMOVE', (PAR8,)), # 0x1E
+        SubcodeInfo('MOVE', (PAR8, PAR8)), # 0x1F
+    ),
+    # PROGRAM_SUBP
+    (
+        SubcodeInfo('OBJ_STOP', (PAR16, PAR16)), # 0x00
+        None, # 0x01
+        None, # 0x02
+        None, # 0x03
+        SubcodeInfo('OBJ_START', (PAR16, PAR16)), # 0x04
+        None, # 0x05
+        None, # 0x06
+        None, # 0x07
+        None, # 0x08
+        None, # 0x09
+        None, # 0x0A
+        None, # 0x0B
+        None, # 0x0C
+        None, # 0x0D
+        None, # 0x0E
+        None, # 0x0F
+        None, # 0x10
+        None, # 0x11
+        None, # 0x12
+        None, # 0x13
+        None, # 0x14
+        None, # 0x15
+        SubcodeInfo('GET_STATUS', (PAR16, PAR8)), # 0x16
+        SubcodeInfo('GET_SPEED', (PAR16, PAR32)), # 0x17
+        SubcodeInfo('GET_PRGRESULT', (PAR16, PAR8)), # 0x18
+        SubcodeInfo('SET_INSTR', (PAR16,)), # 0x19
+    ),
+    # VM_SUBP
+    (
+        None, # 0x00
+        SubcodeInfo('SET_ERROR', (PAR8,)), # 0x01
+        SubcodeInfo('GET_ERROR', (PAR8,)), # 0x02
+        SubcodeInfo('ERRORTEXT', (PAR8, PAR8, PAR8)), # 0x03
+        SubcodeInfo('GET_VOLUME', (PAR8,)), # 0x04
+        SubcodeInfo('SET_VOLUME', (PAR8,)), # 0x05
+        SubcodeInfo('GET_MINUTES', (PAR8,)), # 0x06
+        SubcodeInfo('SET_MINUTES', (PAR8,)), # 0x07
+        None, # 0x08
+        None, # 0x09
+        SubcodeInfo('TST_OPEN', ()), # 0x0A
+        SubcodeInfo('TST_CLOSE', ()), # 0x0B
+        SubcodeInfo('TST_READ_PINS', (PAR8, PAR8, PAR8)), # 0x0C
+        SubcodeInfo('TST_WRITE_PINS', (PAR8, PAR8, PAR8)), # 0x0D
+        SubcodeInfo('TST_READ_ADC', (PAR8, PAR16)), # 0x0E
+        SubcodeInfo('TST_WRITE_UART', (PAR8, PAR8, PAR8)), # 0x0F
+        SubcodeInfo('TST_READ_UART', (PAR8, PAR8, PAR8)), # 0x10
+        SubcodeInfo('TST_ENABLE_UART', (PAR32,)), # 0x11
+        SubcodeInfo('TST_DISABLE_UART', ()), # 0x12
+        SubcodeInfo('TST_ACCU_SWITCH', (PAR8,)), # 0x13
+        SubcodeInfo('TST_BOOT_MODE2', ()), # 0x14
+        SubcodeInfo('TST_POLL_MODE2', (PAR8,)), # 0x15
+        SubcodeInfo('TST_CLOSE_MODE2', ()), # 0x16
+        SubcodeInfo('TST_RAM_CHECK', (PAR8,)), # 0x17
+    ),
+    # STRING_SUBP
+    (
+        None, # 0x00
+        SubcodeInfo('GET_SIZE', (PAR8, PAR16)), # 0x01
+        SubcodeInfo('ADD', (PAR8, PAR8, PAR8)), # 0x02
+        SubcodeInfo('COMPARE', (PAR8, PAR8, PAR8)), # 0x03
+        None, # 0x04
+        SubcodeInfo('DUPLICATE', (PAR8, PAR8)), # 0x05
+        SubcodeInfo('VALUE_TO_STRING', (PARF, PAR8, PAR8, PAR8)), # 0x06
+        SubcodeInfo('STRING_TO_VALUE', (PAR8, PARF)), # 0x07
+        SubcodeInfo('STRIP', (PAR8, PAR8)), # 0x08
+        SubcodeInfo('NUMBER_TO_STRING', (PAR16, PAR8, PAR8)), # 0x09
+        SubcodeInfo('SUB', (PAR8, PAR8, PAR8)), # 0x0A
+        SubcodeInfo('VALUE_FORMATTED', (PARF, PAR8, PAR8, PAR8)), # 0x0B
+        SubcodeInfo('NUMBER_FORMATTED', (PAR32, PAR8, PAR8, PAR8)), # 0x0C
+    ),
+    # COM_READ_SUBP
+    (
+        None, # 0x00
+        None, # 0x01
+        None, # 0x02
+        None, # 0x03
+        None, # 0x04
+        None, # 0x05
+        None, # 0x06
+        None, # 0x07
+        None, # 0x08
+        None, # 0x09
+        None, # 0x0A
+        None, # 0x0B
+        None, # 0x0C
+        None, # 0x0D
+        SubcodeInfo('COMMAND', (PAR32, PAR32, PAR32, PAR8)), # 0x0E
+    ),
+    # COM_WRITE_SUBP
+    (
+        None, # 0x00
+        None, # 0x01
+        None, # 0x02
+        None, # 0x03
+        None, # 0x04
+        None, # 0x05
+        None, # 0x06
+        None, # 0x07
+        None, # 0x08
+        None, # 0x09
+        None, # 0x0A
+        None, # 0x0B
+        None, # 0x0C
+        None, # 0x0D
+        SubcodeInfo('REPLY', (PAR32, PAR32, PAR8)), # 0x0E
+    ),
+    # SOUND_SUBP
+    (
+        SubcodeInfo('BREAK', ()), # 0x00
+        SubcodeInfo('TONE', (PAR8, PAR16, PAR16)), # 0x01
+        SubcodeInfo('PLAY', (PAR8, PARS)), # 0x02
+        SubcodeInfo('REPEAT', (PAR8, PARS)), # 0x03
+        SubcodeInfo('SERVICE', ()), # 0x04
+    ),
+    # INPUT_SUBP
+    (
+        None, # 0x00
+        SubcodeInfo('INSERT_TYPE', (PAR8, PAR8, PAR8)), # 0x01
+        SubcodeInfo('GET_FORMAT', (PAR8, PAR8, PAR8, PAR8, PAR8, PAR8)), # 0x02
+        SubcodeInfo('CAL_MINMAX', (PAR8, PAR8, PAR32, PAR32)), # 0x03
+        SubcodeInfo('CAL_DEFAULT', (PAR8, PAR8)), # 0x04
+        SubcodeInfo('GET_TYPEMODE', (PAR8, PAR8, PAR8, PAR8)), # 0x05
+        SubcodeInfo('GET_SYMBOL', (PAR8, PAR8, PAR8, PAR8)), # 0x06
+        SubcodeInfo('CAL_MIN', (PAR8, PAR8, PAR32)), # 0x07
+        SubcodeInfo('CAL_MAX', (PAR8, PAR8, PAR32)), # 0x08
+        SubcodeInfo('SETUP', (PAR8, PAR8, PAR8, PAR16, PAR8, PAR8, PAR8, PAR8)), # 0x09
+        SubcodeInfo('CLR_ALL', (PAR8,)), # 0x0A
+        SubcodeInfo('GET_RAW', (PAR8, PAR8, PAR32)), # 0x0B
+        SubcodeInfo('GET_CONNECTION', (PAR8, PAR8, PAR8)), # 0x0C
+        SubcodeInfo('STOP_ALL', (PAR8,)), # 0x0D
+        SubcodeInfo('SET_TYPEMODE', (PAR8, PAR8, PAR8, PAR8, PAR8)), # 0x0E
+        SubcodeInfo('READY_IIC', (PAR8, PAR8, PAR8, PAR8, PAR8, PAR8, PAR8)), # 0x0F
+        None, # 0x10
+        None, # 0x11
+        None, # 0x12
+        None, # 0x13
+        None, # 0x14
+        SubcodeInfo('GET_NAME', (PAR8, PAR8, PAR8, PAR8)), # 0x15
+        SubcodeInfo('GET_MODENAME', (PAR8, PAR8, PAR8, PAR8, PAR8)), # 0x16
+        SubcodeInfo('SET_RAW', (PAR8, PAR8, PAR8, PAR32)), # 0x17
+        SubcodeInfo('GET_FIGURES', (PAR8, PAR8, PAR8, PAR8)), # 0x18
+        SubcodeInfo('GET_CHANGES', (PAR8, PAR8, PARF)), # 0x19
+        SubcodeInfo('CLR_CHANGES', (PAR8, PAR8)), # 0x1A
+        SubcodeInfo('READY_PCT', (PAR8, PAR8, PAR8, PAR8, PARNO)), # 0x1B
+        SubcodeInfo('READY_RAW', (PAR8, PAR8, PAR8, PAR8, PARNO)), # 0x1C
+        SubcodeInfo('READY_SI', (PAR8, PAR8, PAR8, PAR8, PARNO)), # 0x1D
+        SubcodeInfo('GET_MINMAX', (PAR8, PAR8, PARF, PARF)), # 0x1E
+        SubcodeInfo('GET_BUMPS', (PAR8, PAR8, PARF)), # 0x1F
+    ),
+    # ARRAY_SUBP
+    (
+        SubcodeInfo('DELETE', (PAR16,)), # 0x00
+        SubcodeInfo('CREATE8', (PAR32, PAR16)), # 0x01
+        SubcodeInfo('CREATE16', (PAR32, PAR16)), # 0x02
+        SubcodeInfo('CREATE32', (PAR32, PAR16)), # 0x03
+        SubcodeInfo('CREATEF', (PAR32, PAR16)), # 0x04
+        SubcodeInfo('RESIZE', (PAR16, PAR32)), # 0x05
+        SubcodeInfo('FILL', (PAR16, PARV)), # 0x06
+        SubcodeInfo('COPY', (PAR16, PAR16)), # 0x07
+        SubcodeInfo('INIT8', (PAR16, PAR32, PAR32, PARVALUES, PAR8)), # 0x08
+        SubcodeInfo('INIT16', (PAR16, PAR32, PAR32, PARVALUES, PAR16)), # 0x09
+        SubcodeInfo('INIT32', (PAR16, PAR32, PAR32, PARVALUES, PAR32)), # 0x0A
+        SubcodeInfo('INITF', (PAR16, PAR32, PAR32, PARVALUES, PARF)), # 0x0B
+        SubcodeInfo('SIZE', (PAR16, PAR32)), # 0x0C
+        SubcodeInfo('READ_CONTENT', (PAR16, PAR16, PAR32, PAR32, PAR8)), # 0x0D
+        SubcodeInfo('WRITE_CONTENT', (PAR16, PAR16, PAR32, PAR32, PAR8)), # 0x0E
+        SubcodeInfo('READ_SIZE', (PAR16, PAR16, PAR32)), # 0x0F
+        SubcodeInfo('EXIST', (PAR8, PAR8)), # 0x10
+        SubcodeInfo('TOTALSIZE', (PAR8, PAR32, PAR32)), # 0x11
+        SubcodeInfo('SPLIT', (PAR8, PAR8, PAR8, PAR8, PAR8)), # 0x12
+        SubcodeInfo('MERGE', (PAR8, PAR8, PAR8, PAR8, PAR8)), # 0x13
+        SubcodeInfo('CHECK', (PAR8, PAR8)), # 0x14
+        SubcodeInfo('PACK', (PAR8,)), # 0x15
+        SubcodeInfo('UNPACK', (PAR8,)), # 0x16
+        SubcodeInfo('GET_FOLDERNAME', (PAR8, PAR8)), # 0x17
+    ),
+    # MATH_SUBP
+    (
+        None, # 0x00
+        SubcodeInfo('EXP', (PARF, PARF)), # 0x01
+        SubcodeInfo('MOD', (PARF, PARF, PARF)), # 0x02
+        SubcodeInfo('FLOOR', (PARF, PARF)), # 0x03
+        SubcodeInfo('CEIL', (PARF, PARF)), # 0x04
+        SubcodeInfo('ROUND', (PARF, PARF)), # 0x05
+        SubcodeInfo('ABS', (PARF, PARF)), # 0x06
+        SubcodeInfo('NEGATE', (PARF, PARF)), # 0x07
+        SubcodeInfo('SQRT', (PARF, PARF)), # 0x08
+        SubcodeInfo('LOG', (PARF, PARF)), # 0x09
+        SubcodeInfo('LN', (PARF, PARF)), # 0x0A
+        SubcodeInfo('SIN', (PARF, PARF)), # 0x0B
+        SubcodeInfo('COS', (PARF, PARF)), # 0x0C
+        SubcodeInfo('TAN', (PARF, PARF)), # 0x0D
+        SubcodeInfo('ASIN', (PARF, PARF)), # 0x0E
+        SubcodeInfo('ACOS', (PARF, PARF)), # 0x0F
+        SubcodeInfo('ATAN', (PARF, PARF)), # 0x10
+        SubcodeInfo('MOD8', (PAR8, PAR8, PAR8)), # 0x11
+        SubcodeInfo('MOD16', (PAR16, PAR16, PAR16)), # 0x12
+        SubcodeInfo('MOD32', (PAR32, PAR32, PAR32)), # 0x13
+        SubcodeInfo('POW', (PARF, PARF, PARF)), # 0x14
+        SubcodeInfo('TRUNC', (PARF, PAR8, PARF)), # 0x15
+    ),
+    # COM_GET_SUBP
+    (
+        None, # 0x00
+        SubcodeInfo('GET_ON_OFF', (PAR8, PAR8)), # 0x01
+        SubcodeInfo('GET_VISIBLE', (PAR8, PAR8)), # 0x02
+        None, # 0x03
+        SubcodeInfo('GET_RESULT', (PAR8, PAR8, PAR8)), # 0x04
+        SubcodeInfo('GET_PIN', (PAR8, PAR8, PAR8, PAR8)), # 0x05
+        None, # 0x06
+        None, # 0x07
+        SubcodeInfo('SEARCH_ITEMS', (PAR8, PAR8)), # 0x08
+        SubcodeInfo('SEARCH_ITEM', (PAR8, PAR8, PAR8, PAR8, PAR8, PAR8, PAR8, PAR8)), # 0x09
+        SubcodeInfo('FAVOUR_ITEMS', (PAR8, PAR8)), # 0x0A
+        SubcodeInfo('FAVOUR_ITEM', (PAR8, PAR8, PAR8, PAR8, PAR8, PAR8, PAR8)), # 0x0B
+        SubcodeInfo('GET_ID', (PAR8, PAR8, PAR8)), # 0x0C
+        SubcodeInfo('GET_BRICKNAME', (PAR8, PAR8)), # 0x0D
+        SubcodeInfo('GET_NETWORK', (PAR8, PAR8, PAR8, PAR8, PAR8)), # 0x0E
+        SubcodeInfo('GET_PRESENT', (PAR8, PAR8)), # 0x0F
+        SubcodeInfo('GET_ENCRYPT', (PAR8, PAR8, PAR8)), # 0x10
+        SubcodeInfo('CONNEC_ITEMS', (PAR8, PAR8)), # 0x11
+        SubcodeInfo('CONNEC_ITEM', (PAR8, PAR8, PAR8, PAR8, PAR8)), # 0x12
+        SubcodeInfo('GET_INCOMING', (PAR8, PAR8, PAR8, PAR8)), # 0x13
+        SubcodeInfo('GET_MODE2', (PAR8, PAR8)), # 0x14
+    ),
+    # COM_SET_SUBP
+    (
+        None, # 0x00
+        SubcodeInfo('SET_ON_OFF', (PAR8, PAR8)), # 0x01
+        SubcodeInfo('SET_VISIBLE', (PAR8, PAR8)), # 0x02
+        SubcodeInfo('SET_SEARCH', (PAR8, PAR8)), # 0x03
+        None, # 0x04
+        SubcodeInfo('SET_PIN', (PAR8, PAR8, PAR8)), # 0x05
+        SubcodeInfo('SET_PASSKEY', (PAR8, PAR8)), # 0x06
+        SubcodeInfo('SET_CONNECTION', (PAR8, PAR8, PAR8)), # 0x07
+        SubcodeInfo('SET_BRICKNAME', (PAR8,)), # 0x08
+        SubcodeInfo('SET_MOVEUP', (PAR8, PAR8)), # 0x09
+        SubcodeInfo('SET_MOVEDOWN', (PAR8, PAR8)), # 0x0A
+        SubcodeInfo('SET_ENCRYPT', (PAR8, PAR8, PAR8)), # 0x0B
+        SubcodeInfo('SET_SSID', (PAR8, PAR8)), # 0x0C
+        SubcodeInfo('SET_MODE2', (PAR8, PAR8)), # 0x0D
+    ),
+    # FILENAME_SUBP
+    (
+        SubcodeInfo('DELETE', (PAR16,)), # 0x00
+        SubcodeInfo('CREATE8', (PAR32, PAR16)), # 0x01
+        SubcodeInfo('CREATE16', (PAR32, PAR16)), # 0x02
+        SubcodeInfo('CREATE32', (PAR32, PAR16)), # 0x03
+        SubcodeInfo('CREATEF', (PAR32, PAR16)), # 0x04
+        SubcodeInfo('RESIZE', (PAR16, PAR32)), # 0x05
+        SubcodeInfo('FILL', (PAR16, PARV)), # 0x06
+        SubcodeInfo('COPY', (PAR16, PAR16)), # 0x07
+        SubcodeInfo('INIT8', (PAR16, PAR32, PAR32, PARVALUES, PAR8)), # 0x08
+        SubcodeInfo('INIT16', (PAR16, PAR32, PAR32, PARVALUES, PAR16)), # 0x09
+        SubcodeInfo('INIT32', (PAR16, PAR32, PAR32, PARVALUES, PAR32)), # 0x0A
+        SubcodeInfo('INITF', (PAR16, PAR32, PAR32, PARVALUES, PARF)), # 0x0B
+        SubcodeInfo('SIZE', (PAR16, PAR32)), # 0x0C
+        SubcodeInfo('READ_CONTENT', (PAR16, PAR16, PAR32, PAR32, PAR8)), # 0x0D
+        SubcodeInfo('WRITE_CONTENT', (PAR16, PAR16, PAR32, PAR32, PAR8)), # 0x0E
+        SubcodeInfo('READ_SIZE', (PAR16, PAR16, PAR32)), # 0x0F
+        SubcodeInfo('EXIST', (PAR8, PAR8)), # 0x10
+        SubcodeInfo('TOTALSIZE', (PAR8, PAR32, PAR32)), # 0x11
+        SubcodeInfo('SPLIT', (PAR8, PAR8, PAR8, PAR8, PAR8)), # 0x12
+        SubcodeInfo('MERGE', (PAR8, PAR8, PAR8, PAR8, PAR8)), # 0x13
+        SubcodeInfo('CHECK', (PAR8, PAR8)), # 0x14
+        SubcodeInfo('PACK', (PAR8,)), # 0x15
+        SubcodeInfo('UNPACK', (PAR8,)), # 0x16
+        SubcodeInfo('GET_FOLDERNAME', (PAR8, PAR8)), # 0x17
+    ),
+)
+
+# Callparam, indexed by the byte in the header of a subcall
+CALLPARAM_TABLE = (
+    None, # 0x00
+    None, # 0x01
+    None, # 0x02
+    None, # 0x03
+    None, # 0x04
+    None, # 0x05
+    None, # 0x06
+    None, # 0x07
+    None, # 0x08
+    None, # 0x09
+    None, # 0x0A
+    None, # 0x0B
+    None, # 0x0C
+    None, # 0x0D
+    None, # 0x0E
+    None, # 0x0F
+    None, # 0x10
+    None, # 0x11
+    None, # 0x12
+    None, # 0x13
+    None, # 0x14
+    None, # 0x15
+    None, # 0x16
+    None, # 0x17
+    None, # 0x18
+    None, # 0x19
+    None, # 0x1A
+    None, # 0x1B
+    None, # 0x1C
+    None, # 0x1D
+    None, # 0x1E
+    None, # 0x1F
+    None, # 0x20
+    None, # 0x21
+    None, # 0x22
+    None, # 0x23
+    None, # 0x24
+    None, # 0x25
+    None, # 0x26
+    None, # 0x27
+    None, # 0x28
+    None, # 0x29
+    None, # 0x2A
+    None, # 0x2B
+    None, # 0x2C
+    None, # 0x2D
+    None, # 0x2E
+    None, # 0x2F
+    None, # 0x30
+    None, # 0x31
+    None, # 0x32
+    None, # 0x33
+    None, # 0x34
+    None, # 0x35
+    None, # 0x36
+    None, # 0x37
+    None, # 0x38
+    None, # 0x39
+    None, # 0x3A
+    None, # 0x3B
+    None, # 0x3C
+    None, # 0x3D
+    None, # 0x3E
+    None, # 0x3F
+    CallparamInfo('OUT_8', PAR8, 1), # 0x40
+    CallparamInfo('OUT_16', PAR16, 2), # 0x41
+    CallparamInfo('OUT_32', PAR32, 4), # 0x42
+    CallparamInfo('OUT_F', PARF, 4), # 0x43
+    CallparamInfo('OUT_S', PARS, 1), # 0x44
+    None, # 0x45
+    None, # 0x46
+    None, # 0x47
+    None, # 0x48
+    None, # 0x49
+    None, # 0x4A
+    None, # 0x4B
+    None, # 0x4C
+    None, # 0x4D
+    None, # 0x4E
+    None, # 0x4F
+    None, # 0x50
+    None, # 0x51
+    None, # 0x52
+    None, # 0x53
+    None, # 0x54
+    None, # 0x55
+    None, # 0x56
+    None, # 0x57
+    None, # 0x58
+    None, # 0x59
+    None, # 0x5A
+    None, # 0x5B
+    None, # 0x5C
+    None, # 0x5D
+    None, # 0x5E
+    None, # 0x5F
+    None, # 0x60
+    None, # 0x61
+    None, # 0x62
+    None, # 0x63
+    None, # 0x64
+    None, # 0x65
+    None, # 0x66
+    None, # 0x67
+    None, # 0x68
+    None, # 0x69
+    None, # 0x6A
+    None, # 0x6B
+    None, # 0x6C
+    None, # 0x6D
+    None, # 0x6E
+    None, # 0x6F
+    None, # 0x70
+    None, # 0x71
+    None, # 0x72
+    None, # 0x73
+    None, # 0x74
+    None, # 0x75
+    None, # 0x76
+    None, # 0x77
+    None, # 0x78
+    None, # 0x79
+    None, # 0x7A
+    None, # 0x7B
+    None, # 0x7C
+    None, # 0x7D
+    None, # 0x7E
+    None, # 0x7F
+    CallparamInfo('IN_8', PAR8, 1), # 0x80
+    CallparamInfo('IN_16', PAR16, 2), # 0x81
+    CallparamInfo('IN_32', PAR32, 4), # 0x82
+    CallparamInfo('IN_F', PARF, 4), # 0x83
+    CallparamInfo('IN_S', PARS, 1), # 0x84
+    None, # 0x85
+    None, # 0x86
+    None, # 0x87
+    None, # 0x88
+    None, # 0x89
+    None, # 0x8A
+    None, # 0x8B
+    None, # 0x8C
+    None, # 0x8D
+    None, # 0x8E
+    None, # 0x8F
+    None, # 0x90
+    None, # 0x91
+    None, # 0x92
+    None, # 0x93
+    None, # 0x94
+    None, # 0x95
+    None, # 0x96
+    None, # 0x97
+    None, # 0x98
+    None, # 0x99
+    None, # 0x9A
+    None, # 0x9B
+    None, # 0x9C
+    None, # 0x9D
+    None, # 0x9E
+    None, # 0x9F
+    None, # 0xA0
+    None, # 0xA1
+    None, # 0xA2
+    None, # 0xA3
+    None, # 0xA4
+    None, # 0xA5
+    None, # 0xA6
+    None, # 0xA7
+    None, # 0xA8
+    None, # 0xA9
+    None, # 0xAA
+    None, # 0xAB
+    None, # 0xAC
+    None, # 0xAD
+    None, # 0xAE
+    None, # 0xAF
+    None, # 0xB0
+    None, # 0xB1
+    None, # 0xB2
+    None, # 0xB3
+    None, # 0xB4
+    None, # 0xB5
+    None, # 0xB6
+    None, # 0xB7
+    None, # 0xB8
+    None, # 0xB9
+    None, # 0xBA
+    None, # 0xBB
+    None, # 0xBC
+    None, # 0xBD
+    None, # 0xBE
+    None, # 0xBF
+    CallparamInfo('IO_8', PAR8, 1), # 0xC0
+    CallparamInfo('IO_16', PAR16, 2), # 0xC1
+    CallparamInfo('IO_32', PAR32, 4), # 0xC2
+    CallparamInfo('IO_F', PARF, 4), # 0xC3
+    CallparamInfo('IO_S', PARS, 1), # 0xC4
+    None, # 0xC5
+    None, # 0xC6
+    None, # 0xC7
+    None, # 0xC8
+    None, # 0xC9
+    None, # 0xCA
+    None, # 0xCB
+    None, # 0xCC
+    None, # 0xCD
+    None, # 0xCE
+    None, # 0xCF
+    None, # 0xD0
+    None, # 0xD1
+    None, # 0xD2
+    None, # 0xD3
+    None, # 0xD4
+    None, # 0xD5
+    None, # 0xD6
+    None, # 0xD7
+    None, # 0xD8
+    None, # 0xD9
+    None, # 0xDA
+    None, # 0xDB
+    None, # 0xDC
+    None, # 0xDD
+    None, # 0xDE
+    None, # 0xDF
+    None, # 0xE0
+    None, # 0xE1
+    None, # 0xE2
+    None, # 0xE3
+    None, # 0xE4
+    None, # 0xE5
+    None, # 0xE6
+    None, # 0xE7
+    None, # 0xE8
+    None, # 0xE9
+    None, # 0xEA
+    None, # 0xEB
+    None, # 0xEC
+    None, # 0xED
+    None, # 0xEE
+    None, # 0xEF
+    None, # 0xF0
+    None, # 0xF1
+    None, # 0xF2
+    None, # 0xF3
+    None, # 0xF4
+    None, # 0xF5
+    None, # 0xF6
+    None, # 0xF7
+    None, # 0xF8
+    None, # 0xF9
+    None, # 0xFA
+    None, # 0xFB
+    None, # 0xFC
+    None, # 0xFD
+    None, # 0xFE
+    None, # 0xFF
+)
+
+# First byte of an encoded parameter
+PRIMPAR_TABLE = (
+    PrimparInfo(PRIMPAR_KIND_CONST, 0, 0, False, False), # 0x00
+    PrimparInfo(PRIMPAR_KIND_CONST, 1, 0, False, False), # 0x01
+    PrimparInfo(PRIMPAR_KIND_CONST, 2, 0, False, False), # 0x02
+    PrimparInfo(PRIMPAR_KIND_CONST, 3, 0, False, False), # 0x03
+    PrimparInfo(PRIMPAR_KIND_CONST, 4, 0, False, False), # 0x04
+    PrimparInfo(PRIMPAR_KIND_CONST, 5, 0, False, False), # 0x05
+    PrimparInfo(PRIMPAR_KIND_CONST, 6, 0, False, False), # 0x06
+    PrimparInfo(PRIMPAR_KIND_CONST, 7, 0, False, False), # 0x07
+    PrimparInfo(PRIMPAR_KIND_CONST, 8, 0, False, False), # 0x08
+    PrimparInfo(PRIMPAR_KIND_CONST, 9, 0, False, False), # 0x09
+    PrimparInfo(PRIMPAR_KIND_CONST, 10, 0, False, False), # 0x0A
+    PrimparInfo(PRIMPAR_KIND_CONST, 11, 0, False, False), # 0x0B
+    PrimparInfo(PRIMPAR_KIND_CONST, 12, 0, False, False), # 0x0C
+    PrimparInfo(PRIMPAR_KIND_CONST, 13, 0, False, False), # 0x0D
+    PrimparInfo(PRIMPAR_KIND_CONST, 14, 0, False, False), # 0x0E
+    PrimparInfo(PRIMPAR_KIND_CONST, 15, 0, False, False), # 0x0F
+    PrimparInfo(PRIMPAR_KIND_CONST, 16, 0, False, False), # 0x10
+    PrimparInfo(PRIMPAR_KIND_CONST, 17, 0, False, False), # 0x11
+    PrimparInfo(PRIMPAR_KIND_CONST, 18, 0, False, False), # 0x12
+    PrimparInfo(PRIMPAR_KIND_CONST, 19, 0, False, False), # 0x13
+    PrimparInfo(PRIMPAR_KIND_CONST, 20, 0, False, False), # 0x14
+    PrimparInfo(PRIMPAR_KIND_CONST, 21, 0, False, False), # 0x15
+    PrimparInfo(PRIMPAR_KIND_CONST, 22, 0, False, False), # 0x16
+    PrimparInfo(PRIMPAR_KIND_CONST, 23, 0, False, False), # 0x17
+    PrimparInfo(PRIMPAR_KIND_CONST, 24, 0, False, False), # 0x18
+    PrimparInfo(PRIMPAR_KIND_CONST, 25, 0, False, False), # 0x19
+    PrimparInfo(PRIMPAR_KIND_CONST, 26, 0, False, False), # 0x1A
+    PrimparInfo(PRIMPAR_KIND_CONST, 27, 0, False, False), # 0x1B
+    PrimparInfo(PRIMPAR_KIND_CONST, 28, 0, False, False), # 0x1C
+    PrimparInfo(PRIMPAR_KIND_CONST, 29, 0, False, False), # 0x1D
+    PrimparInfo(PRIMPAR_KIND_CONST, 30, 0, False, False), # 0x1E
+    PrimparInfo(PRIMPAR_KIND_CONST, 31, 0, False, False), # 0x1F
+    PrimparInfo(PRIMPAR_KIND_CONST, -32, 0, False, False), # 0x20
+    PrimparInfo(PRIMPAR_KIND_CONST, -31, 0, False, False), # 0x21
+    PrimparInfo(PRIMPAR_KIND_CONST, -30, 0, False, False), # 0x22
+    PrimparInfo(PRIMPAR_KIND_CONST, -29, 0, False, False), # 0x23
+    PrimparInfo(PRIMPAR_KIND_CONST, -28, 0, False, False), # 0x24
+    PrimparInfo(PRIMPAR_KIND_CONST, -27, 0, False, False), # 0x25
+    PrimparInfo(PRIMPAR_KIND_CONST, -26, 0, False, False), # 0x26
+    PrimparInfo(PRIMPAR_KIND_CONST, -25, 0, False, False), # 0x27
+    PrimparInfo(PRIMPAR_KIND_CONST, -24, 0, False, False), # 0x28
+    PrimparInfo(PRIMPAR_KIND_CONST, -23, 0, False, False), # 0x29
+    PrimparInfo(PRIMPAR_KIND_CONST, -22, 0, False, False), # 0x2A
+    PrimparInfo(PRIMPAR_KIND_CONST, -21, 0, False, False), # 0x2B
+    PrimparInfo(PRIMPAR_KIND_CONST, -20, 0, False, False), # 0x2C
+    PrimparInfo(PRIMPAR_KIND_CONST, -19, 0, False, False), # 0x2D
+    PrimparInfo(PRIMPAR_KIND_CONST, -18, 0, False, False), # 0x2E
+    PrimparInfo(PRIMPAR_KIND_CONST, -17, 0, False, False), # 0x2F
+    PrimparInfo(PRIMPAR_KIND_CONST, -16, 0, False, False), # 0x30
+    PrimparInfo(PRIMPAR_KIND_CONST, -15, 0, False, False), # 0x31
+    PrimparInfo(PRIMPAR_KIND_CONST, -14, 0, False, False), # 0x32
+    PrimparInfo(PRIMPAR_KIND_CONST, -13, 0, False, False), # 0x33
+    PrimparInfo(PRIMPAR_KIND_CONST, -12, 0, False, False), # 0x34
+    PrimparInfo(PRIMPAR_KIND_CONST, -11, 0, False, False), # 0x35
+    PrimparInfo(PRIMPAR_KIND_CONST, -10, 0, False, False), # 0x36
+    PrimparInfo(PRIMPAR_KIND_CONST, -9, 0, False, False), # 0x37
+    PrimparInfo(PRIMPAR_KIND_CONST, -8, 0, False, False), # 0x38
+    PrimparInfo(PRIMPAR_KIND_CONST, -7, 0, False, False), # 0x39
+    PrimparInfo(PRIMPAR_KIND_CONST, -6, 0, False, False), # 0x3A
+    PrimparInfo(PRIMPAR_KIND_CONST, -5, 0, False, False), # 0x3B
+    PrimparInfo(PRIMPAR_KIND_CONST, -4, 0, False, False), # 0x3C
+    PrimparInfo(PRIMPAR_KIND_CONST, -3, 0, False, False), # 0x3D
+    PrimparInfo(PRIMPAR_KIND_CONST, -2, 0, False, False), # 0x3E
+    PrimparInfo(PRIMPAR_KIND_CONST, -1, 0, False, False), # 0x3F
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 0, 0, False, False), # 0x40
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 1, 0, False, False), # 0x41
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 2, 0, False, False), # 0x42
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 3, 0, False, False), # 0x43
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 4, 0, False, False), # 0x44
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 5, 0, False, False), # 0x45
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 6, 0, False, False), # 0x46
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 7, 0, False, False), # 0x47
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 8, 0, False, False), # 0x48
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 9, 0, False, False), # 0x49
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 10, 0, False, False), # 0x4A
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 11, 0, False, False), # 0x4B
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 12, 0, False, False), # 0x4C
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 13, 0, False, False), # 0x4D
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 14, 0, False, False), # 0x4E
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 15, 0, False, False), # 0x4F
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 16, 0, False, False), # 0x50
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 17, 0, False, False), # 0x51
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 18, 0, False, False), # 0x52
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 19, 0, False, False), # 0x53
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 20, 0, False, False), # 0x54
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 21, 0, False, False), # 0x55
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 22, 0, False, False), # 0x56
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 23, 0, False, False), # 0x57
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 24, 0, False, False), # 0x58
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 25, 0, False, False), # 0x59
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 26, 0, False, False), # 0x5A
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 27, 0, False, False), # 0x5B
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 28, 0, False, False), # 0x5C
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 29, 0, False, False), # 0x5D
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 30, 0, False, False), # 0x5E
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 31, 0, False, False), # 0x5F
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 0, 0, True, False), # 0x60
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 1, 0, True, False), # 0x61
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 2, 0, True, False), # 0x62
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 3, 0, True, False), # 0x63
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 4, 0, True, False), # 0x64
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 5, 0, True, False), # 0x65
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 6, 0, True, False), # 0x66
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 7, 0, True, False), # 0x67
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 8, 0, True, False), # 0x68
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 9, 0, True, False), # 0x69
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 10, 0, True, False), # 0x6A
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 11, 0, True, False), # 0x6B
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 12, 0, True, False), # 0x6C
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 13, 0, True, False), # 0x6D
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 14, 0, True, False), # 0x6E
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 15, 0, True, False), # 0x6F
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 16, 0, True, False), # 0x70
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 17, 0, True, False), # 0x71
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 18, 0, True, False), # 0x72
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 19, 0, True, False), # 0x73
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 20, 0, True, False), # 0x74
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 21, 0, True, False), # 0x75
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 22, 0, True, False), # 0x76
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 23, 0, True, False), # 0x77
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 24, 0, True, False), # 0x78
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 25, 0, True, False), # 0x79
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 26, 0, True, False), # 0x7A
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 27, 0, True, False), # 0x7B
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 28, 0, True, False), # 0x7C
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 29, 0, True, False), # 0x7D
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 30, 0, True, False), # 0x7E
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 31, 0, True, False), # 0x7F
+    PrimparInfo(PRIMPAR_KIND_STRING, 0, 0, False, False), # 0x80
+    PrimparInfo(PRIMPAR_KIND_CONST, 0, 1, False, False), # 0x81
+    PrimparInfo(PRIMPAR_KIND_CONST, 0, 2, False, False), # 0x82
+    PrimparInfo(PRIMPAR_KIND_CONST, 0, 4, False, False), # 0x83
+    PrimparInfo(PRIMPAR_KIND_STRING, 0, 0, False, False), # 0x84
+    PrimparInfo(PRIMPAR_KIND_INVALID, 0, 0, False, False), # 0x85
+    PrimparInfo(PRIMPAR_KIND_INVALID, 0, 0, False, False), # 0x86
+    PrimparInfo(PRIMPAR_KIND_INVALID, 0, 0, False, False), # 0x87
+    PrimparInfo(PRIMPAR_KIND_STRING, 0, 0, False, False), # 0x88
+    PrimparInfo(PRIMPAR_KIND_CONST, 0, 1, False, False), # 0x89
+    PrimparInfo(PRIMPAR_KIND_CONST, 0, 2, False, False), # 0x8A
+    PrimparInfo(PRIMPAR_KIND_CONST, 0, 4, False, False), # 0x8B
+    PrimparInfo(PRIMPAR_KIND_STRING, 0, 0, False, False), # 0x8C
+    PrimparInfo(PRIMPAR_KIND_INVALID, 0, 0, False, False), # 0x8D
+    PrimparInfo(PRIMPAR_KIND_INVALID, 0, 0, False, False), # 0x8E
+    PrimparInfo(PRIMPAR_KIND_INVALID, 0, 0, False, False), # 0x8F
+    PrimparInfo(PRIMPAR_KIND_STRING, 0, 0, False, False), # 0x90
+    PrimparInfo(PRIMPAR_KIND_CONST, 0, 1, False, False), # 0x91
+    PrimparInfo(PRIMPAR_KIND_CONST, 0, 2, False, False), # 0x92
+    PrimparInfo(PRIMPAR_KIND_CONST, 0, 4, False, False), # 0x93
+    PrimparInfo(PRIMPAR_KIND_STRING, 0, 0, False, False), # 0x94
+    PrimparInfo(PRIMPAR_KIND_INVALID, 0, 0, False, False), # 0x95
+    PrimparInfo(PRIMPAR_KIND_INVALID, 0, 0, False, False), # 0x96
+    PrimparInfo(PRIMPAR_KIND_INVALID, 0, 0, False, False), # 0x97
+    PrimparInfo(PRIMPAR_KIND_STRING, 0, 0, False, False), # 0x98
+    PrimparInfo(PRIMPAR_KIND_CONST, 0, 1, False, False), # 0x99
+    PrimparInfo(PRIMPAR_KIND_CONST, 0, 2, False, False), # 0x9A
+    PrimparInfo(PRIMPAR_KIND_CONST, 0, 4, False, False), # 0x9B
+    PrimparInfo(PRIMPAR_KIND_STRING, 0, 0, False, False), # 0x9C
+    PrimparInfo(PRIMPAR_KIND_INVALID, 0, 0, False, False), # 0x9D
+    PrimparInfo(PRIMPAR_KIND_INVALID, 0, 0, False, False), # 0x9E
+    PrimparInfo(PRIMPAR_KIND_INVALID, 0, 0, False, False), # 0x9F
+    PrimparInfo(PRIMPAR_KIND_LABEL, 0, 1, False, False), # 0xA0
+    PrimparInfo(PRIMPAR_KIND_LABEL, 0, 1, False, False), # 0xA1
+    PrimparInfo(PRIMPAR_KIND_LABEL, 0, 1, False, False), # 0xA2
+    PrimparInfo(PRIMPAR_KIND_LABEL, 0, 1, False, False), # 0xA3
+    PrimparInfo(PRIMPAR_KIND_LABEL, 0, 1, False, False), # 0xA4
+    PrimparInfo(PRIMPAR_KIND_LABEL, 0, 1, False, False), # 0xA5
+    PrimparInfo(PRIMPAR_KIND_LABEL, 0, 1, False, False), # 0xA6
+    PrimparInfo(PRIMPAR_KIND_LABEL, 0, 1, False, False), # 0xA7
+    PrimparInfo(PRIMPAR_KIND_LABEL, 0, 1, False, False), # 0xA8
+    PrimparInfo(PRIMPAR_KIND_LABEL, 0, 1, False, False), # 0xA9
+    PrimparInfo(PRIMPAR_KIND_LABEL, 0, 1, False, False), # 0xAA
+    PrimparInfo(PRIMPAR_KIND_LABEL, 0, 1, False, False), # 0xAB
+    PrimparInfo(PRIMPAR_KIND_LABEL, 0, 1, False, False), # 0xAC
+    PrimparInfo(PRIMPAR_KIND_LABEL, 0, 1, False, False), # 0xAD
+    PrimparInfo(PRIMPAR_KIND_LABEL, 0, 1, False, False), # 0xAE
+    PrimparInfo(PRIMPAR_KIND_LABEL, 0, 1, False, False), # 0xAF
+    PrimparInfo(PRIMPAR_KIND_LABEL, 0, 1, False, False), # 0xB0
+    PrimparInfo(PRIMPAR_KIND_LABEL, 0, 1, False, False), # 0xB1
+    PrimparInfo(PRIMPAR_KIND_LABEL, 0, 1, False, False), # 0xB2
+    PrimparInfo(PRIMPAR_KIND_LABEL, 0, 1, False, False), # 0xB3
+    PrimparInfo(PRIMPAR_KIND_LABEL, 0, 1, False, False), # 0xB4
+    PrimparInfo(PRIMPAR_KIND_LABEL, 0, 1, False, False), # 0xB5
+    PrimparInfo(PRIMPAR_KIND_LABEL, 0, 1, False, False), # 0xB6
+    PrimparInfo(PRIMPAR_KIND_LABEL, 0, 1, False, False), # 0xB7
+    PrimparInfo(PRIMPAR_KIND_LABEL, 0, 1, False, False), # 0xB8
+    PrimparInfo(PRIMPAR_KIND_LABEL, 0, 1, False, False), # 0xB9
+    PrimparInfo(PRIMPAR_KIND_LABEL, 0, 1, False, False), # 0xBA
+    PrimparInfo(PRIMPAR_KIND_LABEL, 0, 1, False, False), # 0xBB
+    PrimparInfo(PRIMPAR_KIND_LABEL, 0, 1, False, False), # 0xBC
+    PrimparInfo(PRIMPAR_KIND_LABEL, 0, 1, False, False), # 0xBD
+    PrimparInfo(PRIMPAR_KIND_LABEL, 0, 1, False, False), # 0xBE
+    PrimparInfo(PRIMPAR_KIND_LABEL, 0, 1, False, False), # 0xBF
+    PrimparInfo(PRIMPAR_KIND_INVALID, 0, 0, False, False), # 0xC0
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 0, 1, False, False), # 0xC1
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 0, 2, False, False), # 0xC2
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 0, 4, False, False), # 0xC3
+    PrimparInfo(PRIMPAR_KIND_INVALID, 0, 0, False, False), # 0xC4
+    PrimparInfo(PRIMPAR_KIND_INVALID, 0, 0, False, False), # 0xC5
+    PrimparInfo(PRIMPAR_KIND_INVALID, 0, 0, False, False), # 0xC6
+    PrimparInfo(PRIMPAR_KIND_INVALID, 0, 0, False, False), # 0xC7
+    PrimparInfo(PRIMPAR_KIND_INVALID, 0, 0, False, False), # 0xC8
+    PrimparInfo(PRIMPAR_KIND_ADDR, 0, 1, False, False), # 0xC9
+    PrimparInfo(PRIMPAR_KIND_ADDR, 0, 2, False, False), # 0xCA
+    PrimparInfo(PRIMPAR_KIND_ADDR, 0, 4, False, False), # 0xCB
+    PrimparInfo(PRIMPAR_KIND_INVALID, 0, 0, False, False), # 0xCC
+    PrimparInfo(PRIMPAR_KIND_INVALID, 0, 0, False, False), # 0xCD
+    PrimparInfo(PRIMPAR_KIND_INVALID, 0, 0, False, False), # 0xCE
+    PrimparInfo(PRIMPAR_KIND_INVALID, 0, 0, False, False), # 0xCF
+    PrimparInfo(PRIMPAR_KIND_INVALID, 0, 0, False, False), # 0xD0
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 0, 1, False, True), # 0xD1
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 0, 2, False, True), # 0xD2
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 0, 4, False, True), # 0xD3
+    PrimparInfo(PRIMPAR_KIND_INVALID, 0, 0, False, False), # 0xD4
+    PrimparInfo(PRIMPAR_KIND_INVALID, 0, 0, False, False), # 0xD5
+    PrimparInfo(PRIMPAR_KIND_INVALID, 0, 0, False, False), # 0xD6
+    PrimparInfo(PRIMPAR_KIND_INVALID, 0, 0, False, False), # 0xD7
+    PrimparInfo(PRIMPAR_KIND_INVALID, 0, 0, False, False), # 0xD8
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 0, 1, False, True), # 0xD9
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 0, 2, False, True), # 0xDA
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 0, 4, False, True), # 0xDB
+    PrimparInfo(PRIMPAR_KIND_INVALID, 0, 0, False, False), # 0xDC
+    PrimparInfo(PRIMPAR_KIND_INVALID, 0, 0, False, False), # 0xDD
+    PrimparInfo(PRIMPAR_KIND_INVALID, 0, 0, False, False), # 0xDE
+    PrimparInfo(PRIMPAR_KIND_INVALID, 0, 0, False, False), # 0xDF
+    PrimparInfo(PRIMPAR_KIND_INVALID, 0, 0, True, False), # 0xE0
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 0, 1, True, False), # 0xE1
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 0, 2, True, False), # 0xE2
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 0, 4, True, False), # 0xE3
+    PrimparInfo(PRIMPAR_KIND_INVALID, 0, 0, True, False), # 0xE4
+    PrimparInfo(PRIMPAR_KIND_INVALID, 0, 0, True, False), # 0xE5
+    PrimparInfo(PRIMPAR_KIND_INVALID, 0, 0, True, False), # 0xE6
+    PrimparInfo(PRIMPAR_KIND_INVALID, 0, 0, True, False), # 0xE7
+    PrimparInfo(PRIMPAR_KIND_INVALID, 0, 0, True, False), # 0xE8
+    PrimparInfo(PRIMPAR_KIND_ADDR, 0, 1, True, False), # 0xE9
+    PrimparInfo(PRIMPAR_KIND_ADDR, 0, 2, True, False), # 0xEA
+    PrimparInfo(PRIMPAR_KIND_ADDR, 0, 4, True, False), # 0xEB
+    PrimparInfo(PRIMPAR_KIND_INVALID, 0, 0, True, False), # 0xEC
+    PrimparInfo(PRIMPAR_KIND_INVALID, 0, 0, True, False), # 0xED
+    PrimparInfo(PRIMPAR_KIND_INVALID, 0, 0, True, False), # 0xEE
+    PrimparInfo(PRIMPAR_KIND_INVALID, 0, 0, True, False), # 0xEF
+    PrimparInfo(PRIMPAR_KIND_INVALID, 0, 0, True, False), # 0xF0
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 0, 1, True, True), # 0xF1
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 0, 2, True, True), # 0xF2
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 0, 4, True, True), # 0xF3
+    PrimparInfo(PRIMPAR_KIND_INVALID, 0, 0, True, False), # 0xF4
+    PrimparInfo(PRIMPAR_KIND_INVALID, 0, 0, True, False), # 0xF5
+    PrimparInfo(PRIMPAR_KIND_INVALID, 0, 0, True, False), # 0xF6
+    PrimparInfo(PRIMPAR_KIND_INVALID, 0, 0, True, False), # 0xF7
+    PrimparInfo(PRIMPAR_KIND_INVALID, 0, 0, True, False), # 0xF8
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 0, 1, True, True), # 0xF9
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 0, 2, True, True), # 0xFA
+    PrimparInfo(PRIMPAR_KIND_VARIABLE, 0, 4, True, True), # 0xFB
+    PrimparInfo(PRIMPAR_KIND_INVALID, 0, 0, True, False), # 0xFC
+    PrimparInfo(PRIMPAR_KIND_INVALID, 0, 0, True, False), # 0xFD
+    PrimparInfo(PRIMPAR_KIND_INVALID, 0, 0, True, False), # 0xFE
+    PrimparInfo(PRIMPAR_KIND_INVALID, 0, 0, True, False), # 0xFF
+)
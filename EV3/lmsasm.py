@@ -0,0 +1,559 @@
+#!/usr/bin/env python3
+
+# The MIT License (MIT)
+
+# Copyright (c) 2026 lms-hacker-tools contributors
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Assembler for .lms files, e.g. the output of lmsdisasm.py, so programs can
+# be rebuilt without starting a JVM for assembler.jar:
+#
+#     python lmsasm.py input.lms -o output.rbf
+#
+# Constants are encoded with as few bytes as possible. Jumps to labels always
+# use a 4 byte offset, so every instruction has its final size as soon as it
+# is encoded and labels are resolved by patching the offsets once the object
+# is complete.
+
+from __future__ import print_function
+import argparse
+import io
+import os
+import re
+import struct
+import sys
+
+from ctypes import sizeof
+
+import lms2012
+from lms2012 import *
+from lmsdisasm import ENCODING
+
+# byte code version used when the .lms file doesn't have a
+# "// Byte code version:" line like the ones written by lmsdisasm.py
+BYTE_CODE_VERSION = 109
+
+_version_line = re.compile(r'^//\s*Byte code version:\s*(\d+)\.(\d+)\s*$')
+_instruction = re.compile(r'^(\w+)\s*\((.*)\)$')
+_argument = re.compile(r"(?:'[^']*'|[^,'])+")
+_label = re.compile(r'^(\w+):$')
+_integer = re.compile(r'^[-+]?(0[xX][0-9a-fA-F]+|\d+)$')
+_label_number = re.compile(r'^LABEL(\d+)$')
+_object_number = re.compile(r'^OBJECT(\d+)$')
+_block_line = re.compile(r'^block\s+(\w+)\s*\{?\s*//\s*owner:\s*(\w+),\s*trigger count:\s*(-?\d+)\s*$')
+_global_address = re.compile(r'^GLOBAL(\d+)$')
+_local_address = re.compile(r'^LOCAL(\d+)_(\d+)$')
+
+# size and alignment of the variables declared by each data type. Arrays
+# and strings are followed by their number of elements.
+_data_types = {
+    'DATA8':  (1, 1),
+    'DATA16': (2, 2),
+    'DATA32': (4, 4),
+    'DATAF':  (4, 4),
+    'HANDLE': (2, 2),
+    'DATAS':  (1, 1),
+    'ARRAY8':  (1, 1),
+    'ARRAY16': (2, 2),
+    'ARRAY32': (4, 4),
+    'ARRAYF':  (4, 4),
+}
+
+_object_types = ('vmthread', 'subcall', 'block')
+
+_float_names = {
+    'DATAF_MAX': DATAF_MAX,
+    'DATAF_MIN': DATAF_MIN,
+    'DATAF_NAN': DATAF_NAN,
+}
+
+_string_escapes = {
+    't': '\t',
+    'r': '\r',
+    'n': '\n',
+    'q': "'",
+}
+
+# Error in the .lms source, `line` is the line number.
+class AssemblerError(ValueError):
+    def __init__(self, line, message):
+        ValueError.__init__(self, "line {0}: {1}".format(line, message))
+        self.line = line
+        self.message = message
+
+def encode_const(value):
+    if LC0_MIN <= value <= LC0_MAX:
+        return struct.pack('<B', value & PRIMPAR_VALUE)
+    if DATA8_MIN <= value <= DATA8_MAX:
+        return struct.pack('<Bb', PRIMPAR_LONG | PRIMPAR_1_BYTE, value)
+    if DATA16_MIN <= value <= DATA16_MAX:
+        return struct.pack('<Bh', PRIMPAR_LONG | PRIMPAR_2_BYTES, value)
+    return struct.pack('<Bi', PRIMPAR_LONG | PRIMPAR_4_BYTES, value)
+
+def encode_const32(value):
+    return struct.pack('<Bi', PRIMPAR_LONG | PRIMPAR_4_BYTES, value)
+
+def encode_float(value):
+    return struct.pack('<Bf', PRIMPAR_LONG | PRIMPAR_4_BYTES, value)
+
+def encode_variable(address, is_global=False, is_handle=False):
+    scope = PRIMPAR_GLOBAL if is_global else PRIMPAR_LOCAL
+    if address <= PRIMPAR_INDEX and not is_handle:
+        return struct.pack('<B', PRIMPAR_VARIABLE | scope | address)
+    first_byte = PRIMPAR_LONG | PRIMPAR_VARIABLE | scope
+    if is_handle:
+        first_byte |= PRIMPAR_HANDLE
+    if address <= DATA8_MAX:
+        return struct.pack('<Bb', first_byte | PRIMPAR_1_BYTE, address)
+    if address <= DATA16_MAX:
+        return struct.pack('<Bh', first_byte | PRIMPAR_2_BYTES, address)
+    return struct.pack('<Bi', first_byte | PRIMPAR_4_BYTES, address)
+
+def encode_string(text):
+    return struct.pack('<B', PRIMPAR_LONG | PRIMPAR_STRING) + text.encode(ENCODING) + b'\0'
+
+def encode_label(number):
+    return struct.pack('<BB', PRIMPAR_LONG | PRIMPAR_CONST | PRIMPAR_LABEL, number)
+
+def parse_string(text):
+    # Returns the value of a quoted string with lmsdisasm.format_string()
+    # escapes.
+    value = text[1:-1]
+    if '\\' not in value:
+        return value
+    parts = value.split('\\')
+    chars = [parts[0]]
+    for part in parts[1:]:
+        if part and part[0] in _string_escapes:
+            chars.append(_string_escapes[part[0]] + part[1:])
+        else:
+            chars.append('\\' + part)
+    return ''.join(chars)
+
+def split_arguments(text):
+    # Splits the arguments of an instruction at the commas that aren't in a
+    # string.
+    return [arg.strip() for arg in _argument.findall(text) if arg.strip()]
+
+def strip_comment(line):
+    # Removes a // comment that isn't inside a string.
+    start = line.find('//')
+    if start < 0:
+        return line
+    if "'" not in line[:start]:
+        return line[:start]
+    quoted = False
+    for i, ch in enumerate(line):
+        if ch == "'":
+            quoted = not quoted
+        elif not quoted and line.startswith('//', i):
+            return line[:i]
+    return line
+
+# Variables of one scope (the globals or the locals of an object) and
+# their addresses
+class Variables(object):
+    def __init__(self, is_global):
+        self.is_global = is_global
+        self.names = {}
+        self.size = 0
+
+    def declare(self, line, name, size, alignment=1):
+        if name in self.names:
+            raise AssemblerError(line, "{0} is already declared".format(name))
+        self.size += -self.size % alignment
+        self.names[name] = self.size
+        self.size += size
+
+# Object being assembled. `params` is the list of (Callparam, string size)
+# tuples of a subcall, `instructions` the list of (line, name, arguments)
+# and `labels` the instruction index of each label.
+class Source(object):
+    def __init__(self, line, type, name, id):
+        self.line = line
+        self.type = type
+        self.name = name
+        self.id = id
+        self.params = []
+        self.locals = Variables(False)
+        self.instructions = []
+        self.labels = {}
+        # header fields of a block, see lmsdisasm.format_code()
+        self.owner = None
+        self.trigger_count = 0
+
+class Assembler(object):
+    def __init__(self):
+        self.version = None
+        self.defines = {}
+        self.globals = Variables(True)
+        self.objects = []
+        self.object_ids = {}
+
+    def parse(self, text):
+        obj = None
+        opened = False
+        for number, line in enumerate(text.splitlines(), 1):
+            match = _version_line.match(line.strip())
+            if match and self.version is None:
+                self.version = int(match.group(1)) * 100 + int(match.group(2))
+            block = _block_line.match(line.strip())
+            line = strip_comment(line).strip()
+            if not line:
+                continue
+            if obj is not None and not opened:
+                if line != '{':
+                    raise AssemblerError(number, "expecting {")
+                opened = True
+                continue
+            if obj is None:
+                obj = self.parse_global(number, line)
+                if obj and block:
+                    obj.owner = (number, block.group(2))
+                    obj.trigger_count = int(block.group(3))
+                if obj and line.endswith('{'):
+                    opened = True
+            elif line == '}':
+                obj = None
+                opened = False
+            else:
+                self.parse_object_line(number, line, obj)
+        if obj is not None:
+            raise AssemblerError(obj.line, "{0} isn't closed".format(obj.name))
+
+    def parse_global(self, number, line):
+        # Returns the Source of an object that starts on this line.
+        words = line.rstrip('{').split()
+        if not words:
+            raise AssemblerError(number, "unexpected {")
+        if words[0] in _object_types and len(words) == 2:
+            name = words[1]
+            if name in self.object_ids:
+                raise AssemblerError(number, "{0} is already declared".format(name))
+            obj = Source(number, words[0], name, len(self.objects) + 1)
+            self.objects.append(obj)
+            self.object_ids[name] = obj.id
+            return obj
+        if words[0] == 'define' and len(words) == 3:
+            self.defines[words[1]] = self.parse_integer(number, words[2])
+            return None
+        self.parse_declaration(number, words, self.globals)
+        return None
+
+    def parse_declaration(self, number, words, scope):
+        if words[0] not in _data_types:
+            raise AssemblerError(number, "unexpected {0!r}".format(' '.join(words)))
+        size, alignment = _data_types[words[0]]
+        if words[0].startswith('ARRAY') or words[0] == 'DATAS':
+            if len(words) != 3:
+                raise AssemblerError(number, "expecting {0} name size".format(words[0]))
+            size *= self.parse_integer(number, words[2])
+        elif len(words) != 2:
+            raise AssemblerError(number, "expecting {0} name".format(words[0]))
+        scope.declare(number, words[1], size, alignment)
+
+    def parse_object_line(self, number, line, obj):
+        match = _instruction.match(line)
+        if match:
+            obj.instructions.append((number, match.group(1), split_arguments(match.group(2))))
+            return
+        match = _label.match(line)
+        if match:
+            if match.group(1) in obj.labels:
+                raise AssemblerError(number, "label {0} is already declared".format(match.group(1)))
+            obj.labels[match.group(1)] = len(obj.instructions)
+            return
+        words = line.split()
+        if words[0] in Callparam.__members__:
+            if obj.type != 'subcall':
+                raise AssemblerError(number, "parameters can only be declared in a subcall")
+            if obj.locals.size != sum(string_size or param.data_format.size
+                                      for param, string_size in obj.params):
+                raise AssemblerError(number, "parameters must be declared before variables")
+            param = Callparam[words[0]]
+            string_size = 0
+            if param.data_format is DataFormat.DATAS:
+                if len(words) != 3:
+                    raise AssemblerError(number, "expecting {0} name size".format(words[0]))
+                string_size = self.parse_integer(number, words[2])
+            elif len(words) != 2:
+                raise AssemblerError(number, "expecting {0} name".format(words[0]))
+            obj.params.append((param, string_size))
+            obj.locals.declare(number, words[1], string_size or param.data_format.size)
+            return
+        self.parse_declaration(number, words, obj.locals)
+
+    def object_id(self, number, text):
+        # id of an object name, or of OBJECTn for objects that aren't declared
+        if text in self.object_ids:
+            return self.object_ids[text]
+        match = _object_number.match(text)
+        if match:
+            return int(match.group(1))
+        return self.parse_integer(number, text)
+
+    def parse_integer(self, number, text):
+        if _integer.match(text):
+            return int(text, 16) if 'x' in text.lower() else int(text)
+        if text in self.defines:
+            return self.defines[text]
+        value = getattr(lms2012, text, None)
+        if isinstance(value, int) and not isinstance(value, bool):
+            return value
+        raise AssemblerError(number, "expecting a number instead of {0!r}".format(text))
+
+    def assemble(self):
+        # Returns the bytes of the .rbf file.
+        signatures = dict((obj.id, tuple(param.param for param, string_size in obj.params))
+                          for obj in self.objects if obj.type == 'subcall')
+        num_objs = len(self.objects)
+        offset = sizeof(ProgramHeader) + num_objs * sizeof(ObjectHeader)
+        headers = []
+        bodies = []
+        for obj in self.objects:
+            body = self.encode_object(obj, signatures)
+            if obj.type == 'vmthread':
+                owner, trigger_count = 0, 0
+            elif obj.type == 'subcall':
+                owner, trigger_count = 0, 1
+            elif obj.owner is None:
+                # blocks belong to the first object unless the .lms text says
+                # otherwise
+                owner, trigger_count = 1, obj.trigger_count
+            else:
+                owner, trigger_count = self.object_id(*obj.owner), obj.trigger_count
+            headers.append(bytes(ObjectHeader(offset, owner, trigger_count, obj.locals.size)))
+            bodies.append(body)
+            offset += len(body)
+        version = BYTE_CODE_VERSION if self.version is None else self.version
+        header = ProgramHeader(b'LEGO', offset, version, num_objs, self.globals.size)
+        return bytes(header) + b''.join(headers) + b''.join(bodies)
+
+    def encode_object(self, obj, signatures):
+        code = bytearray()
+        if obj.type == 'subcall':
+            code.append(len(obj.params))
+            for param, string_size in obj.params:
+                code.append(param.value)
+                if string_size:
+                    code.append(string_size)
+        # offset in code of each instruction and of the end of the object
+        offsets = []
+        # (offset of the 4 byte constant, label, line) of each jump
+        fixups = []
+        for number, name, args in obj.instructions:
+            offsets.append(len(code))
+            try:
+                self.encode_instruction(obj, signatures, number, name, args, code, fixups)
+            except struct.error as e:
+                raise AssemblerError(number, "{0}: {1}".format(name, e))
+        offsets.append(len(code))
+        code.append(Op.OBJECT_END.value)
+        for offset, label, number in fixups:
+            if label not in obj.labels:
+                raise AssemblerError(number, "unknown label {0}".format(label))
+            target = offsets[obj.labels[label]]
+            struct.pack_into('<i', code, offset + 1, target - (offset + 5))
+        return bytes(code)
+
+    def encode_instruction(self, obj, signatures, number, name, args, code, fixups):
+        try:
+            op = Op[name]
+        except KeyError:
+            raise AssemblerError(number, "unknown opcode {0}".format(name))
+        if op is Op.OBJECT_END:
+            raise AssemblerError(number, "OBJECT_END is added by the assembler")
+        code.append(op.value)
+        args = list(args)
+        if op is Op.CALL:
+            if not args:
+                raise AssemblerError(number, "CALL needs an object")
+            target = args.pop(0)
+            id = self.object_ids.get(target)
+            if id is None:
+                id = self.parse_integer(number, target)
+            code += encode_const(id)
+            params = signatures.get(id)
+            if params is None or len(params) != len(args):
+                params = (Param.PARV,) * len(args)
+            code += encode_const(len(args))
+            for param, arg in zip(params, args):
+                code += self.encode_argument(obj, number, param, arg)
+            return
+        params = list(op.params)
+        jump_label = None
+        if op.name.startswith('JR') and args and self.is_label(obj, args[-1]):
+            jump_label = args.pop()
+            params.pop()
+        if self.encode_params(obj, number, params, args, 0, code, False) < len(args):
+            raise AssemblerError(number, "too many arguments for {0}".format(name))
+        if jump_label is not None:
+            fixups.append((len(code), jump_label, number))
+            code += encode_const32(0)
+
+    def encode_params(self, obj, number, params, args, pos, code, keep_count):
+        # Encodes the arguments from args[pos] on the same way as
+        # lmsdisasm.parse_params() decodes them. Returns the position of the
+        # first argument that is left.
+        values = -1
+        value = None
+        for param in params:
+            if param is Param.PARVALUES:
+                if value is None:
+                    raise AssemblerError(number, "expecting constant array size")
+                values = value
+                continue
+            if values >= 0:
+                for i in range(values):
+                    pos = self.encode_next(obj, number, param, args, pos, code)
+                values = -1
+            elif isinstance(param, Subparam):
+                if pos >= len(args):
+                    raise AssemblerError(number, "missing subcode")
+                try:
+                    subcode = param.subcode_type[args[pos]]
+                except KeyError:
+                    raise AssemblerError(number, "unknown subcode {0}".format(args[pos]))
+                code += encode_const(subcode.value)
+                pos = self.encode_params(obj, number, subcode.params, args, pos + 1, code, True)
+            elif param is Param.PARNO:
+                # the disassembler only writes the count of a subcode's
+                # parameters and only if it isn't 0
+                if not keep_count:
+                    count = len(args) - pos
+                elif pos < len(args):
+                    count = self.parse_integer(number, args[pos])
+                    pos += 1
+                else:
+                    count = 0
+                code += encode_const(count)
+                for i in range(count):
+                    pos = self.encode_next(obj, number, Param.PARV, args, pos, code)
+            else:
+                if pos < len(args):
+                    value = self.constant(args[pos])
+                pos = self.encode_next(obj, number, param, args, pos, code)
+        return pos
+
+    def encode_next(self, obj, number, param, args, pos, code):
+        if pos >= len(args):
+            raise AssemblerError(number, "missing argument")
+        code += self.encode_argument(obj, number, param, args[pos])
+        return pos + 1
+
+    def encode_argument(self, obj, number, param, text):
+        if text.startswith("'"):
+            if len(text) < 2 or not text.endswith("'"):
+                raise AssemblerError(number, "unterminated string")
+            return encode_string(parse_string(text))
+        if text.startswith('@'):
+            scope, address = self.variable(obj, number, text[1:])
+            return encode_variable(address, scope.is_global, True)
+        if _integer.match(text):
+            value = self.parse_integer(number, text)
+            if param is Param.PARF and not LC0_MIN <= value <= LC0_MAX:
+                return encode_float(value)
+            return encode_const(value)
+        if self.is_variable(obj, text):
+            scope, address = self.variable(obj, number, text)
+            return encode_variable(address, scope.is_global)
+        if text in self.object_ids:
+            return encode_const(self.object_ids[text])
+        if text in _float_names:
+            return encode_const32(_float_names[text])
+        match = _label_number.match(text)
+        if match:
+            return encode_label(int(match.group(1)))
+        if text.endswith('F'):
+            try:
+                return encode_float(float(text[:-1]))
+            except ValueError:
+                pass
+        return encode_const(self.parse_integer(number, text))
+
+    def constant(self, text):
+        # Returns the value of an integer constant argument or None.
+        if _integer.match(text):
+            return int(text, 16) if 'x' in text.lower() else int(text)
+        return self.defines.get(text)
+
+    def variable(self, obj, number, name):
+        # Returns the scope and address of a variable, locals hide globals.
+        for scope in (obj.locals, self.globals):
+            if name in scope.names:
+                return scope, scope.names[name]
+        # lmsdisasm.py names variables after their address, but can't
+        # declare the ones in the middle of a subcall parameter
+        match = _global_address.match(name)
+        if match:
+            return self.globals, int(match.group(1))
+        match = _local_address.match(name)
+        if match and int(match.group(1)) == obj.id:
+            return obj.locals, int(match.group(2))
+        raise AssemblerError(number, "unknown variable {0}".format(name))
+
+    def is_variable(self, obj, text):
+        return text in obj.locals.names or text in self.globals.names or \
+            bool(_global_address.match(text)) or bool(_local_address.match(text))
+
+    def is_label(self, obj, text):
+        return text in obj.labels or (text.isidentifier() and not self.is_variable(obj, text)
+                                      and text not in self.defines)
+
+def assemble(text):
+    # Returns the bytes of the .rbf file for the .lms source text.
+    assembler = Assembler()
+    assembler.parse(text)
+    return assembler.assemble()
+
+def main():
+    parser = argparse.ArgumentParser(description='Assemble lms2012 byte codes.')
+    parser.add_argument('input', nargs='+',
+                       help='The .lms files to assemble.')
+    parser.add_argument('-o', '--output',
+                       help='The .rbf file that will contain the result (only for a single input). '
+                            'By default, each .rbf file is written next to its .lms file.')
+    parser.add_argument('-d', '--output-dir',
+                       help='Directory for the .rbf files.')
+    args = parser.parse_args()
+    if args.output and len(args.input) > 1:
+        parser.error("--output can only be used with a single input")
+
+    failed = 0
+    for path in args.input:
+        if args.output:
+            output = args.output
+        else:
+            name = os.path.splitext(os.path.basename(path))[0] + '.rbf'
+            output = os.path.join(args.output_dir or os.path.dirname(path), name)
+        try:
+            with io.open(path, encoding=ENCODING) as infile:
+                data = assemble(infile.read())
+        except (IOError, ValueError) as e:
+            print("{0}: {1}".format(path, e), file=sys.stderr)
+            failed += 1
+            continue
+        with open(output, 'wb') as outfile:
+            outfile.write(data)
+    if failed:
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+
+# The MIT License (MIT)
+
+# Copyright (c) 2026 lms-hacker-tools contributors
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Benchmarks for lmsdisasm.py. Generates a corpus of synthetic .rbf files
+# and measures the decoder and the text output separately:
+#
+#     python lmsbench.py generate corpus/ --files 10 --size 65536
+#     python lmsbench.py run corpus/ -o results.json
+#     python lmsbench.py run --baseline results.json
+#
+# `run` without inputs benchmarks a corpus that is generated in memory with
+# the same options as `generate`.
+
+from __future__ import print_function
+import argparse
+import gc
+import glob
+import json
+import os
+import platform
+import random
+import struct
+import sys
+import time
+import tracemalloc
+
+from lms2012 import *
+import lmsdisasm
+from lmsasm import encode_const, encode_const32, encode_float, encode_variable, \
+    encode_string, encode_label
+
+# Relative weights of the opcodes in a generated program. `all` uses every
+# opcode (except OBJECT_END) with the same weight.
+MIXES = {
+    'typical': {
+        'MOVE8_8': 8, 'MOVE16_16': 4, 'MOVE32_32': 4, 'MOVEF_F': 6,
+        'ADD8': 2, 'ADD16': 2, 'ADD32': 4, 'ADDF': 4, 'SUB32': 2, 'MUL16': 1, 'DIVF': 2,
+        'CP_LT8': 2, 'CP_EQ32': 2, 'CP_LTF': 2,
+        'JR': 3, 'JR_FALSE': 4, 'JR_TRUE': 2, 'JR_LT8': 2,
+        'CALL': 4, 'UI_DRAW': 4, 'UI_READ': 2, 'INPUT_DEVICE': 3, 'INPUT_READ': 2,
+        'OUTPUT_POWER': 2, 'OUTPUT_START': 2, 'TIMER_WAIT': 2, 'TIMER_READY': 2,
+        'ARRAY': 2, 'ARRAY_READ': 2, 'ARRAY_WRITE': 2, 'STRINGS': 2, 'INIT_BYTES': 1,
+        'MATH': 2, 'SOUND': 1, 'NOP': 1,
+    },
+    'all': None,
+}
+
+# parameter types of the subcall that generated programs CALL
+_call_signature = (Callparam.IN_8, Callparam.IN_16, Callparam.IN_32, Callparam.IN_F)
+
+_local_bytes = 64
+_global_bytes = 64
+
+_words = ('Hello', 'EV3', 'motor', 'sensor', 'ui/icon', '../prjs/demo', 'tab\there')
+
+# Generates random, valid programs. Each program has a subcall as object 2
+# (when there is more than one object) that the CALL instructions of the
+# other objects call with matching parameters.
+class CorpusGenerator(object):
+    def __init__(self, size=65536, objects=4, mix='typical', seed=0):
+        self.size = size
+        self.objects = objects
+        self.random = random.Random(seed)
+        weights = MIXES[mix]
+        if weights is None:
+            weights = dict((op.name, 1) for op in Op if op is not Op.OBJECT_END)
+        if objects < 2:
+            weights = dict((name, weight) for name, weight in weights.items() if name != 'CALL')
+        self.ops = [Op[name] for name in sorted(weights)]
+        self.weights = [weights[op.name] for op in self.ops]
+
+    def program(self):
+        num_objs = self.objects
+        code_size = max(self.size - 16 - 12 * num_objs, 0) // num_objs
+        bodies = []
+        for id in range(1, num_objs + 1):
+            if id == 2:
+                body = struct.pack('<B', len(_call_signature))
+                body += b''.join(struct.pack('<B', param.value) for param in _call_signature)
+            else:
+                body = b''
+            body += self.code(code_size - len(body))
+            bodies.append(body)
+        offset = 16 + 12 * num_objs
+        headers = []
+        for id, body in enumerate(bodies, 1):
+            trigger_count = 1 if id == 2 else 0
+            headers.append(bytes(ObjectHeader(offset, 0, trigger_count, _local_bytes)))
+            offset += len(body)
+        header = ProgramHeader(b'LEGO', offset, 109, num_objs, _global_bytes)
+        return bytes(header) + b''.join(headers) + b''.join(bodies)
+
+    def code(self, size):
+        instructions = []
+        length = 0
+        while length < size:
+            op = self.random.choices(self.ops, self.weights)[0]
+            instruction = self.instruction(op)
+            instructions.append(instruction)
+            length += len(instruction)
+        instructions.append(struct.pack('<B', Op.OBJECT_END.value))
+        return b''.join(instructions)
+
+    def instruction(self, op):
+        code = struct.pack('<B', op.value)
+        if op is Op.CALL:
+            code += encode_const(2) + encode_const(len(_call_signature))
+            return code + self.params([param.param for param in _call_signature])
+        params = list(op.params)
+        if op.name.startswith('JR'):
+            # jump to the next instruction so that every target is valid
+            return code + self.params(params[:-1]) + encode_const32(0)
+        return code + self.params(params)
+
+    def params(self, params):
+        code = b''
+        i = 0
+        while i < len(params):
+            param = params[i]
+            if i + 2 < len(params) and params[i+1] is Param.PARVALUES:
+                count = self.random.randint(0, 4)
+                code += encode_const(count)
+                code += b''.join(self.param(params[i+2]) for n in range(count))
+                i += 3
+                continue
+            if param is Param.PARNO:
+                count = self.random.randint(0, 3)
+                code += encode_const(count)
+                code += b''.join(self.param(Param.PARV) for n in range(count))
+            elif isinstance(param, Subparam):
+                subcode = self.random.choice(list(param.subcode_type))
+                code += encode_const(subcode.value) + self.params(list(subcode.params))
+            else:
+                code += self.param(param)
+            i += 1
+        return code
+
+    def param(self, param):
+        choice = self.random.random()
+        if param is Param.PARLAB:
+            return encode_label(self.random.randint(0, 255))
+        if choice < 0.4:
+            address = self.random.randrange(0, _local_bytes, 4)
+            return encode_variable(address, choice < 0.1, choice < 0.05)
+        if param is Param.PARV:
+            param = self.random.choice((Param.PAR8, Param.PAR16, Param.PAR32, Param.PARF, Param.PARS))
+        if param is Param.PARF:
+            return encode_float(self.random.choice((0.0, 0.5, -1.25, 100.0)))
+        if param is Param.PARS:
+            return encode_string(self.random.choice(_words))
+        if param is Param.PAR8:
+            return encode_const(self.random.randint(DATA8_MIN, DATA8_MAX))
+        if param is Param.PAR16:
+            return encode_const(self.random.randint(DATA16_MIN, DATA16_MAX))
+        return encode_const(self.random.randint(DATA32_MIN, DATA32_MAX))
+
+def find_inputs(inputs):
+    paths = []
+    for path in inputs:
+        if os.path.isdir(path):
+            paths.extend(sorted(glob.glob(os.path.join(path, '*.rbf'))))
+        else:
+            paths.append(path)
+    return paths
+
+def decode(data):
+    # decoder stage: headers and every instruction of every object
+    program = lmsdisasm.disassemble(data)
+    decoded = []
+    for obj in program.objects:
+        context = obj.new_context()
+        decoded.append((obj, context, list(obj.instructions(context))))
+    return decoded
+
+def output(decoded):
+    # output stage: text of already decoded objects
+    return [lmsdisasm.format_code(obj, context, code)[0] for obj, context, code in decoded]
+
+def measure(func, args, repeat):
+    # Returns the best time of `repeat` runs and the peak memory allocated
+    # by one more run under tracemalloc (which is too slow to time).
+    best = None
+    for i in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func(*args)
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func(*args)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return best, peak
+
+def run(corpus, repeat):
+    # corpus is a list of (name, bytes)
+    total_bytes = 0
+    total_instructions = 0
+    stages = {'decode': [0.0, 0], 'output': [0.0, 0]}
+    for name, data in corpus:
+        decoded = decode(data)
+        total_bytes += len(data)
+        total_instructions += sum(len(code) for obj, context, code in decoded)
+        for stage, func, args in (('decode', decode, (data,)), ('output', output, (decoded,))):
+            seconds, peak = measure(func, args, repeat)
+            stages[stage][0] += seconds
+            stages[stage][1] = max(stages[stage][1], peak)
+    results = {}
+    for stage, (seconds, peak) in stages.items():
+        results[stage] = {
+            'seconds': seconds,
+            'instructions_per_second': total_instructions / seconds if seconds else None,
+            'bytes_per_second': total_bytes / seconds if seconds else None,
+            'peak_memory_bytes': peak,
+        }
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'repeat': repeat,
+        'files': len(corpus),
+        'bytes': total_bytes,
+        'instructions': total_instructions,
+        'stages': results,
+    }
+
+def compare(results, baseline, tolerance):
+    # Returns a message for each stage that got slower than the baseline by
+    # more than tolerance (a fraction).
+    regressions = []
+    for stage, result in sorted(results['stages'].items()):
+        old = baseline.get('stages', {}).get(stage)
+        if not old or not old.get('instructions_per_second') or not result['instructions_per_second']:
+            continue
+        ratio = result['instructions_per_second'] / old['instructions_per_second']
+        if ratio < 1 - tolerance:
+            regressions.append("{0}: {1:.0f} instructions/s, baseline {2:.0f} ({3:+.1%})".format(
+                stage, result['instructions_per_second'], old['instructions_per_second'], ratio - 1))
+    return regressions
+
+def add_generator_args(parser):
+    parser.add_argument('--files', type=int, default=10, help="number of files to generate")
+    parser.add_argument('--size', type=int, default=65536, help="approximate size of each file in bytes")
+    parser.add_argument('--objects', type=int, default=4, help="number of objects in each file")
+    parser.add_argument('--mix', choices=sorted(MIXES), default='typical', help="opcode mix")
+    parser.add_argument('--seed', type=int, default=0, help="random seed")
+
+def generate_corpus(args):
+    generator = CorpusGenerator(args.size, args.objects, args.mix, args.seed)
+    return [("{0:04d}.rbf".format(i), generator.program()) for i in range(args.files)]
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark lmsdisasm.py.")
+    subparsers = parser.add_subparsers(dest='command')
+    subparsers.required = True
+
+    generate_parser = subparsers.add_parser('generate', help="write a synthetic corpus of .rbf files")
+    generate_parser.add_argument('output_dir', help="directory for the .rbf files")
+    add_generator_args(generate_parser)
+
+    run_parser = subparsers.add_parser('run', help="benchmark the decoder and the output")
+    run_parser.add_argument('input', nargs='*', help=".rbf files or directories, "
+                            "a corpus is generated in memory if omitted")
+    add_generator_args(run_parser)
+    run_parser.add_argument('--repeat', type=int, default=5, help="runs per file, the best one counts")
+    run_parser.add_argument('-o', '--output', help="write the JSON results to this file instead of stdout")
+    run_parser.add_argument('--baseline', help="JSON results of an earlier run to compare with")
+    run_parser.add_argument('--tolerance', type=float, default=0.1,
+                            help="fraction of slowdown against the baseline that is allowed")
+    args = parser.parse_args()
+
+    if args.command == 'generate':
+        if not os.path.isdir(args.output_dir):
+            os.makedirs(args.output_dir)
+        for name, data in generate_corpus(args):
+            with open(os.path.join(args.output_dir, name), 'wb') as f:
+                f.write(data)
+        return
+
+    if args.input:
+        corpus = []
+        for path in find_inputs(args.input):
+            with open(path, 'rb') as f:
+                corpus.append((path, f.read()))
+    else:
+        corpus = generate_corpus(args)
+
+    results = run(corpus, args.repeat)
+    if not args.input:
+        results['generator'] = {'files': args.files, 'size': args.size, 'objects': args.objects,
+                                'mix': args.mix, 'seed': args.seed}
+    text = json.dumps(results, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        for message in regressions:
+            print("regression: " + message, file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -23,227 +23,1529 @@
 # SOFTWARE.
 
 from __future__ import print_function
-import argparse
+import array
+import bisect
+import collections
+import io
 import os
+import re
+import struct
 import sys
-from ctypes import *
+import time
+from enum import Enum
 
+# Modules that are only needed by the command line, batch mode, the cache
+# and the profiler are imported by the functions that use them, so that
+# importing the decoder stays fast (see lms2012.IMPORT_TIME_BUDGET).
+
+import lms2012
 from lms2012 import *
+import lms2012_tables
+from lms2012_tables import *
+
+_program_header = struct.Struct('<4siHhi')
+_object_header = struct.Struct('<iHhi')
+_data8 = struct.Struct('<b')
+_data16 = struct.Struct('<h')
+_data32 = struct.Struct('<i')
+_dataf = struct.Struct('<f')
+_int_formats = (None, _data8, _data16, None, _data32)
+_object_key_header = struct.Struct('<hHhi')
+
+_label_offset = re.compile(r'^(OFFSET\d+_\d+: // global offset: )(\d+)$', re.MULTILINE)
+
+_OBJECT_END = Op.OBJECT_END.value
+_JR = OP_TABLE[Op.JR.value]
+_RETURN = OP_TABLE[Op.RETURN.value]
+# opcodes whose first parameter is an object id
+_object_ops = frozenset(OP_TABLE[op.value] for op in (Op.CALL, Op.OBJECT_START, Op.OBJECT_STOP,
+                                                      Op.OBJECT_TRIG, Op.OBJECT_WAIT))
+# PROGRAM_INFO subcodes whose parameters are a program slot and an object id
+_program_info = OP_TABLE[Op.PROGRAM_INFO.value]
+_object_subcodes = frozenset(SUBCODE_TABLES[PROGRAM_SUBP - SUBPARAM_BASE][subcode]
+                             for subcode in (0x00, 0x04)) # OBJ_STOP, OBJ_START
+# slots that are the program itself, see lms2012.Slot
+_program_slots = (1, -1) # USER_SLOT, CURRENT_SLOT
+
+_float_names = {
+    DATAF_MAX: "DATAF_MAX",
+    DATAF_MIN: "DATAF_MIN",
+    DATAF_NAN: "DATAF_NAN",
+}
+
+class OperandKind(Enum):
+    CONST    = 0 # integer constant
+    FLOAT    = 1 # float constant
+    NAME     = 2 # named float constant, e.g. DATAF_NAN
+    STRING   = 3 # string constant
+    LABEL    = 4 # label number
+    VARIABLE = 5 # local or global variable, value is the address
+    HANDLE   = 6 # local or global variable used as a handle
+    SUBCODE  = 7 # value is the SubcodeInfo of the subcode
+    OBJECT   = 8 # object id of a CALL
+    OFFSET   = 9 # jump target, relative to the start of the object
+
+class Scope(Enum):
+    LOCAL  = 0
+    GLOBAL = 1
+
+# Decoded parameter. `width` is the number of bytes that followed the first
+# byte of the encoded parameter (0 for short encodings and strings) and
+# `scope` is only set for variables.
+class Operand(object):
+    __slots__ = ('kind', 'width', 'value', 'scope')
+
+    def __init__(self, kind, width, value, scope=None):
+        self.kind = kind
+        self.width = width
+        self.value = value
+        self.scope = scope
+
+    def __repr__(self):
+        return "Operand({0}, {1}, {2!r}, {3})".format(self.kind, self.width, self.value, self.scope)
 
-def parse_program_header(infile, size):
-    header = ProgramHeader()
-    infile.readinto(header)
+# strings in .rbf files are single bytes, so this keeps them intact
+ENCODING = 'latin-1'
+
+# Cursor over the bytes of a whole .rbf file. The file is read (or mapped)
+# once and decoding works on offsets into a memoryview instead of reading
+# from a file object one byte at a time. `buffer` is the object the view is
+# on, which is also searched for the end of strings.
+class Reader(object):
+    def __init__(self, data, pos=0):
+        if not hasattr(data, 'find'):
+            data = bytes(data)
+        self.buffer = data
+        self.data = memoryview(data)
+        self.pos = pos
+
+    def byte(self):
+        value = self.data[self.pos]
+        self.pos += 1
+        return value
+
+    def unpack(self, fmt):
+        value = fmt.unpack_from(self.data, self.pos)
+        self.pos += fmt.size
+        return value
+
+    def value(self, fmt):
+        value = fmt.unpack_from(self.data, self.pos)[0]
+        self.pos += fmt.size
+        return value
+
+    def string(self):
+        # Returns the zero terminated string at the current position.
+        end = self.buffer.find(b'\0', self.pos)
+        if end < 0:
+            raise ValueError("Unterminated string")
+        value = str(self.data[self.pos:end], ENCODING)
+        self.pos = end + 1
+        return value
+
+# Error for a file that can't be decoded. `offset` is the file offset of the
+# header or instruction that is wrong. Every problem with the contents of a
+# file is reported as a DecodeError, never as some other exception.
+class DecodeError(ValueError):
+    def __init__(self, offset, message):
+        ValueError.__init__(self, "offset {0}: {1}".format(offset, message))
+        self.offset = offset
+        self.message = message
+
+def load(path):
+    import mmap
+    with open(path, 'rb') as f:
+        try:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # empty files can't be mapped
+            return f.read()
+
+def parse_program_header(reader, size):
+    header = ProgramHeader(*reader.unpack(_program_header))
     if header.lego != b'LEGO':
         raise ValueError("Bad file - does not start with 'LEGO'")
     if header.size != size:
         raise ValueError("Bad file - size is incorrect")
     return header.byte_code_version, header.num_objects, header.global_bytes
 
-def parse_object_header(infile):
-    header = ObjectHeader()
-    infile.readinto(header)
-    return header
+def parse_object_headers(reader, num_objs):
+    # The whole table is unpacked at once.
+    end = reader.pos + max(num_objs, 0) * _object_header.size
+    if end > len(reader.data):
+        raise ValueError("Bad file - object headers are truncated")
+    table = reader.data[reader.pos:end]
+    reader.pos = end
+    return [ObjectHeader(*fields) for fields in _object_header.iter_unpack(table)]
+
+# Object types of ObjectTable.type and their names
+OBJECT_VMTHREAD = 0
+OBJECT_SUBCALL  = 1
+OBJECT_BLOCK    = 2
+OBJECT_UNKNOWN  = 3
+OBJECT_TYPES = ('vmthread', 'subcall', 'block', 'unknown')
+
+# NumPy is optional. It is only imported by read_object_table() because it
+# takes longer to import than the whole disassembler.
+_numpy = None
+
+def import_numpy():
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy
+            _numpy = numpy
+        except ImportError:
+            _numpy = False
+    return _numpy or None
+
+# Object header table of a program, see read_object_table(). `offset`,
+# `owner`, `trigger_count`, `local_bytes` and `type` (an index into
+# OBJECT_TYPES) are columns with one value per object: NumPy arrays if NumPy
+# is used, otherwise tuples. `total_local_bytes` is the sum of `local_bytes`.
+class ObjectTable(object):
+    __slots__ = ('version', 'global_bytes', 'offset', 'owner', 'trigger_count', 'local_bytes',
+                 'type', 'total_local_bytes')
+
+    def __len__(self):
+        return len(self.type)
+
+    def type_counts(self):
+        # Returns the number of objects of each type, by name.
+        if isinstance(self.type, tuple):
+            counts = [self.type.count(i) for i in range(len(OBJECT_TYPES))]
+        else:
+            counts = import_numpy().bincount(self.type, minlength=len(OBJECT_TYPES))
+        return dict((name, int(count)) for name, count in zip(OBJECT_TYPES, counts))
+
+def read_object_table(data, size=None, use_numpy=True):
+    # Reads the program header and the object header table in one go,
+    # without decoding any code. data only needs to contain the headers if
+    # the size of the whole file is given. The objects are classified with
+    # the same rules as ObjectHeader.is_vmthread, is_subcall and is_block.
+    # Raises DecodeError.
+    if size is None:
+        size = len(data)
+    reader = Reader(data)
+    try:
+        version, num_objs, global_bytes = parse_program_header(reader, size)
+    except struct.error:
+        raise DecodeError(reader.pos, "file is too short")
+    except ValueError as e:
+        raise DecodeError(0, str(e))
+    num_objs = max(num_objs, 0)
+    if len(data) < reader.pos + num_objs * _object_header.size:
+        raise DecodeError(reader.pos, "Bad file - object headers are truncated")
+    table = ObjectTable()
+    table.version = version
+    table.global_bytes = global_bytes
+    numpy = use_numpy and import_numpy()
+    if numpy:
+        rows = numpy.frombuffer(reader.buffer, _object_header_dtype(numpy), num_objs, reader.pos)
+        table.offset = rows['offset']
+        table.owner = owner = rows['owner']
+        table.trigger_count = trigger_count = rows['trigger_count']
+        table.local_bytes = rows['local_bytes']
+        type = numpy.full(num_objs, OBJECT_UNKNOWN, numpy.int8)
+        type[(owner == 0) & (trigger_count == 0)] = OBJECT_VMTHREAD
+        type[(owner == 0) & (trigger_count == 1)] = OBJECT_SUBCALL
+        type[owner != 0] = OBJECT_BLOCK
+        table.type = type
+        total_local_bytes = int(table.local_bytes.sum(dtype=numpy.int64))
+    else:
+        end = reader.pos + num_objs * _object_header.size
+        rows = list(_object_header.iter_unpack(reader.data[reader.pos:end]))
+        columns = tuple(zip(*rows)) or ((), (), (), ())
+        table.offset, table.owner, table.trigger_count, table.local_bytes = columns
+        table.type = tuple(_object_type(owner, trigger_count)
+                           for offset, owner, trigger_count, local_bytes in rows)
+        total_local_bytes = sum(table.local_bytes)
+    # local_bytes is a 32 bit field, a total that doesn't fit in one is corrupt
+    if not -2**31 <= total_local_bytes < 2**31:
+        raise DecodeError(_program_header.size,
+                          "local variables of all objects need {0} bytes".format(total_local_bytes))
+    table.total_local_bytes = total_local_bytes
+    return table
+
+def _object_type(owner, trigger_count):
+    if owner != 0:
+        return OBJECT_BLOCK
+    if trigger_count == 0:
+        return OBJECT_VMTHREAD
+    if trigger_count == 1:
+        return OBJECT_SUBCALL
+    return OBJECT_UNKNOWN
+
+def _object_header_dtype(numpy):
+    # same layout as _object_header and ObjectHeader
+    return numpy.dtype([('offset', '<i4'), ('owner', '<u2'), ('trigger_count', '<i2'),
+                        ('local_bytes', '<i4')])
+
+# Decoding state of one object
+class Context(object):
+    def __init__(self, id, start, signatures=None):
+        self.id = id
+        self.start = start
+        # parameter types of each subcall, by object id
+        self.signatures = signatures or {}
+        self.local_scope = 'LOCAL{0}_'.format(id)
+        # variable addresses referenced by the code
+        self.local_refs = set()
+        self.global_refs = set()
+        # object relative offsets of jump targets
+        self.targets = set()
+        # file offset of OBJECT_END
+        self.end = None
+
+def format_declarations(scope, start, end, refs):
+    # Declares the bytes from start to end as as few variables as possible.
+    # A new variable only starts where the code references an address, so
+    # that every reference still has a name.
+    bounds = sorted(r for r in refs if start < r < end)
+    lines = []
+    for first, last in zip([start] + bounds, bounds + [end]):
+        if last - first == 1:
+            lines.append("DATA8 {0}{1}".format(scope, first))
+        else:
+            lines.append("ARRAY8 {0}{1} {2}".format(scope, first, last - first))
+    return lines
+
+# Decoded instruction. `offset` is the file offset of the opcode and `op` is
+# its OpInfo from lms2012_tables.OP_TABLE.
+class Instruction(object):
+    __slots__ = ('offset', 'op', 'operands')
+
+    def __init__(self, offset, op, operands):
+        self.offset = offset
+        self.op = op
+        self.operands = operands
+
+    def __repr__(self):
+        return "Instruction({0}, {1}, {2!r})".format(self.offset, self.op.name, self.operands)
+
+# Object of a program. `params` is the list of (CallparamInfo, string size)
+# tuples of a subcall. The code is only decoded when iterating
+# instructions().
+class Object(object):
+    __slots__ = ('id', 'header', 'type', 'params', 'arg_bytes', 'code_offset', 'data',
+                 'signatures')
+
+    def __init__(self, id, header, type, params, arg_bytes, code_offset, data):
+        self.id = id
+        self.header = header
+        self.type = type
+        self.params = params
+        self.arg_bytes = arg_bytes
+        self.code_offset = code_offset
+        self.data = data
+        # parameter types of all subcalls of the program, by object id
+        self.signatures = {}
+
+    def new_context(self):
+        return Context(self.id, self.header.offset, self.signatures)
 
-def parse_object(infile, outfile, id):
-    header = parse_object_header(infile)
-    save_position = infile.tell()
-    infile.seek(header.offset)
-    num_args = 0
+    def control_flow_graph(self, context=None):
+        if context is None:
+            context = self.new_context()
+        return build_cfg(list(self.instructions(context)), context)
+
+    def instructions(self, context=None):
+        if context is None:
+            context = self.new_context()
+        reader = Reader(self.data, self.code_offset)
+        while True:
+            offset = reader.pos
+            try:
+                instruction = parse_ops(reader, context)
+            except (IndexError, struct.error):
+                raise DecodeError(offset, "object doesn't end with OBJECT_END")
+            except DecodeError:
+                raise
+            except ValueError as e:
+                raise DecodeError(offset, str(e))
+            if not instruction:
+                break
+            yield instruction
+
+# Basic block of an object. `start` and `end` are the object relative offsets
+# of its first instruction and of the instruction after its last one. The
+# last block of an object is at OBJECT_END and has no instructions; RETURN
+# and jumps to the end of the object lead to it.
+class BasicBlock(object):
+    __slots__ = ('index', 'start', 'end', 'instructions', 'successors', 'predecessors',
+                 'fall_through')
+
+    def __init__(self, index, start):
+        self.index = index
+        self.start = start
+        self.end = start
+        self.instructions = []
+        self.successors = []
+        self.predecessors = []
+        # block that runs next when the last instruction doesn't jump, None
+        # after JR and RETURN
+        self.fall_through = None
+
+    def __repr__(self):
+        return "BasicBlock({0}, {1}, {2})".format(self.index, self.start, self.end)
+
+# Basic blocks of an object in the order of their offsets. `block_index` has
+# the index of the block of every object relative offset, or -1 for the
+# parameters of a subcall, which are before the code.
+class ControlFlowGraph(object):
+    __slots__ = ('blocks', 'block_index')
+
+    def __init__(self, blocks, block_index):
+        self.blocks = blocks
+        self.block_index = block_index
+
+    def block_at(self, offset):
+        # Returns the block containing the object relative offset, or None if
+        # it is not in the code.
+        index = self.block_index[offset]
+        if index < 0:
+            return None
+        return self.blocks[index]
+
+def build_cfg(code, context):
+    # Splits instructions decoded with context into basic blocks in a single
+    # pass. Blocks start at the jump targets that parse_ops() collected and
+    # after jumps and RETURN. Jumps with a variable offset have no target.
+    start = context.start
+    size = context.end - start + 1
+    targets = context.targets
+    blocks = []
+    # (block, target, file offset of the jump) for each jump or RETURN
+    edges = []
+    block = None
+    ends_block = True
+    falls_through = False
+    for instruction in code:
+        offset = instruction.offset - start
+        if ends_block or offset in targets:
+            next_block = BasicBlock(len(blocks), offset)
+            if block is not None:
+                block.end = offset
+                if falls_through:
+                    block.fall_through = next_block
+            blocks.append(next_block)
+            block = next_block
+        block.instructions.append(instruction)
+        op = instruction.op
+        ends_block = op.is_jump or op is _RETURN
+        falls_through = op is not _JR and op is not _RETURN
+        if op.is_jump:
+            operand = instruction.operands[-1]
+            if operand.kind is OperandKind.OFFSET:
+                edges.append((block, operand.value, instruction.offset))
+        elif op is _RETURN:
+            edges.append((block, size - 1, instruction.offset))
+    end_block = BasicBlock(len(blocks), size - 1)
+    if block is not None:
+        block.end = size - 1
+        if falls_through:
+            block.fall_through = end_block
+    blocks.append(end_block)
+
+    block_index = array.array('i', [-1]) * size
+    for block in blocks:
+        if block.end > block.start:
+            block_index[block.start:block.end] = array.array('i', [block.index]) * (block.end - block.start)
+    block_index[size - 1] = end_block.index
+
+    for block in blocks:
+        if block.fall_through is not None:
+            block.successors.append(block.fall_through)
+    for block, target, offset in edges:
+        if not 0 <= target < size or block_index[target] < 0 \
+                or blocks[block_index[target]].start != target:
+            raise DecodeError(offset, "jump to {0} is not an instruction of the object".format(target))
+        target_block = blocks[block_index[target]]
+        if target_block not in block.successors:
+            block.successors.append(target_block)
+    for block in blocks:
+        for successor in block.successors:
+            successor.predecessors.append(block)
+    return ControlFlowGraph(blocks, block_index)
+
+# References between the objects of a program by CALL, OBJECT_START,
+# OBJECT_STOP, OBJECT_TRIG, OBJECT_WAIT and PROGRAM_INFO(OBJ_START|OBJ_STOP).
+# `refs` has the (instruction, index of the object id operand) pairs of each
+# object that references an object, which is also the number of parameters
+# encoded before the id. `callees` and `callers` have the ids of the objects
+# it references and that reference it. `dynamic` has the ids of the objects
+# that reference an object by a variable and `ends` the file offset of the
+# OBJECT_END of each object. All are keyed by object id.
+class CallGraph(object):
+    __slots__ = ('program', 'refs', 'callees', 'callers', 'dynamic', 'ends')
+
+    def __init__(self, program, refs, callees, callers, dynamic, ends):
+        self.program = program
+        self.refs = refs
+        self.callees = callees
+        self.callers = callers
+        self.dynamic = dynamic
+        self.ends = ends
+
+    def reachable(self, roots=None):
+        # Returns the ids of the objects that can run when the program
+        # starts the roots, which are all vmthreads by default. A block runs
+        # with the local variables of its owner, so the owner is needed too.
+        # Any object could be referenced by a variable, so then all are.
+        objects = self.program.objects
+        if roots is None:
+            roots = [obj.id for obj in objects if obj.type == "vmthread"]
+        found = set()
+        todo = list(roots)
+        while todo:
+            id = todo.pop()
+            if id in found or not 1 <= id <= len(objects):
+                continue
+            if id in self.dynamic:
+                return set(obj.id for obj in objects)
+            found.add(id)
+            todo.extend(self.callees[id])
+            if objects[id-1].header.is_block:
+                todo.append(objects[id-1].header.owner)
+        return found
+
+def call_graph(program):
+    # Decodes every object of program and returns its CallGraph.
+    refs = {}
+    callees = {}
+    callers = dict((obj.id, set()) for obj in program.objects)
+    dynamic = set()
+    ends = {}
+    for obj in program.objects:
+        context = obj.new_context()
+        obj_refs = []
+        for instruction in obj.instructions(context):
+            if instruction.op in _object_ops:
+                obj_refs.append((instruction, 0))
+            elif instruction.op is _program_info and instruction.operands[0].value in _object_subcodes:
+                slot = instruction.operands[1]
+                if slot.kind is OperandKind.CONST and slot.value in _program_slots:
+                    obj_refs.append((instruction, 2))
+                else:
+                    # an object of some other program
+                    dynamic.add(obj.id)
+        ids = set()
+        for instruction, index in obj_refs:
+            operand = instruction.operands[index]
+            if operand.kind is OperandKind.OBJECT or operand.kind is OperandKind.CONST:
+                ids.add(operand.value)
+                if operand.value in callers:
+                    callers[operand.value].add(obj.id)
+            else:
+                dynamic.add(obj.id)
+        refs[obj.id] = obj_refs
+        callees[obj.id] = ids
+        ends[obj.id] = context.end
+    return CallGraph(program, refs, callees, callers, dynamic, ends)
+
+class Program(object):
+    __slots__ = ('version', 'global_bytes', 'objects', 'signatures')
+
+    def __init__(self, version, global_bytes, objects, signatures):
+        self.version = version
+        self.global_bytes = global_bytes
+        self.objects = objects
+        self.signatures = signatures
+
+def disassemble(data):
+    # Decodes the headers of a whole .rbf file. The code of each object is
+    # decoded lazily by Object.instructions(). Raises DecodeError.
+    reader = Reader(data)
+    size = len(reader.buffer)
+    try:
+        version, num_objs, global_bytes = parse_program_header(reader, size)
+        headers = parse_object_headers(reader, num_objs)
+    except struct.error:
+        raise DecodeError(reader.pos, "file is too short")
+    except ValueError as e:
+        raise DecodeError(0, str(e))
+    if global_bytes < 0:
+        raise DecodeError(0, "global_bytes is {0}".format(global_bytes))
+    headers_end = reader.pos
+    objects = []
+    for i, header in enumerate(headers):
+        if not headers_end <= header.offset < size:
+            raise DecodeError(_program_header.size + i * _object_header.size,
+                              "object {0} starts outside of the file".format(i+1))
+        try:
+            obj = parse_object_info(reader, i+1, header)
+        except IndexError:
+            raise DecodeError(header.offset, "subcall parameters are truncated")
+        except ValueError as e:
+            raise DecodeError(header.offset, str(e))
+        # the parameters of a subcall are its first local variables
+        if header.local_bytes < obj.arg_bytes:
+            raise DecodeError(_program_header.size + i * _object_header.size,
+                              "object {0} has {1} bytes of local variables, less than its {2} "
+                              "bytes of parameters".format(i+1, header.local_bytes, obj.arg_bytes))
+        objects.append(obj)
+    # First pass: index the subcall signatures so that the parameters of
+    # CALL instructions can be decoded with their real types.
+    signatures = {}
+    for obj in objects:
+        if obj.type == "subcall":
+            signatures[obj.id] = tuple(param.param for param, string_size in obj.params)
+    for obj in objects:
+        obj.signatures = signatures
+    return Program(version, global_bytes, objects, signatures)
+
+def parse_object_info(reader, id, header):
+    reader.pos = header.offset
+    params = []
     arg_bytes = 0
     if header.is_vmthread:
         type = "vmthread"
     elif header.is_subcall:
         type = "subcall"
-        num_args = ord(infile.read(1))
+        num_args = reader.byte()
+        for i in range(num_args):
+            code = reader.byte()
+            param = CALLPARAM_TABLE[code]
+            if param is None:
+                raise ValueError("Unknown subcall parameter type 0x{0:02X}".format(code))
+            string_size = 0
+            if param.param == PARS:
+                string_size = reader.byte()
+            params.append((param, string_size))
+            arg_bytes += string_size or param.size
     elif header.is_block:
         type = "block"
     else:
         raise ValueError("Unknown object type")
-    print("{0} OBJECT{1}".format(type, id), file=outfile)
-    print("{", file=outfile)
-    if num_args:
-        for i in range(num_args):
-            type = Callparam(ord(infile.read(1)))
-            format = type.data_format
-            string_size = 0
-            if format is DataFormat.DATAS:
-                string_size = ord(infile.read(1))
+    return Object(id, header, type, params, arg_bytes, reader.pos, reader.buffer)
+
+def format_object(obj):
+    # Returns the text of the whole object and the set of global variable
+    # addresses it references.
+    context = obj.new_context()
+    return format_code(obj, context, list(obj.instructions(context)))
+
+def format_code(obj, context, code):
+    # Same as format_object() for instructions that were already decoded
+    # with context. Lines are collected in a list so that each object can be
+    # written to the output with a single call.
+    id = obj.id
+    start = obj.header.offset
+    lines = []
+    if obj.type == "block":
+        # not part of the .lms syntax, but lmsasm.py reads it back
+        lines.append("block OBJECT{0} // owner: OBJECT{1}, trigger count: {2}".format(
+            id, obj.header.owner, obj.header.trigger_count))
+    else:
+        lines.append("{0} OBJECT{1}".format(obj.type, id))
+    lines.append("{")
+    if obj.params:
+        arg_bytes = 0
+        for param, string_size in obj.params:
             string_size_str = ''
             if string_size:
                 string_size_str = " {0}".format(string_size)
-            print("\t{0} LOCAL{1}_{2}{3}".format(type.name, id, arg_bytes, string_size_str), file=outfile)
-            arg_bytes += string_size or format.size
-
-        print(file=outfile)
-    if header.local_bytes - arg_bytes:
-        for i in range(arg_bytes, header.local_bytes):
-            print("\tDATA8 LOCAL{0}_{1}".format(id, i), file=outfile)
-        print(file=outfile)
-    while True:
-        offset = infile.tell()
-        line = parse_ops(infile, header.offset, id)
-        print("OFFSET{0}_{1}: // global offset: {2}".format(id, offset - header.offset, offset), file=outfile)
-        # this test if after print to make sure final offset is printed at end of object
-        if not line:
-            break
-        print("\t", line, sep='', file=outfile)
-    print("}", file=outfile)
-    infile.seek(save_position)
+            lines.append("\t{0} LOCAL{1}_{2}{3}".format(param.name, id, arg_bytes, string_size_str))
+            arg_bytes += string_size or param.size
+        lines.append("")
+    if obj.header.local_bytes - obj.arg_bytes:
+        for line in format_declarations(context.local_scope, obj.arg_bytes,
+                                        obj.header.local_bytes, context.local_refs):
+            lines.append("\t" + line)
+        lines.append("")
+    # labels are only needed where something jumps to
+    targets = context.targets
+    for instruction in code:
+        if instruction.offset - start in targets:
+            lines.append(format_label(context, instruction.offset))
+        lines.append("\t" + format_instruction(instruction, context))
+    # a jump to the end of the object still needs a label
+    if context.end - start in targets:
+        lines.append(format_label(context, context.end))
+    lines.append("}")
+    lines.append("")
+    return "\n".join(lines), context.global_refs
+
+def format_label(context, offset):
+    return "OFFSET{0}_{1}: // global offset: {2}".format(context.id, offset - context.start, offset)
 
-def parse_ops(infile, start, id):
-    op = Op(ord(infile.read(1)))
-    if op == Op.OBJECT_END:
+def parse_ops(reader, context):
+    # Returns an Instruction or None at the end of the object.
+    offset = reader.pos
+    code = reader.byte()
+    op = OP_TABLE[code]
+    if op is None:
+        raise ValueError("Unknown opcode 0x{0:02X}".format(code))
+    if code == _OBJECT_END:
+        context.end = offset
         return None
-    params = []
-    for param in op.params:
-        if isinstance(param, Subparam):
-            value = parse_param(param, infile, id)
-            params.append(parse_subparam(param, value, infile, id))
-        else:
-            params.append(parse_param(param, infile, id))
-        # special handling for CALL
-        if op.name == "CALL" and param is Param.PAR16:
-            params[-1] = "OBJECT{0}".format(params[-1])
-        # special handling for varargs
-        if param is Param.PARNO:
-            value = int(params[-1])
-            del params[-1]
-            for i in range(value):
-                params.append(parse_param(Param.PARV, infile, id))
+    operands = []
+    # special handling for CALL
+    if op.is_call:
+        parse_call(reader, context, operands)
+    else:
+        parse_params(op.params, reader, context, operands, False)
     # special handling for jump ops
-    if op.name[:2] == "JR":
-        offset = int(params[-1])
-        del params[-1]
-        params.append("OFFSET{0}_{1}".format(id, infile.tell() - start + offset))
-    return "{0}({1})".format(op.name, ",".join(params))
-
-def parse_param(param, infile, id):
-    first_byte = ord(infile.read(1))
-    if first_byte & PRIMPAR_LONG:
-        if first_byte & PRIMPAR_VARIABLE:
-            if first_byte & PRIMPAR_GLOBAL:
-                scope = 'GLOBAL'
-            else:
-                scope = 'LOCAL{0}_'.format(id)
-            size = first_byte & PRIMPAR_BYTES
-            if size == PRIMPAR_1_BYTE:
-                data = Data8()
-            elif size == PRIMPAR_2_BYTES:
-                data = Data16()
-            elif size == PRIMPAR_4_BYTES:
-                data = Data32()
-            infile.readinto(data)
-            handle = ''
-            if first_byte & PRIMPAR_HANDLE:
-                handle = '@'
-            elif first_byte & PRIMPAR_ADDR:
-                raise NotImplementedError()
-            return "{0}{1}{2}".format(handle,scope,data.value)
-        else: # PRIMPAR_CONST
-            if first_byte & PRIMPAR_LABEL:
-                return "LABEL{0}".format(ord(infile.read(1)))
-            size = first_byte & PRIMPAR_BYTES
-
-            # Hack to try to guess when CALL opcode has float parameters.
-            # We can't lookup the real parameter type since this is just a
-            # single pass disassembler.
-            if param is Param.PARV and size == PRIMPAR_4_BYTES:
-                param = Param.PARF
-
-            if param is Param.PARF:
-                if size != PRIMPAR_4_BYTES:
-                    raise ValueError("Expecting float value")
-                data = DataFloat()
-                infile.readinto(data)
-                int_value = c_int.from_buffer(data).value
-                if int_value == DATAF_MAX:
-                    return "DATAF_MAX"
-                if int_value == DATAF_MIN:
-                    return "DATAF_MIN"
-                if int_value == DATAF_NAN:
-                    return "DATAF_NAN"
-                return str(data.value) + "F"
-            if size == PRIMPAR_STRING_OLD or size == PRIMPAR_STRING:
-                return parse_string(infile)
-            elif size == PRIMPAR_1_BYTE:
-                data = Data8()
-            elif size == PRIMPAR_2_BYTES:
-                data = Data16()
-            elif size == PRIMPAR_4_BYTES:
-                data = Data32()
-            infile.readinto(data)
-            return str(data.value)
-    else:  # PRIMPAR_SHORT
-        if first_byte & PRIMPAR_VARIABLE:
-            if first_byte & PRIMPAR_GLOBAL:
-                scope = 'GLOBAL'
-            else:
-                scope = 'LOCAL{0}_'.format(id)
-            return "{0}{1}".format(scope, first_byte & PRIMPAR_INDEX)
-        else:
-            if first_byte & PRIMPAR_CONST_SIGN:
-                # special handling for negative numbers
-                return str((first_byte & PRIMPAR_VALUE) - (PRIMPAR_VALUE + 1))
-            return str(first_byte & PRIMPAR_VALUE)
+    if op.is_jump:
+        operand = operands[-1]
+        if operand.kind is OperandKind.CONST:
+            operand.kind = OperandKind.OFFSET
+            operand.value += reader.pos - context.start
+            context.targets.add(operand.value)
+    return Instruction(offset, op, operands)
 
-    raise NotImpementedError("TODO")
+def parse_call(reader, context, operands):
+    operand = parse_param(PAR16, reader, context)
+    operands.append(operand)
+    count = parse_count(reader, context)
+    params = None
+    if operand.kind is OperandKind.CONST:
+        operand.kind = OperandKind.OBJECT
+        params = context.signatures.get(operand.value)
+    if params is None or len(params) != count:
+        # unknown subcall, see parse_param()
+        for i in range(count):
+            operands.append(parse_param(PARV, reader, context))
+        return
+    for param in params:
+        param = call_param(param, reader.data[reader.pos])
+        operands.append(parse_param(param, reader, context))
 
-def parse_subparam(type, value, infile, id):
-    subcode_type = type.subcode_type(int(value))
-    params = [ subcode_type.name ]
+def call_param(param, first_byte):
+    # Returns the type to decode a CALL argument of type param with. Float
+    # arguments can be encoded as short integer constants, which are then
+    # decoded like the arguments of an unknown subcall.
+    if param == PARF:
+        info = PRIMPAR_TABLE[first_byte]
+        if info.kind == PRIMPAR_KIND_CONST and info.width != 4:
+            return PARV
+    return param
+
+def parse_count(reader, context):
+    operand = parse_param(PARNO, reader, context)
+    if operand.kind is not OperandKind.CONST:
+        raise ValueError("Expecting constant parameter count")
+    return operand.value
+
+def parse_params(params, reader, context, operands, keep_count):
     values = -1
-    for param in subcode_type.params:
+    for param in params:
         # special handling for arrays
-        if param is Param.PARVALUES:
-            values = int(params[-1])
-            # print("PARVALUES = ", values)
+        if param == PARVALUES:
+            if operands[-1].kind is not OperandKind.CONST:
+                raise ValueError("Expecting constant array size")
+            values = operands[-1].value
         elif values >= 0:
-            while values > 0:
-                values -= 1
-                params.append(parse_param(param, infile, id))
+            for i in range(values):
+                operands.append(parse_param(param, reader, context))
+            values = -1
+        elif param >= SUBPARAM_BASE:
+            parse_subparam(param, parse_param(param, reader, context), reader, context, operands)
         else:
-            params.append(parse_param(param, infile, id))
+            operand = parse_param(param, reader, context)
             # special handling for varargs
-            if param is Param.PARNO:
-                if not int(params[-1]):
-                    del params[-1]
-                else:
-                    for i in range(int(params[-1])):
-                        params.append(parse_param(Param.PARV, infile, id))
-    return ",".join(params)
+            if param == PARNO:
+                if operand.kind is not OperandKind.CONST:
+                    raise ValueError("Expecting constant parameter count")
+                count = operand.value
+                if keep_count and count:
+                    operands.append(operand)
+                for i in range(count):
+                    operands.append(parse_param(PARV, reader, context))
+            else:
+                operands.append(operand)
+
+def parse_param(param, reader, context):
+    first_byte = reader.byte()
+    info = PRIMPAR_TABLE[first_byte]
+    kind = info.kind
+    if kind == PRIMPAR_KIND_CONST:
+        if not info.width:
+            return Operand(OperandKind.CONST, 0, info.value)
+
+        # Hack to try to guess when CALL opcode has float parameters.
+        # This is only used when the signature of the called object is
+        # not known.
+        if param == PARV and info.width == 4:
+            param = PARF
+
+        if param == PARF:
+            if info.width != 4:
+                raise ValueError("Expecting float value")
+            int_value = _data32.unpack_from(reader.data, reader.pos)[0]
+            value = reader.value(_dataf)
+            if int_value in _float_names:
+                return Operand(OperandKind.NAME, 4, _float_names[int_value])
+            return Operand(OperandKind.FLOAT, 4, value)
+        return Operand(OperandKind.CONST, info.width, reader.value(_int_formats[info.width]))
+    if kind == PRIMPAR_KIND_VARIABLE:
+        if info.width:
+            value = reader.value(_int_formats[info.width])
+        else:
+            value = info.value
+        if info.is_global:
+            scope = Scope.GLOBAL
+            context.global_refs.add(value)
+        else:
+            scope = Scope.LOCAL
+            context.local_refs.add(value)
+        if info.is_handle:
+            return Operand(OperandKind.HANDLE, info.width, value, scope)
+        return Operand(OperandKind.VARIABLE, info.width, value, scope)
+    if kind == PRIMPAR_KIND_STRING:
+        return Operand(OperandKind.STRING, 0, parse_string(reader))
+    if kind == PRIMPAR_KIND_LABEL:
+        return Operand(OperandKind.LABEL, 1, reader.byte())
+    if kind == PRIMPAR_KIND_ADDR:
+        raise ValueError("Address parameters are not supported")
+    raise ValueError("Bad parameter encoding 0x{0:02X}".format(first_byte))
+
+def parse_subparam(type, operand, reader, context, operands):
+    if operand.kind is not OperandKind.CONST:
+        raise ValueError("Expecting constant subcode")
+    subcodes = SUBCODE_TABLES[type - SUBPARAM_BASE]
+    subcode = operand.value
+    if not 0 <= subcode < len(subcodes) or subcodes[subcode] is None:
+        raise ValueError("Unknown subcode {0}".format(subcode))
+    operand.kind = OperandKind.SUBCODE
+    operand.value = subcodes[subcode]
+    operands.append(operand)
+    parse_params(operand.value.params, reader, context, operands, True)
 
-def parse_string(infile):
-    value = ''
+def parse_string(reader):
+    return reader.string()
+
+# Problem found by check_program(). `offset` is the file offset of the
+# instruction, parameter or header that is wrong.
+class CheckError(DecodeError):
+    pass
+
+def check_program(data):
+    # Checks that data is a structurally valid program without decoding it:
+    # the headers, that every object ends with OBJECT_END, that all opcodes,
+    # parameter encodings and subcodes are known and that jumps land on an
+    # instruction of their object. Raises CheckError for the first problem.
+    data = Reader(data).buffer
+    try:
+        program = disassemble(data)
+    except DecodeError as e:
+        raise CheckError(e.offset, e.message)
+    for obj in program.objects:
+        check_code(data, obj.code_offset, obj.header.offset, len(program.objects),
+                   program.signatures)
+
+def check_code(data, pos, start, num_objs, signatures):
+    # Walks the code of one object, see check_program().
+    size = len(data)
+    # object relative offsets of the instructions and of the jumps' targets
+    offsets = set()
+    jumps = []
     while True:
-        ch = infile.read(1)
-        if not ord(ch):
+        if pos >= size:
+            raise CheckError(pos, "object doesn't end with OBJECT_END")
+        offset = pos
+        code = data[pos]
+        op = OP_TABLE[code]
+        if op is None:
+            raise CheckError(offset, "unknown opcode 0x{0:02X}".format(code))
+        if code == _OBJECT_END:
             break
-        value += ch
+        offsets.add(offset - start)
+        if op.is_call:
+            pos = check_call(data, pos + 1, offset, num_objs, signatures)
+            value = None
+        else:
+            pos, value = check_params(data, pos + 1, op.params)
+        if op.is_jump and value is not None:
+            jumps.append((offset, pos - start + value))
+    offsets.add(offset - start)
+    for offset, target in jumps:
+        if target not in offsets:
+            raise CheckError(offset, "jump to {0} is not an instruction of the object".format(target))
+
+def check_call(data, pos, offset, num_objs, signatures):
+    # Returns the position after the parameters of the CALL at offset, whose
+    # arguments are typed like in parse_call().
+    pos, id = check_param(data, pos, PAR16)
+    if id is not None and not 1 <= id <= num_objs:
+        raise CheckError(offset, "CALL of unknown object {0}".format(id))
+    count_pos = pos
+    pos, count = check_param(data, pos, PARNO)
+    if count is None:
+        raise CheckError(count_pos, "expecting constant parameter count")
+    params = signatures.get(id)
+    if params is None or len(params) != count:
+        for i in range(count):
+            pos = check_param(data, pos, PARV)[0]
+        return pos
+    for param in params:
+        if pos < len(data):
+            param = call_param(param, data[pos])
+        pos = check_param(data, pos, param)[0]
+    return pos
+
+def check_params(data, pos, params):
+    # Returns the position after params and the value of the last one, see
+    # parse_params().
+    values = -1
+    value = None
+    for param in params:
+        if param == PARVALUES:
+            if value is None:
+                raise CheckError(pos, "expecting constant array size")
+            values = value
+        elif values >= 0:
+            for i in range(values):
+                pos, value = check_param(data, pos, param)
+            values = -1
+        elif param >= SUBPARAM_BASE:
+            subcode_pos = pos
+            pos, value = check_param(data, pos, param)
+            if value is None:
+                raise CheckError(subcode_pos, "expecting constant subcode")
+            subcodes = SUBCODE_TABLES[param - SUBPARAM_BASE]
+            if not 0 <= value < len(subcodes) or subcodes[value] is None:
+                raise CheckError(subcode_pos, "unknown subcode {0}".format(value))
+            pos, value = check_params(data, pos, subcodes[value].params)
+        else:
+            count_pos = pos
+            pos, value = check_param(data, pos, param)
+            if param == PARNO:
+                if value is None:
+                    raise CheckError(count_pos, "expecting constant parameter count")
+                for i in range(value):
+                    pos, value = check_param(data, pos, PARV)
+    return pos, value
+
+def check_param(data, pos, param):
+    # Returns the position after the parameter at pos and its value if it
+    # is an integer constant, otherwise None.
+    if pos >= len(data):
+        raise CheckError(pos, "unexpected end of file")
+    first_byte = data[pos]
+    info = PRIMPAR_TABLE[first_byte]
+    kind = info.kind
+    end = pos + 1 + info.width
+    if end > len(data):
+        raise CheckError(pos, "unexpected end of file")
+    if kind == PRIMPAR_KIND_CONST:
+        if not info.width:
+            return end, info.value
+        if param == PARF:
+            if info.width != 4:
+                raise CheckError(pos, "expecting float value")
+            return end, None
+        return end, _int_formats[info.width].unpack_from(data, pos + 1)[0]
+    if kind == PRIMPAR_KIND_VARIABLE or kind == PRIMPAR_KIND_LABEL:
+        return end, None
+    if kind == PRIMPAR_KIND_STRING:
+        end = data.find(b'\0', pos + 1)
+        if end < 0:
+            raise CheckError(pos, "unterminated string")
+        return end + 1, None
+    if kind == PRIMPAR_KIND_ADDR:
+        raise CheckError(pos, "address parameters are not supported")
+    raise CheckError(pos, "bad parameter encoding 0x{0:02X}".format(first_byte))
+
+def format_string(value):
+    # str.replace() runs in C, so four passes are much faster than escaping
+    # character by character in one pass.
     value = value.replace("\t", "\\t")
     value = value.replace("\r", "\\r")
     value = value.replace("\n", "\\n")
     value = value.replace("'", "\\q")
     return "'{0}'".format(value)
 
+def format_operand(operand, context):
+    kind = operand.kind
+    if kind is OperandKind.CONST:
+        return str(operand.value)
+    if kind is OperandKind.VARIABLE or kind is OperandKind.HANDLE:
+        if operand.scope is Scope.GLOBAL:
+            scope = 'GLOBAL'
+        else:
+            scope = context.local_scope
+        if kind is OperandKind.HANDLE:
+            return "@{0}{1}".format(scope, operand.value)
+        return "{0}{1}".format(scope, operand.value)
+    if kind is OperandKind.FLOAT:
+        return str(operand.value) + "F"
+    if kind is OperandKind.STRING:
+        return format_string(operand.value)
+    if kind is OperandKind.SUBCODE:
+        return operand.value.name
+    if kind is OperandKind.OFFSET:
+        return "OFFSET{0}_{1}".format(context.id, operand.value)
+    if kind is OperandKind.OBJECT:
+        return "OBJECT{0}".format(operand.value)
+    if kind is OperandKind.LABEL:
+        return "LABEL{0}".format(operand.value)
+    return operand.value # OperandKind.NAME
+
+def format_instruction(instruction, context):
+    operands = ",".join(format_operand(o, context) for o in instruction.operands)
+    return "{0}({1})".format(instruction.op.name, operands)
+
+# Reader used by the worker processes of disassemble_objects()
+_object_program = None
+
+def init_object_worker(data):
+    global _object_program
+    _object_program = disassemble(data)
+
+def run_object_job(id):
+    return format_object(_object_program.objects[id-1])
+
+def disassemble_objects(data, ids, num_workers):
+    # Objects are independent of each other, so they can be decoded in
+    # separate processes. Results are yielded in the order of ids.
+    import concurrent.futures
+    chunksize = max(1, len(ids) // (num_workers * 4))
+    with concurrent.futures.ProcessPoolExecutor(num_workers, initializer=init_object_worker,
+                                                initargs=(bytes(data),)) as executor:
+        for result in executor.map(run_object_job, ids, chunksize=chunksize):
+            yield result
+
+def format_program(data, object_jobs=None, cache=None):
+    # Returns the text of the disassembly as a list of chunks, except for
+    # the first line, which contains the file name.
+    program = disassemble(data)
+    objects = [None] * len(program.objects)
+    keys = None
+    if cache is not None:
+        # only objects that changed since they were last cached are decoded
+        keys = cache.object_keys(data, program)
+        for obj in program.objects:
+            objects[obj.id-1] = cache.get_object(keys[obj.id-1], obj.header.offset)
+    todo = [obj for obj in program.objects if objects[obj.id-1] is None]
+    if object_jobs and object_jobs > 1 and len(todo) > 1:
+        results = disassemble_objects(data, [obj.id for obj in todo], object_jobs)
+    else:
+        results = (format_object(obj) for obj in todo)
+    for obj, result in zip(todo, results):
+        objects[obj.id-1] = result
+        if keys is not None:
+            cache.put_object(keys[obj.id-1], obj.header.offset, result)
+    # globals can only be declared once the code referencing them is known
+    global_refs = set()
+    for text, refs in objects:
+        global_refs.update(refs)
+    lines = [
+        "//",
+        "// Byte code version: {0}".format(program.version),
+        "",
+    ]
+    if program.global_bytes:
+        lines.extend(format_declarations('GLOBAL', 0, program.global_bytes, global_refs))
+    lines.append("")
+    chunks = ["\n".join(lines)]
+    for text, refs in objects:
+        chunks.append("\n" + text)
+    return chunks
+
+def write_lms(data, name, outfile, object_jobs=None, cache=None):
+    outfile.write("// Disassembly of {0}\n".format(name))
+    if cache is None:
+        chunks = format_program(data, object_jobs)
+    else:
+        key = cache.key(data)
+        text = cache.get(key)
+        if text is None:
+            text = "".join(format_program(data, object_jobs, cache))
+            cache.put(key, text)
+        chunks = [text]
+    for chunk in chunks:
+        outfile.write(chunk)
+
+# On-disk cache of disassembled programs, keyed by a hash of the .rbf bytes
+# and of the disassembler itself. The text of each object is cached too, so
+# that only the objects that changed are decoded when a program is rebuilt.
+# Least recently used entries are removed by trim() once the cache grows
+# bigger than max_size bytes.
+class Cache(object):
+    def __init__(self, path, max_size):
+        import hashlib
+        self.path = path
+        self.max_size = max_size
+        salt = hashlib.sha256()
+        for module in (lms2012, lms2012_tables, sys.modules[__name__]):
+            with open(module.__file__, 'rb') as source:
+                salt.update(source.read())
+        self.salt = salt.digest()
+
+    def key(self, data):
+        import hashlib
+        key = hashlib.sha256(self.salt)
+        key.update(data)
+        return key.hexdigest()
+
+    def entry_path(self, key):
+        return os.path.join(self.path, key[:2], key + '.lms')
+
+    def get(self, key):
+        path = self.entry_path(key)
+        try:
+            with io.open(path, 'r', encoding=ENCODING, newline='') as entry:
+                text = entry.read()
+        except (IOError, OSError):
+            return None
+        # the modification time is used as the last access time
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+        return text
+
+    def object_keys(self, data, program):
+        # The code of an object ends before the next object (or at the end
+        # of the file). Its text also depends on its header and on the
+        # signatures of the subcalls it may call.
+        import hashlib
+        starts = sorted(set(obj.header.offset for obj in program.objects))
+        starts.append(len(data))
+        signatures = repr(sorted(program.signatures.items()))
+        keys = []
+        for obj in program.objects:
+            header = obj.header
+            end = starts[bisect.bisect_right(starts, header.offset)]
+            key = hashlib.sha256(self.salt)
+            key.update(_object_key_header.pack(obj.id, header.owner, header.trigger_count,
+                                               header.local_bytes))
+            key.update(signatures.encode(ENCODING))
+            key.update(data[header.offset:end])
+            keys.append(key.hexdigest())
+        return keys
+
+    def get_object(self, key, offset):
+        # Returns the (text, global references) of format_object() or None.
+        import json
+        entry = self.get(key)
+        if entry is None:
+            return None
+        info, text = entry.split("\n", 1)
+        cached_offset, refs = json.loads(info)
+        # labels contain the file offset, which changes when objects before
+        # this one change size
+        if offset != cached_offset:
+            delta = offset - cached_offset
+            text = _label_offset.sub(lambda m: m.group(1) + str(int(m.group(2)) + delta), text)
+        return text, set(refs)
+
+    def put_object(self, key, offset, result):
+        import json
+        text, refs = result
+        self.put(key, json.dumps([offset, sorted(refs)]) + "\n" + text)
+
+    def put(self, key, text):
+        import tempfile
+        path = self.entry_path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # write to a temporary file first so that other processes never see
+        # a partial entry
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+        try:
+            with io.open(fd, 'w', encoding=ENCODING, newline='') as entry:
+                entry.write(text)
+            os.replace(temp_path, path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+
+    def trim(self):
+        entries = []
+        total = 0
+        for dirpath, dirnames, filenames in os.walk(self.path):
+            for filename in filenames:
+                path = os.path.join(dirpath, filename)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+                total += stat.st_size
+        entries.sort()
+        for mtime, size, path in entries:
+            if total <= self.max_size:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            total -= size
+
+def find_batch_jobs(inputs, output_dir=None):
+    # Returns a list of (source, archive member, output path) tuples for
+    # every .rbf file found in the given files, directories, glob patterns
+    # and .zip archives. The output path is None for archive members whose
+    # names would put the output outside of the output directory. Files that
+    # are found more than once only get one job.
+    import glob
+    import zipfile
+    jobs = []
+    found = set()
+    def add(source, member, relpath, base_dir):
+        key = (os.path.realpath(source), member)
+        if key in found:
+            return
+        found.add(key)
+        if relpath is None:
+            jobs.append((source, member, None))
+            return
+        relpath = os.path.splitext(relpath)[0] + '.lms'
+        jobs.append((source, member, os.path.join(output_dir or base_dir, relpath)))
+    for pattern in inputs:
+        paths = sorted(glob.glob(pattern)) or [pattern]
+        for path in paths:
+            if os.path.isdir(path):
+                for dirpath, dirnames, filenames in os.walk(path):
+                    dirnames.sort()
+                    for filename in sorted(filenames):
+                        if filename.lower().endswith('.rbf'):
+                            source = os.path.join(dirpath, filename)
+                            add(source, None, os.path.relpath(source, path), path)
+            elif zipfile.is_zipfile(path):
+                stem = os.path.splitext(os.path.basename(path))[0]
+                with zipfile.ZipFile(path) as archive:
+                    for member in sorted(archive.namelist()):
+                        if member.lower().endswith('.rbf'):
+                            parts = member_path(member)
+                            if parts is not None:
+                                parts = os.path.join(stem, *parts)
+                            add(path, member, parts, os.path.dirname(path))
+            else:
+                add(path, None, os.path.basename(path), os.path.dirname(path))
+    return jobs
+
+def duplicate_outputs(jobs):
+    # Returns a message for each output path that more than one job would
+    # write to, e.g. for x.rbf in two input directories.
+    sources = collections.OrderedDict()
+    for source, member, output in jobs:
+        if output is not None:
+            name = source if member is None else "{0}/{1}".format(source, member)
+            sources.setdefault(os.path.normcase(os.path.abspath(output)), []).append((output, name))
+    messages = []
+    for names in sources.values():
+        if len(names) > 1:
+            messages.append("{0}: would be written for each of {1}".format(
+                names[0][0], ", ".join(name for output, name in names)))
+    return messages
+
+def member_path(member):
+    # Returns the parts of the path of an archive member, or None if it is
+    # absolute or goes up with "..", like "../../evil.rbf".
+    name = member.replace('\\', '/')
+    parts = [part for part in name.split('/') if part not in ('', '.')]
+    if name.startswith('/') or not parts or '..' in parts or ':' in parts[0]:
+        return None
+    return parts
+
+# ZipFile objects kept open by each batch worker process
+_archives = {}
+
+# Cache used by each batch worker process
+_batch_cache = None
+
+def init_batch_worker(cache):
+    global _batch_cache
+    _batch_cache = cache
+
+def read_batch_input(source, member):
+    import zipfile
+    if member is None:
+        with open(source, 'rb') as infile:
+            return infile.read()
+    if source not in _archives:
+        _archives[source] = zipfile.ZipFile(source)
+    return _archives[source].read(member)
+
+def run_batch_job(job):
+    # Disassembles one file of a batch. Returns None on success or an error
+    # message so that one bad file does not abort the whole batch.
+    source, member, output = job
+    name = source if member is None else "{0}/{1}".format(source, member)
+    try:
+        if output is None:
+            raise ValueError("unsafe archive member name")
+        data = read_batch_input(source, member)
+        text = io.StringIO()
+        write_lms(data, name, text, cache=_batch_cache)
+        output_dir = os.path.dirname(output)
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+        with io.open(output, 'w', encoding=ENCODING) as outfile:
+            outfile.write(text.getvalue())
+    except Exception as e:
+        return "{0}: {1}".format(name, e)
+    return None
+
+def run_check_job(job):
+    # Checks one file of a batch, see check_program(). Returns None if it is
+    # valid or an error message.
+    source, member, output = job
+    name = source if member is None else "{0}/{1}".format(source, member)
+    try:
+        data = read_batch_input(source, member)
+        check_program(data)
+    except Exception as e:
+        return "{0}: {1}".format(name, e)
+    return None
+
+def read_headers_input(source, member):
+    # Reads only the headers of a batch input, see read_object_table().
+    # Returns them and the size of the whole file.
+    if member is not None:
+        data = read_batch_input(source, member)
+        return data, len(data)
+    with open(source, 'rb') as infile:
+        size = os.fstat(infile.fileno()).st_size
+        data = infile.read(_program_header.size)
+        if len(data) == _program_header.size:
+            num_objs = _program_header.unpack(data)[3]
+            data += infile.read(max(num_objs, 0) * _object_header.size)
+    return data, size
+
+def write_headers(jobs, outfile):
+    # Writes header level statistics of each file as a line of JSON.
+    # Returns the number of files that failed.
+    import json
+    failed = 0
+    for source, member, output in jobs:
+        name = source if member is None else "{0}/{1}".format(source, member)
+        try:
+            table = read_object_table(*read_headers_input(source, member))
+        except Exception as e:
+            failed += 1
+            print("{0}: {1}".format(name, e), file=sys.stderr)
+            continue
+        stats = {
+            'file': name,
+            'version': table.version,
+            'global_bytes': table.global_bytes,
+            'objects': len(table),
+            'local_bytes': table.total_local_bytes,
+        }
+        stats.update(table.type_counts())
+        outfile.write(json.dumps(stats, sort_keys=True) + "\n")
+    return failed
+
+def report_batch(errors):
+    failed = 0
+    for error in errors:
+        if error:
+            failed += 1
+            print(error, file=sys.stderr)
+    return failed
+
+def run_batch(jobs, num_workers=None, cache=None, run_job=run_batch_job):
+    import concurrent.futures
+    num_workers = num_workers or os.cpu_count() or 1
+    if num_workers == 1 or len(jobs) < 2:
+        init_batch_worker(cache)
+        return report_batch(map(run_job, jobs))
+    chunksize = max(1, min(64, len(jobs) // (num_workers * 4)))
+    with concurrent.futures.ProcessPoolExecutor(num_workers, initializer=init_batch_worker,
+                                                initargs=(cache,)) as executor:
+        return report_batch(executor.map(run_job, jobs, chunksize=chunksize))
+
+# Phases of the disassembler measured by --profile and the functions that
+# belong to each of them
+_profile_phases = (
+    ('headers', ('parse_program_header', 'parse_object_headers', 'parse_object_info')),
+    ('opcodes', ('parse_ops',)),
+    ('operands', ('parse_call', 'parse_params', 'parse_param')),
+    ('subcodes', ('parse_subparam',)),
+    ('strings', ('parse_string',)),
+    ('output', ('format_code', 'format_declarations')),
+)
+
+# Collects the time spent in each phase and counts of the decoded opcodes,
+# parameter types and subcodes. The functions of the phases are replaced by
+# wrappers while the profiler is active (`with Profiler() as profiler:`), so
+# there is no cost when it isn't used. The time of a phase doesn't include
+# the time of the phases it calls.
+class Profiler(object):
+    def __init__(self):
+        self.times = collections.OrderedDict((phase, 0.0) for phase, names in _profile_phases)
+        self.total = 0.0
+        # opcode name -> [count, time including operands]
+        self.ops = collections.defaultdict(lambda: [0, 0.0])
+        self.params = collections.Counter()
+        self.subcodes = collections.Counter()
+        self._nested = 0.0
+        self._originals = {}
+        self._start = None
+
+    def __enter__(self):
+        module = globals()
+        hooks = {
+            'parse_ops': self._count_op,
+            'parse_param': self._count_param,
+            'parse_subparam': self._count_subcode,
+        }
+        for phase, names in _profile_phases:
+            for name in names:
+                self._originals[name] = module[name]
+                module[name] = self._wrap(phase, module[name], hooks.get(name))
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.total += time.perf_counter() - self._start
+        globals().update(self._originals)
+        self._originals = {}
+
+    def _wrap(self, phase, func, hook):
+        def wrapper(*args):
+            outer = self._nested
+            self._nested = 0.0
+            start = time.perf_counter()
+            try:
+                result = func(*args)
+            finally:
+                elapsed = time.perf_counter() - start
+                self.times[phase] += elapsed - self._nested
+                self._nested = outer + elapsed
+            if hook:
+                hook(args, result, elapsed)
+            return result
+        return wrapper
+
+    def _count_op(self, args, instruction, elapsed):
+        name = instruction.op.name if instruction else 'OBJECT_END'
+        entry = self.ops[name]
+        entry[0] += 1
+        entry[1] += elapsed
+
+    def _count_param(self, args, operand, elapsed):
+        param = args[0]
+        if param >= SUBPARAM_BASE:
+            self.params[Subparam(param - SUBPARAM_BASE).name] += 1
+        else:
+            self.params[Param(param).name] += 1
+
+    def _count_subcode(self, args, result, elapsed):
+        type, operand = args[0], args[1]
+        self.subcodes["{0}.{1}".format(Subparam(type - SUBPARAM_BASE).name, operand.value.name)] += 1
+
+    def report(self, outfile):
+        print("{0:<24} {1:>10} {2:>6}".format("phase", "seconds", "%"), file=outfile)
+        other = self.total - sum(self.times.values())
+        for phase, seconds in list(self.times.items()) + [('other', other)]:
+            print("{0:<24} {1:>10.4f} {2:>6.1f}".format(phase, seconds,
+                  100.0 * seconds / self.total if self.total else 0), file=outfile)
+        print("{0:<24} {1:>10.4f}".format("total", self.total), file=outfile)
+        print("", file=outfile)
+        print("{0:<24} {1:>10} {2:>10}".format("opcode", "count", "seconds"), file=outfile)
+        for name, (count, seconds) in sorted(self.ops.items(), key=lambda item: -item[1][1]):
+            print("{0:<24} {1:>10} {2:>10.4f}".format(name, count, seconds), file=outfile)
+        for title, counter in (("parameter", self.params), ("subcode", self.subcodes)):
+            print("", file=outfile)
+            print("{0:<24} {1:>10}".format(title, "count"), file=outfile)
+            for name, count in counter.most_common():
+                print("{0:<24} {1:>10}".format(name, count), file=outfile)
+
 def main():
+    import argparse
     parser = argparse.ArgumentParser(description='Disassemble lms2012 byte codes.')
-    parser.add_argument('input', type=argparse.FileType('rb', 0),
-                       help='The .rbf file to disassemble.')
-    parser.add_argument('-o', '--output', type=argparse.FileType('wb', 0), default='-',
+    parser.add_argument('input', nargs='+',
+                       help='The .rbf file to disassemble. Multiple files, directories, '
+                            'glob patterns and .zip archives are disassembled in batch mode.')
+    parser.add_argument('-o', '--output',
                        help='The .lms file that will contain the result.')
+    parser.add_argument('-d', '--output-dir',
+                       help='Batch mode: directory for the .lms files. By default, each '
+                            '.lms file is written next to its .rbf file.')
+    parser.add_argument('-j', '--jobs', type=int,
+                       help='Batch mode: number of worker processes (default: number of CPUs).')
+    parser.add_argument('--object-jobs', type=int,
+                       help='Decode the objects of a single file in this many worker processes '
+                            '(not in batch mode, use --jobs there).')
+    parser.add_argument('--cache-dir',
+                       help='Directory for caching disassembled programs between runs.')
+    parser.add_argument('--cache-size', type=int, default=100,
+                       help='Maximum size of the cache in MiB (default: 100).')
+    parser.add_argument('--check', action='store_true',
+                       help='Only check that the inputs are valid programs, without writing '
+                            '.lms files. Problems are reported with their file offset.')
+    parser.add_argument('--headers', action='store_true',
+                       help='Only read the headers of the inputs and write a line of JSON '
+                            'with the object counts and sizes of each file.')
+    parser.add_argument('--profile', action='store_true',
+                       help='Print the time spent in each phase and counts of the decoded '
+                            'opcodes, parameters and subcodes to stderr. Everything runs in '
+                            'this process and the cache is not used.')
     args = parser.parse_args()
+    if args.output and not args.headers and (args.check or is_batch(args)):
+        parser.error("--output can only be used with a single input file without --jobs, "
+                     "--output-dir or --check")
+    if args.object_jobs and (args.check or args.headers or is_batch(args)):
+        parser.error("--object-jobs can only be used with a single input file without --jobs, "
+                     "--output-dir, --check or --headers")
+
+    if args.profile:
+        args.cache_dir = None
+        args.object_jobs = None
+        with Profiler() as profiler:
+            failed = run(args)
+        profiler.report(sys.stderr)
+    else:
+        failed = run(args)
+    if failed:
+        sys.exit(1)
+
+def is_batch(args):
+    # Whether the command line disassembles in batch mode instead of writing
+    # a single file to --output or stdout.
+    import zipfile
+    return not (len(args.input) == 1 and os.path.isfile(args.input[0])
+                and not zipfile.is_zipfile(args.input[0])
+                and args.output_dir is None and args.jobs is None)
+
+def run(args):
+    # Disassembles the inputs given on the command line. Returns the number
+    # of files that failed.
+    import atexit
+    if args.check:
+        jobs = find_batch_jobs(args.input, None)
+        failed = run_batch(jobs, 1 if args.profile else args.jobs, run_job=run_check_job)
+        print("Checked {0} files, {1} failed".format(len(jobs), failed), file=sys.stderr)
+        return failed
+
+    if args.headers:
+        jobs = find_batch_jobs(args.input, None)
+        if args.output is None or args.output == '-':
+            return write_headers(jobs, sys.stdout)
+        with io.open(args.output, 'w', encoding=ENCODING) as outfile:
+            return write_headers(jobs, outfile)
+
+    cache = None
+    if args.cache_dir:
+        cache = Cache(args.cache_dir, args.cache_size * 1024 * 1024)
+        atexit.register(cache.trim)
+
+    if not is_batch(args):
+        data = load(args.input[0])
+        if args.output is None or args.output == '-':
+            outfile = io.TextIOWrapper(sys.stdout.buffer, encoding=ENCODING)
+        else:
+            outfile = io.open(args.output, 'w', encoding=ENCODING)
+        with outfile:
+            write_lms(data, args.input[0], outfile, args.object_jobs, cache)
+        return 0
 
-    file_size = os.path.getsize(args.input.name)
-    version, num_objs, global_bytes = parse_program_header(args.input, file_size)
-    print("// Disassembly of", args.input.name, file=args.output)
-    print("//", file=args.output)
-    print("// Byte code version:", version, file=args.output)
-    print(file=args.output)
-    for i in range(global_bytes):
-        print("DATA8 GLOBAL", i, sep='', file=args.output)
-    for i in range(num_objs):
-        print(file=args.output)
-        parse_object(args.input, args.output, i+1)
+    jobs = find_batch_jobs(args.input, args.output_dir)
+    duplicates = duplicate_outputs(jobs)
+    if duplicates:
+        # nothing is written, the outputs would overwrite each other
+        for message in duplicates:
+            print(message, file=sys.stderr)
+        print("Disassembled 0 of {0} files, use inputs with different names or "
+              "separate runs".format(len(jobs)), file=sys.stderr)
+        return len(jobs)
+    failed = run_batch(jobs, 1 if args.profile else args.jobs, cache)
+    print("Disassembled {0} of {1} files".format(len(jobs) - failed, len(jobs)), file=sys.stderr)
+    return failed
 
 if __name__ == '__main__':
     main()
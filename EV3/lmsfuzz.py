@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+
+# The MIT License (MIT)
+
+# Copyright (c) 2026 lms-hacker-tools contributors
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Fuzzer for the decoder of lmsdisasm.py. Seed programs are generated from
+# the opcode and subcode tables by lmsbench.CorpusGenerator, so that most
+# inputs get past the headers, and are then mutated. Each input is
+# disassembled, checked and split into basic blocks in a pool of worker
+# processes:
+#
+#     python lmsfuzz.py --seconds 60 --jobs 8 --crashes crashes/
+#
+# Any exception other than lmsdisasm.DecodeError is a crash. Crashes are
+# deduplicated by the type of the exception and the functions and lines of
+# its stack, so that each bug is reported once.
+
+from __future__ import print_function
+import argparse
+import concurrent.futures
+import hashlib
+import os
+import random
+import struct
+import sys
+import time
+import traceback
+
+from lms2012 import *
+import lmsbench
+import lmsdisasm
+
+# Bytes that are more likely to hit an edge case than random ones: ends of
+# the integer ranges, OBJECT_END and the prefixes of the parameter encodings.
+_interesting_bytes = (0x00, 0x01, 0x1F, 0x20, 0x3F, 0x40, 0x7F, 0x80, 0x81, 0x82, 0x83, 0x84,
+                      0xC0, 0xC1, 0xC2, 0xC3, 0xE0, 0xFF, Op.OBJECT_END.value)
+
+_interesting_ints = (0, 1, -1, 0x7F, 0x80, 0xFF, 0x7FFF, -0x8000, 0x7FFFFFFF, -0x80000000)
+
+def flip_bit(rand, data, seeds):
+    pos = rand.randrange(len(data))
+    data[pos] ^= 1 << rand.randrange(8)
+
+def set_byte(rand, data, seeds):
+    data[rand.randrange(len(data))] = rand.choice(_interesting_bytes)
+
+def random_byte(rand, data, seeds):
+    data[rand.randrange(len(data))] = rand.randrange(256)
+
+def set_int(rand, data, seeds):
+    pos = rand.randrange(len(data))
+    value = struct.pack('<i', rand.choice(_interesting_ints))[:rand.choice((1, 2, 4))]
+    data[pos:pos+len(value)] = value
+
+def insert_bytes(rand, data, seeds):
+    pos = rand.randrange(len(data) + 1)
+    data[pos:pos] = bytes(rand.choice(_interesting_bytes) for i in range(rand.randint(1, 8)))
+
+def delete_bytes(rand, data, seeds):
+    pos = rand.randrange(len(data))
+    del data[pos:pos+rand.randint(1, 8)]
+
+def copy_chunk(rand, data, seeds):
+    # copies a chunk of another seed, e.g. a few instructions
+    other = rand.choice(seeds)
+    start = rand.randrange(len(other))
+    chunk = other[start:start+rand.randint(1, 32)]
+    pos = rand.randrange(len(data) + 1)
+    data[pos:pos+rand.randint(0, len(chunk))] = chunk
+
+MUTATIONS = (flip_bit, set_byte, random_byte, set_int, insert_bytes, delete_bytes, copy_chunk)
+
+class Fuzzer(object):
+    def __init__(self, seed=0, size=256, seeds=()):
+        self.random = random.Random(seed)
+        self.seeds = list(seeds)
+        for objects in (1, 2, 3):
+            generator = lmsbench.CorpusGenerator(size, objects, 'all', self.random.getrandbits(32))
+            self.seeds.extend(generator.program() for i in range(4))
+
+    def input(self):
+        rand = self.random
+        data = bytearray(rand.choice(self.seeds))
+        for i in range(rand.randint(1, 4)):
+            if not data:
+                break
+            rand.choice(MUTATIONS)(rand, data, self.seeds)
+        # Most of the time the size in the program header is fixed up, otherwise
+        # inserting or deleting bytes would only test that one check.
+        if len(data) >= 8 and rand.random() < 0.9:
+            struct.pack_into('<i', data, 4, len(data))
+        return bytes(data)
+
+def run_target(data):
+    # Returns None if data was decoded or rejected with a DecodeError,
+    # otherwise the exception.
+    try:
+        lmsdisasm.format_program(data)
+        lmsdisasm.check_program(data)
+        for obj in lmsdisasm.disassemble(data).objects:
+            obj.control_flow_graph()
+    except lmsdisasm.DecodeError:
+        pass
+    except Exception as e:
+        return e
+    return None
+
+def crash_signature(exception):
+    # type of the exception and the stack below run_target()
+    frames = traceback.extract_tb(exception.__traceback__)[1:]
+    stack = " < ".join("{0}:{1}:{2}".format(os.path.basename(frame.filename), frame.name,
+                                            frame.lineno) for frame in reversed(frames))
+    return "{0} at {1}".format(type(exception).__name__, stack)
+
+def fuzz(seed, runs, size=256, seeds=()):
+    # Runs the decoder on `runs` inputs. Returns the number of runs and a
+    # dict of crash signature to [count, message, smallest input].
+    fuzzer = Fuzzer(seed, size, seeds)
+    crashes = {}
+    for i in range(runs):
+        data = fuzzer.input()
+        exception = run_target(data)
+        if exception is None:
+            continue
+        signature = crash_signature(exception)
+        crash = crashes.get(signature)
+        if crash is None:
+            crashes[signature] = [1, str(exception), data]
+        else:
+            crash[0] += 1
+            if len(data) < len(crash[2]):
+                crash[2] = data
+    return runs, crashes
+
+def read_seeds(inputs):
+    # .rbf files to use as seeds in addition to the generated ones
+    seeds = []
+    for source, member, output in lmsdisasm.find_batch_jobs(inputs):
+        seeds.append(bytes(lmsdisasm.read_batch_input(source, member)))
+    return [data for data in seeds if data]
+
+def merge_crashes(crashes, results):
+    for signature, (count, message, data) in results.items():
+        crash = crashes.get(signature)
+        if crash is None:
+            crashes[signature] = [count, message, data]
+        else:
+            crash[0] += count
+            if len(data) < len(crash[2]):
+                crash[2] = data
+
+def run(seconds, runs, num_workers=None, batch=1000, size=256, seed=0, seeds=()):
+    # Fuzzes in batches of `batch` inputs until `runs` inputs were decoded or
+    # `seconds` passed. Every batch has its own seed, so a run can be
+    # repeated with the same --seed. Returns (runs, seconds, crashes).
+    crashes = {}
+    total = 0
+    start = time.time()
+    submitted = 0
+    next_seed = seed
+    num_workers = num_workers or os.cpu_count() or 1
+    with concurrent.futures.ProcessPoolExecutor(num_workers) as executor:
+        pending = set()
+        while True:
+            while len(pending) < num_workers * 2 and time.time() - start < seconds \
+                    and not (runs and submitted >= runs):
+                pending.add(executor.submit(fuzz, next_seed, batch, size, seeds))
+                submitted += batch
+                next_seed += 1
+            if not pending:
+                break
+            finished, pending = concurrent.futures.wait(
+                pending, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in finished:
+                count, results = future.result()
+                total += count
+                merge_crashes(crashes, results)
+    return total, time.time() - start, crashes
+
+def main():
+    parser = argparse.ArgumentParser(description="Fuzz the decoder of lmsdisasm.py.")
+    parser.add_argument('input', nargs='*',
+                        help=".rbf files, directories or .zip archives to use as extra seeds")
+    parser.add_argument('--seconds', type=float, default=60, help="how long to fuzz")
+    parser.add_argument('--runs', type=int, default=0,
+                        help="stop after this many inputs instead, rounded up to whole batches")
+    parser.add_argument('-j', '--jobs', type=int,
+                        help="number of worker processes (default: number of CPUs)")
+    parser.add_argument('--batch', type=int, default=1000, help="inputs per task of a worker")
+    parser.add_argument('--size', type=int, default=256, help="size of the generated seeds in bytes")
+    parser.add_argument('--seed', type=int, default=0, help="seed of the first batch")
+    parser.add_argument('--crashes', help="directory to write the smallest input of each crash to")
+    args = parser.parse_args()
+
+    seeds = read_seeds(args.input)
+    seconds = float('inf') if args.runs else args.seconds
+    total, elapsed, crashes = run(seconds, args.runs, args.jobs, args.batch, args.size,
+                                  args.seed, seeds)
+
+    if args.crashes and crashes and not os.path.isdir(args.crashes):
+        os.makedirs(args.crashes)
+    for signature, (count, message, data) in sorted(crashes.items()):
+        print("{0} x{1}: {2}".format(signature, count, message))
+        if args.crashes:
+            name = hashlib.sha1(signature.encode()).hexdigest()[:12] + '.rbf'
+            with open(os.path.join(args.crashes, name), 'wb') as f:
+                f.write(data)
+    print("{0} runs in {1:.1f} s ({2:.0f} runs/s), {3} unique crashes".format(
+        total, elapsed, total / elapsed if elapsed else 0, len(crashes)), file=sys.stderr)
+    if crashes:
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
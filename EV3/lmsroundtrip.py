@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+
+# The MIT License (MIT)
+
+# Copyright (c) 2026 lms-hacker-tools contributors
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Checks that disassembling is lossless: each .rbf file is disassembled,
+# assembled again with lmsasm.py and compared with the original, in a pool
+# of worker processes:
+#
+#     python lmsroundtrip.py programs/ archive.zip --jobs 8
+#
+# Files that differ are reported with the first offset that differs and the
+# instruction at that offset.
+
+from __future__ import print_function
+import argparse
+import sys
+from ctypes import sizeof
+
+from lms2012 import ProgramHeader, ObjectHeader
+import lmsasm
+import lmsdisasm
+
+def disassemble_text(data):
+    # text of the disassembly without the first line, which has the name
+    return "".join(lmsdisasm.format_program(data))
+
+def first_difference(a, b):
+    # Returns the first index at which the sequences a and b differ. Halves
+    # are compared with == so that the work is done by C code.
+    low = 0
+    high = min(len(a), len(b))
+    while low < high:
+        middle = (low + high) // 2
+        if a[low:middle+1] == b[low:middle+1]:
+            low = middle + 1
+        else:
+            high = middle
+    return low
+
+def describe_offset(data, offset):
+    # Returns what is at offset in the program, e.g. an instruction.
+    program = lmsdisasm.disassemble(data)
+    if offset < sizeof(ProgramHeader):
+        return "program header"
+    if offset < sizeof(ProgramHeader) + len(program.objects) * sizeof(ObjectHeader):
+        return "header of OBJECT{0}".format((offset - sizeof(ProgramHeader)) // sizeof(ObjectHeader) + 1)
+    found = None
+    for obj in program.objects:
+        if obj.header.offset <= offset and (found is None or obj.header.offset >= found.header.offset):
+            found = obj
+    if found is None:
+        return "before the first object"
+    if offset < found.code_offset:
+        return "parameters of OBJECT{0}".format(found.id)
+    context = found.new_context()
+    instruction = None
+    for next_instruction in found.instructions(context):
+        if next_instruction.offset > offset:
+            break
+        instruction = next_instruction
+    else:
+        if offset >= context.end:
+            return "OBJECT_END of OBJECT{0} at offset {1}".format(found.id, context.end)
+    return "OBJECT{0} {1} at offset {2}".format(found.id, instruction.op.name, instruction.offset)
+
+def compare_headers(data, result):
+    # Returns None if the programs have the same header fields, except for
+    # offsets and sizes, otherwise a message about the first difference.
+    program = lmsdisasm.disassemble(data)
+    again = lmsdisasm.disassemble(result)
+    if (program.version, program.global_bytes) != (again.version, again.global_bytes):
+        return "program header differs"
+    if len(program.objects) != len(again.objects):
+        return "number of objects differs"
+    for obj, other in zip(program.objects, again.objects):
+        fields = (obj.header.owner, obj.header.trigger_count, obj.header.local_bytes)
+        if fields != (other.header.owner, other.header.trigger_count, other.header.local_bytes):
+            return "header of OBJECT{0} differs".format(obj.id)
+    return None
+
+def check_round_trip(data, compare_text=False):
+    # Returns None if data is the same after disassembling and assembling
+    # it again, otherwise a message about the first difference.
+    text = disassemble_text(data)
+    result = lmsasm.assemble(text)
+    if compare_text:
+        message = compare_headers(data, result)
+        if message is not None:
+            return message
+        again = disassemble_text(result)
+        if again == text:
+            return None
+        line = text.count("\n", 0, first_difference(text, again))
+        return "disassembly differs at line {0}: {1}".format(line + 2, text.split("\n")[line].strip())
+    if result == data:
+        return None
+    offset = first_difference(data, result)
+    if offset >= len(data):
+        return "reassembled file is longer ({0} bytes instead of {1})".format(len(result), len(data))
+    return "differs at offset {0} ({1})".format(offset, describe_offset(data, offset))
+
+def run_job(job):
+    # Checks one file, see lmsdisasm.run_batch_job(). The last item of the
+    # job is the compare_text option.
+    source, member, compare_text = job
+    name = source if member is None else "{0}/{1}".format(source, member)
+    try:
+        message = check_round_trip(lmsdisasm.read_batch_input(source, member), compare_text)
+    except Exception as e:
+        message = str(e) or type(e).__name__
+    if message is None:
+        return None
+    return "{0}: {1}".format(name, message)
+
+def main():
+    parser = argparse.ArgumentParser(description='Check that .rbf files are the same after '
+                                                 'disassembling and assembling them again.')
+    parser.add_argument('input', nargs='+',
+                       help='.rbf files, directories, glob patterns and .zip archives.')
+    parser.add_argument('-j', '--jobs', type=int,
+                       help='Number of worker processes (default: number of CPUs).')
+    parser.add_argument('--text', action='store_true',
+                       help='Compare the disassembly of the files instead of their bytes, '
+                            'which ignores constants that were encoded with more bytes '
+                            'than needed.')
+    args = parser.parse_args()
+
+    jobs = [(source, member, args.text) for source, member, output
+            in lmsdisasm.find_batch_jobs(args.input)]
+    failed = lmsdisasm.run_batch(jobs, args.jobs, run_job=run_job)
+    print("{0} of {1} files are the same after a round trip".format(len(jobs) - failed, len(jobs)),
+          file=sys.stderr)
+    if failed:
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+
+# The MIT License (MIT)
+
+# Copyright (c) 2026 lms-hacker-tools contributors
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Removes the objects of a .rbf file that can never run. Objects reference
+# each other by CALL, OBJECT_START, OBJECT_STOP, OBJECT_TRIG, OBJECT_WAIT and
+# PROGRAM_INFO(OBJ_START|OBJ_STOP); every object that can't be reached from
+# the vmthreads is dropped and the object ids of the remaining ones are
+# patched in place:
+#
+#     python lmsstrip.py input.rbf -o output.rbf
+#
+# Without -o only the call graph and the unreachable objects are printed.
+
+from __future__ import print_function
+import argparse
+import sys
+from ctypes import sizeof
+
+from lms2012 import ProgramHeader, ObjectHeader
+from lms2012_tables import *
+import lmsdisasm
+
+def patch_const(data, pos, value):
+    # Replaces the constant encoded at pos with value, using the same number
+    # of bytes. Only works for values that fit, e.g. smaller object ids.
+    info = PRIMPAR_TABLE[data[pos]]
+    if not info.width:
+        data[pos] = (data[pos] & ~0x3F) | (value & 0x3F)
+    else:
+        lmsdisasm._int_formats[info.width].pack_into(data, pos + 1, value)
+
+def strip(data, roots=None):
+    # Returns the program without the objects that are not reachable from
+    # roots (see CallGraph.reachable()) and the ids of the removed objects.
+    program = lmsdisasm.disassemble(data)
+    graph = lmsdisasm.call_graph(program)
+    reachable = graph.reachable(roots)
+    removed = [obj.id for obj in program.objects if obj.id not in reachable]
+    if not removed:
+        return bytes(data), removed
+    new_ids = {}
+    for obj in program.objects:
+        if obj.id in reachable:
+            new_ids[obj.id] = len(new_ids) + 1
+    result = bytearray(sizeof(ProgramHeader) + len(new_ids) * sizeof(ObjectHeader))
+    headers = []
+    for obj in program.objects:
+        if obj.id not in reachable:
+            continue
+        start = obj.header.offset
+        offset = len(result)
+        result += data[start:graph.ends[obj.id] + 1]
+        for instruction, index in graph.refs[obj.id]:
+            id = instruction.operands[index].value
+            if id not in new_ids:
+                raise lmsdisasm.DecodeError(instruction.offset,
+                                            "reference to unknown object {0}".format(id))
+            # skip the opcode and the parameters before the object id
+            pos = instruction.offset + 1
+            for i in range(index):
+                pos = lmsdisasm.check_param(data, pos, PARV)[0]
+            patch_const(result, offset + pos - start, new_ids[id])
+        owner = obj.header.owner
+        if owner:
+            if owner not in new_ids:
+                raise lmsdisasm.DecodeError(start, "block of unknown object {0}".format(owner))
+            owner = new_ids[owner]
+        headers.append(ObjectHeader(offset, owner, obj.header.trigger_count, obj.header.local_bytes))
+    header = ProgramHeader.from_buffer_copy(data[:sizeof(ProgramHeader)])
+    header.size = len(result)
+    header.num_objects = len(headers)
+    headers.insert(0, header)
+    table = b''.join(bytes(header) for header in headers)
+    result[:len(table)] = table
+    return bytes(result), removed
+
+def format_graph(graph, reachable):
+    # Returns the lines of the call graph report.
+    lines = []
+    for obj in graph.program.objects:
+        callees = ", ".join("OBJECT{0}".format(id) for id in sorted(graph.callees[obj.id]))
+        if obj.id in graph.dynamic:
+            callees = ", ".join(c for c in (callees, "unknown objects") if c)
+        line = "OBJECT{0} {1}".format(obj.id, obj.type)
+        if callees:
+            line += " -> " + callees
+        if obj.id not in reachable:
+            line += " (unreachable, {0} bytes)".format(graph.ends[obj.id] + 1 - obj.header.offset)
+        lines.append(line)
+    return lines
+
+def main():
+    parser = argparse.ArgumentParser(description="Remove unreachable objects from a .rbf file.")
+    parser.add_argument('input', help="the .rbf file")
+    parser.add_argument('-o', '--output', help="write the reduced .rbf file here, "
+                        "otherwise only print the call graph")
+    parser.add_argument('--roots', type=int, nargs='+', metavar='ID',
+                        help="ids of the objects that are started, default: all vmthreads")
+    args = parser.parse_args()
+
+    try:
+        with open(args.input, 'rb') as f:
+            data = f.read()
+        graph = lmsdisasm.call_graph(lmsdisasm.disassemble(data))
+        reachable = graph.reachable(args.roots)
+        for line in format_graph(graph, reachable):
+            print(line)
+        if args.output:
+            result, removed = strip(data, args.roots)
+            with open(args.output, 'wb') as f:
+                f.write(result)
+    except (OSError, ValueError) as e:
+        # OSError names the input or the output file
+        print("{0}: {1}".format(getattr(e, 'filename', None) or args.input, e), file=sys.stderr)
+        sys.exit(1)
+    if args.output:
+        print("Removed {0} of {1} objects, {2} -> {3} bytes".format(
+            len(removed), len(graph.program.objects), len(data), len(result)), file=sys.stderr)
+    if graph.dynamic & reachable:
+        print("Objects are referenced by variables or in other program slots, so none of them "
+              "can be removed",
+              file=sys.stderr)
+
+if __name__ == '__main__':
+    main()